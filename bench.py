@@ -0,0 +1,565 @@
+# Benchmarks for the client, cache and rendering hot paths. Runs against an in-process
+# stub_server.StubServer (or a recorded snapshot with --replay) and writes a JSON report;
+# --compare fails the run when a result regressed against an earlier report.
+#
+#   python bench.py --headless --output bench_report.json
+#   python bench.py --headless --compare bench_report.json --threshold 0.25
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from fortnite_api import (
+    AES_WORKERS, CODEC_RAW, CODEC_ZLIB, CODEC_ZSTD, STAT_CATEGORIES, STAT_FIELDS, AesBatch, Cosmetic, DiskCache,
+    FortniteAPI, PlayerStats, RateLimiter, ResponseCache, SHOP_ARCHIVE_ROTATIONS, ShopArchive, ShopEntry, SnapshotArchive,
+    SnapshotDiff, StatsHistory, cache_expiry, cache_key, decode_entry, encode_entry, load_zstd, parse_response,
+    shop_entry_key,
+)
+from stub_server import StubData, StubServer
+
+CACHE_SIZES = [10, 100, 1000, 10000]
+LIMITER_THREADS = [1, 4, 16]
+RENDER_SIZES = [1000, 10000, 50000]
+FORMAT_SIZES = [1000, 20000]
+STREAM_SIZES = [1000, 20000]
+AES_SIZES_MB = [16, 128]
+TREND_SIZES = [1000, 20000]  # Lookups in the stats history, 5 modes each
+SHOP_SIZES = [100, 1000]  # Offers per shop rotation
+
+
+class Report:
+    def __init__(self):
+        self.results = []
+
+    def timings(self, name, params, durations):
+        # Per-operation durations in seconds -> one result, compared on mean_ms (lower is better)
+        ms = sorted(d * 1000 for d in durations)
+        result = {
+            "name": name,
+            "params": params,
+            "n": len(ms),
+            "mean_ms": statistics.fmean(ms),
+            "p50_ms": ms[len(ms) // 2],
+            "p95_ms": ms[min(len(ms) - 1, int(len(ms) * 0.95))],
+            "min_ms": ms[0],
+            "max_ms": ms[-1],
+            "metric": "mean_ms",
+            "better": "lower",
+        }
+        self.add(result)
+
+    def throughput(self, name, params, ops, seconds):
+        self.add({
+            "name": name, "params": params, "n": ops, "seconds": seconds, "ops_per_sec": ops / seconds,
+            "metric": "ops_per_sec", "better": "higher",
+        })
+
+    def value(self, name, params, value, unit):
+        self.add({"name": name, "params": params, "value": value, "unit": unit, "metric": "value", "better": "lower"})
+
+    def skipped(self, name, reason):
+        self.add({"name": name, "params": {}, "skipped": reason})
+
+    def add(self, result):
+        self.results.append(result)
+        if "skipped" in result:
+            line = f"skipped ({result['skipped']})"
+        elif result["metric"] == "value":
+            line = f"{result['value']} {result['unit']}"
+        elif result["metric"] == "mean_ms":
+            line = f"mean {result['mean_ms']:.3f} ms  p95 {result['p95_ms']:.3f} ms  (n={result['n']})"
+        else:
+            line = f"{result['ops_per_sec']:.0f} ops/s  (n={result['n']})"
+        params = " ".join(f"{k}={v}" for k, v in result["params"].items())
+        print(f"{result['name']:<28} {params:<24} {line}", file=sys.stderr)
+
+
+def timed(func, repeat, setup=None):
+    durations = []
+    for i in range(repeat):
+        if setup is not None:
+            setup(i)
+        start = time.perf_counter()
+        func(i)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def unlimited():
+    # Limiter that never waits, so client benchmarks measure the client and not the budget
+    return RateLimiter(rate=1e9, burst=1e9, endpoint_limits={})
+
+
+def bench_get(report, workdir, base_url, snapshot, repeat):
+    store = DiskCache(os.path.join(workdir, "get.db"), legacy_path=os.path.join(workdir, "none.json"))
+    api = FortniteAPI("bench", limiter=unlimited(), store=store, base_url=base_url, snapshot=snapshot)
+    if snapshot is not None:
+        calls = [(r["path"], r["params"] or None) for records in snapshot.responses.values() for r in records[:1]]
+    else:
+        calls = [("/v2/stats/br/v2", {"name": f"player{i}"}) for i in range(50)]
+    if not calls:
+        report.skipped("get", "snapshot has no responses")
+        return
+
+    def forget(i, disk):
+        # Untimed: drop one key from memory (and optionally disk) so the next get misses there
+        path, params = calls[i % len(calls)]
+        key = cache_key(path, params)
+        with api.cache.lock:
+            entry = api.cache.entries.pop(key, None)
+            if entry is not None:
+                api.cache.total_bytes -= entry["size"]
+        if disk:
+            store.delete(key)
+
+    def get(i):
+        path, params = calls[i % len(calls)]
+        api.get(path, params)
+
+    get(0)  # Untimed warm-up: imports requests and opens the connection
+    report.timings("get_miss", {"source": "replay" if snapshot else "stub"}, timed(get, repeat, setup=lambda i: forget(i, True)))
+    report.timings("get_disk_hit", {}, timed(get, repeat, setup=lambda i: forget(i, False)))
+    for i in range(len(calls)):
+        get(i)
+    report.timings("get_memory_hit", {}, timed(get, repeat * 10))
+    store.close()
+
+
+def bench_stream(report, workdir, sizes, repeat, latency):
+    # First-row latency, total time and peak memory for a whole list endpoint, parsed in
+    # one piece by get() versus item by item by stream()
+    path = "/v2/cosmetics/br"
+    for size in sizes:
+        server = StubServer(latency=latency, items=size).start()
+        store = DiskCache(os.path.join(workdir, f"stream_{size}.db"), legacy_path=os.path.join(workdir, "none.json"))
+        api = FortniteAPI("bench", limiter=unlimited(), store=store, base_url=server.url)
+        try:
+            def forget():
+                api.cache.clear()
+                store.delete(cache_key(path, None))
+
+            def by_get():
+                forget()
+                start = time.perf_counter()
+                items = api.get(path)["data"]
+                first = time.perf_counter() - start
+                count = sum(1 for _ in items)
+                return first, time.perf_counter() - start, count
+
+            def by_stream():
+                forget()
+                start = time.perf_counter()
+                items = api.stream(path, cache=False)
+                next(items)
+                first = time.perf_counter() - start
+                count = 1 + sum(1 for _ in items)
+                return first, time.perf_counter() - start, count
+
+            for mode, run in (("get", by_get), ("stream", by_stream)):
+                run()  # Untimed warm-up: connection and server-side body
+                runs = [run() for _ in range(repeat)]
+                report.timings("list_first_item", {"items": size, "mode": mode}, [r[0] for r in runs])
+                report.timings("list_total", {"items": size, "mode": mode}, [r[1] for r in runs])
+                tracemalloc.start()
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                report.value("list_peak_memory", {"items": size, "mode": mode}, peak, "bytes")
+        finally:
+            store.close()
+            server.stop()
+
+
+def measure_memory(build):
+    # Bytes still allocated by whatever build() returns
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def bench_models(report, sizes, repeat):
+    # Cost of parsing a cosmetics response into models, and the memory it holds once
+    # cached: the raw decoded JSON versus the models
+    path = "/v2/cosmetics/br"
+    for size in sizes:
+        body = json.dumps({"status": 200, "data": StubData(items=size).cosmetics})
+        report.timings("parse_json", {"items": size}, timed(lambda i: json.loads(body), repeat))
+        report.timings("parse_models", {"items": size}, timed(lambda i: parse_response(path, json.loads(body)), repeat))
+        report.value("cached_memory", {"items": size, "form": "raw"}, measure_memory(lambda: json.loads(body)), "bytes")
+        report.value("cached_memory", {"items": size, "form": "models"},
+                     measure_memory(lambda: parse_response(path, json.loads(body))), "bytes")
+
+
+def bench_aes(report, workdir, sizes_mb, repeat):
+    # Decryption throughput of one large file, in-process and across the process pool
+    from Crypto.Cipher import AES
+
+    key = b"0123456789abcdef"
+    block = AES.new(key, AES.MODE_ECB).encrypt(os.urandom(1024 * 1024))
+    padding = AES.new(key, AES.MODE_ECB).encrypt(bytes([16]) * 16)
+    for size in sizes_mb:
+        path = os.path.join(workdir, f"aes_{size}.bin")
+        with open(path, "wb") as f:
+            for _ in range(size):
+                f.write(block)
+            f.write(padding)
+        for workers in sorted({1, AES_WORKERS}):
+            seconds = 0.0
+            for _ in range(repeat):
+                with AesBatch(key, workers=workers) as batch:
+                    seconds += batch.decrypt_files([path], os.path.join(workdir, "aes_out"))["seconds"]
+            # ops are megabytes, so ops_per_sec reads as MB/s
+            report.throughput("aes_decrypt_mb", {"mb": size, "workers": workers}, size * repeat, seconds)
+        os.remove(path)
+
+
+def stats_payload(i):
+    return {"status": 200, "data": {
+        "account": {"id": f"{i:032x}", "name": f"player{i}"},
+        "stats": {"all": {c: {"wins": i, "kills": i * 3, "matches": i * 9, "kd": 1.5} for c in STAT_CATEGORIES}},
+    }}
+
+
+def bench_cache_growth(report, workdir, sizes, repeat):
+    for size in sizes:
+        store = DiskCache(os.path.join(workdir, f"cache_{size}.db"), legacy_path=os.path.join(workdir, "none.json"))
+        api = FortniteAPI("bench", limiter=unlimited(), cache=ResponseCache(max_entries=size * 2), store=store)
+        expires = cache_expiry("/v2/stats/br/v2")
+        for i in range(size):
+            api.save_cache(f"fill{i}", stats_payload(i), expires)
+        report.timings(
+            "save_cache", {"entries": size},
+            timed(lambda i: api.save_cache(f"new{i}", stats_payload(i), expires), repeat),
+        )
+        report.timings("load_cache_memory", {"entries": size}, timed(lambda i: api.load_cache(f"fill{i % size}"), repeat))
+        api.cache = ResponseCache(max_entries=size * 2)
+        report.timings("load_cache_disk", {"entries": size}, timed(lambda i: api.load_cache(f"fill{i % size}"), min(repeat, size)))
+        store.close()
+
+
+def bench_cache_format(report, workdir, sizes, repeat):
+    # The old pretty-printed whole-file JSON cache against one compressed entry per row
+    for size in sizes:
+        data = {"status": 200, "data": StubData(items=size, item_bytes=120).cosmetics}
+        legacy = os.path.join(workdir, f"legacy_{size}.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump({"/v2/cosmetics/br": {"time": 0, "expires": 0, "data": data}}, f, indent=2)
+
+        def load_legacy(i):
+            with open(legacy, "r", encoding="utf-8") as f:
+                json.load(f)
+
+        report.value("format_size", {"items": size, "format": "json_indent"}, os.path.getsize(legacy), "bytes")
+        report.timings("format_load", {"items": size, "format": "json_indent"}, timed(load_legacy, repeat))
+        text = json.dumps(data, separators=(",", ":"))
+        codecs = [("raw", CODEC_RAW), ("zlib", CODEC_ZLIB)] + ([("zstd", CODEC_ZSTD)] if load_zstd() else [])
+        for name, codec in codecs:
+            blob = encode_entry(text, codec)
+            report.value("format_size", {"items": size, "format": name}, len(blob), "bytes")
+            report.timings("format_encode", {"items": size, "format": name}, timed(lambda i: encode_entry(text, codec), repeat))
+            report.timings("format_load", {"items": size, "format": name}, timed(lambda i: json.loads(decode_entry(blob)), repeat))
+        # One entry read back from the real store, next to a few hundred others
+        store = DiskCache(os.path.join(workdir, f"format_{size}.db"), legacy_path=None)
+        expires = time.time() + 3600
+        for i in range(300):
+            store.put(f"stats{i}", stats_payload(i), expires)
+        store.put("/v2/cosmetics/br", data, expires, text=text)
+        store.close()
+        report.value("format_size", {"items": size, "format": "disk_cache_file"},
+                     os.path.getsize(os.path.join(workdir, f"format_{size}.db")), "bytes")
+        report.timings("format_load", {"items": size, "format": "disk_cache"},
+                       timed(lambda i: store.get("/v2/cosmetics/br"), repeat))
+        store.close()
+
+
+def bench_history(report, workdir, repeat):
+    try:
+        import gui
+    except ImportError as e:
+        report.skipped("add_history", f"gui unavailable: {e}")
+        return
+    path = os.path.join(workdir, "history.ndjson")
+    journal = gui.HistoryJournal(path, legacy_path=None)
+    try:
+        report.timings("add_history", {"history": "empty"}, timed(lambda i: journal.add("bench", f"entry {i}"), repeat))
+        for c in range(15):
+            for i in range(gui.HISTORY_MAX_ENTRIES):
+                journal.add(f"category{c}", f"entry {i:05d}")
+        report.timings("add_history", {"history": "full"}, timed(lambda i: journal.add("category0", f"new {i}"), repeat))
+        report.timings("history_suggest", {"prefix": "none"}, timed(lambda i: journal.suggest("category1"), repeat))
+        report.timings("history_suggest", {"prefix": "entry 0"}, timed(lambda i: journal.suggest("category1", "entry 0"), repeat))
+        report.timings("history_suggest", {"prefix": "entry 012"}, timed(lambda i: journal.suggest("category1", "entry 012"), repeat))
+    finally:
+        journal.close()
+
+    def load(i):
+        loading = gui.HistoryJournal(path, legacy_path=None)
+        loading.loaded.wait()
+        loading.close()
+
+    # Off the Tk thread, but it bounds how soon suggestions include older entries
+    report.timings("history_load", {"entries": journal.size()}, timed(load, max(1, repeat // 10)))
+
+
+def bench_trends(report, workdir, sizes, repeat):
+    # Stats history: recording a lookup, per-player trends and leaderboards across all
+    # players as the store grows, and loading it back
+    rng = random.Random(0)
+    for size in sizes:
+        path = os.path.join(workdir, f"stats_{size}.bin")
+        history = StatsHistory(path)
+        players = [f"player{i}" for i in range(max(1, size // 4))]
+        totals = {name: [0.0] * len(STAT_FIELDS) for name in players}
+
+        def lookup(i):
+            name = players[i % len(players)]
+            values = totals[name]
+            for field in range(len(values)):
+                values[field] += rng.randint(0, 20)
+            return PlayerStats(name, {mode: tuple(values) for mode in STAT_CATEGORIES})
+
+        lookups = [lookup(i) for i in range(size)]
+        durations = timed(lambda i: history.record(lookups[i], when=i), size)
+        report.timings("stats_record", {"lookups": size}, durations[-repeat:])
+        report.timings("stats_trends", {"lookups": size}, timed(lambda i: history.trends(players[i % len(players)]), repeat))
+        report.timings("stats_leaderboard", {"lookups": size}, timed(lambda i: history.leaderboard("kd"), repeat))
+        history.close()
+        report.value("stats_file_size", {"lookups": size}, os.path.getsize(path), "bytes")
+        report.timings("stats_load", {"lookups": size},
+                       timed(lambda i: StatsHistory(path).players(), max(3, repeat // 20)))
+
+
+def bench_shop(report, workdir, sizes, repeat):
+    # Diffing a shop refresh against the one on screen, and last-seen lookups in a full
+    # year of archived rotations
+    for size in sizes:
+        data = StubData(items=size * 25)
+        shop = [ShopEntry.from_api(item, "Daily") for item in data.cosmetics[:size]]
+        rotated = shop[size // 10:] + [ShopEntry.from_api(item, "Daily") for item in data.cosmetics[size:size + size // 10]]
+        previous = SnapshotDiff(shop, shop_entry_key)
+        report.timings("shop_diff", {"offers": size, "change": "none"},
+                       timed(lambda i: SnapshotDiff(shop, shop_entry_key, previous), repeat))
+        report.timings("shop_diff", {"offers": size, "change": "10%"},
+                       timed(lambda i: SnapshotDiff(rotated, shop_entry_key, previous), repeat))
+        archive = ShopArchive(os.path.join(workdir, f"shop_{size}.ndjson"))
+        offers = [ShopEntry.from_api(item, "Daily") for item in data.cosmetics]
+        for day in range(SHOP_ARCHIVE_ROTATIONS):
+            archive.record([offers[(day * size // 10 + i) % len(offers)] for i in range(size)], when=day * 86400)
+        report.timings("shop_last_seen", {"offers": size, "query": "id"},
+                       timed(lambda i: archive.last_seen(offers[i % len(offers)].id), repeat))
+        report.timings("shop_last_seen", {"offers": size, "query": "name"},
+                       timed(lambda i: archive.last_seen(offers[i % len(offers)].name), repeat))
+        report.timings("shop_archive_load", {"offers": size},
+                       timed(lambda i: ShopArchive(archive.path).stats(), max(3, repeat // 20)))
+
+
+def bench_limiter(report, thread_counts, per_thread):
+    for threads in thread_counts:
+        for label, limiter, count in (
+            ("limiter_unlimited", unlimited(), per_thread),
+            # 500/s budget: throughput should sit at the budget no matter how many threads wait
+            ("limiter_throttled", RateLimiter(rate=500, burst=10, endpoint_limits={}), max(1, 250 // threads)),
+        ):
+            def worker():
+                for _ in range(count):
+                    limiter.acquire("/v2/shop/br")
+
+            pool = [threading.Thread(target=worker) for _ in range(threads)]
+            start = time.perf_counter()
+            for t in pool:
+                t.start()
+            for t in pool:
+                t.join()
+            report.throughput(label, {"threads": threads}, threads * count, time.perf_counter() - start)
+
+
+class Holder:
+    # Stands in for tk.StringVar when the table is benchmarked without a display
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def headless_table(gui, columns):
+    # A VirtualTable whose Tk widgets are no-ops, so the row conversion, sorting and
+    # filtering code runs unchanged without a display
+    class Widget:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: ()
+
+    class HeadlessTable(gui.VirtualTable):
+        def __init__(self):
+            self.init_state(columns)
+            self.filter_var = Holder()
+            self.count_var = Holder()
+            self.tree = Widget()
+            self.scrollbar = Widget()
+
+        def visible_count(self):
+            return 30
+
+    return HeadlessTable()
+
+
+def bench_render(report, sizes, repeat, headless):
+    try:
+        import gui
+    except ImportError as e:
+        report.skipped("render_cosmetics", f"gui unavailable: {e}")
+        return
+    root = None
+    if not headless:
+        try:
+            root = gui.tk.Tk()
+            root.withdraw()
+        except gui.tk.TclError as e:
+            print(f"No display ({e}); rendering headless.", file=sys.stderr)
+    columns = [("name", "Name", 200), ("type", "Type", 100), ("rarity", "Rarity", 100), ("set", "Set", 160), ("id", "ID", 220)]
+    mode = "tk" if root is not None else "headless"
+    for size in sizes:
+        items = Cosmetic.parse_list(StubData(items=size).cosmetics)
+        table = gui.VirtualTable(root, columns) if root is not None else headless_table(gui, columns)
+
+        def show(i):
+            # What the Cosmetics tab does with a parsed response
+            table.set_items(items)
+            if root is not None:
+                root.update_idletasks()
+
+        report.timings("render_cosmetics", {"items": size, "mode": mode}, timed(show, repeat))
+        report.timings("sort_cosmetics", {"items": size, "mode": mode}, timed(lambda i: table.sort_by("name"), repeat))
+
+        def filter_rows(i):
+            table.filter_var.set("storm" if i % 2 == 0 else "")
+            table.on_filter()
+
+        report.timings("filter_cosmetics", {"items": size, "mode": mode}, timed(filter_rows, repeat))
+        if root is not None:
+            table.destroy()
+    # Stats text as built by show_stats
+    data = stats_payload(1234)["data"]["stats"]["all"]
+    report.timings("format_stats", {}, timed(
+        lambda i: "\n".join(gui.FortniteApp.format_stat_category(None, c.title(), data[c]) for c in STAT_CATEGORIES),
+        repeat * 10,
+    ))
+    if root is not None:
+        root.destroy()
+
+
+def compare(results, baseline_path, threshold):
+    # Regressions beyond the threshold, as printable lines
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get((result["name"], json.dumps(result["params"], sort_keys=True)))
+        if old is None or "skipped" in result or "skipped" in old:
+            continue
+        metric = result["metric"]
+        if result["better"] == "lower":
+            change = result[metric] / old[metric] - 1 if old[metric] else 0.0
+        else:
+            change = old[metric] / result[metric] - 1 if result[metric] else 0.0
+        if change > threshold:
+            regressions.append(f"{result['name']} {result['params']}: {metric} {old[metric]:.3f} -> {result[metric]:.3f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the client, cache and rendering hot paths.")
+    parser.add_argument("--headless", action="store_true", help="never open a Tk window")
+    parser.add_argument("--quick", action="store_true", help="smaller sizes and fewer repeats, for CI smoke runs")
+    parser.add_argument("--repeat", type=int, default=200, help="timed operations per benchmark")
+    parser.add_argument("--replay", metavar="FILE", help="measure get() against a snapshot instead of the stub server")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub server latency in seconds")
+    parser.add_argument("--only", action="append",
+                        choices=["get", "stream", "cache", "format", "models", "aes", "history", "trends", "shop",
+                                 "limiter", "render"],
+                        help="run only these groups; may be repeated")
+    parser.add_argument("-o", "--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", metavar="REPORT", help="exit 1 if results regressed against this report")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown for --compare (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    repeat = min(args.repeat, 20) if args.quick else args.repeat
+    cache_sizes = CACHE_SIZES[:3] if args.quick else CACHE_SIZES
+    render_sizes = RENDER_SIZES[:2] if args.quick else RENDER_SIZES
+    groups = set(args.only or ["get", "stream", "cache", "format", "models", "aes", "history", "trends", "shop",
+                               "limiter", "render"])
+    report = Report()
+
+    with tempfile.TemporaryDirectory(prefix="fnapi-bench-") as workdir:
+        if "get" in groups:
+            if args.replay:
+                bench_get(report, workdir, None, SnapshotArchive(args.replay, "replay"), repeat)
+            else:
+                server = StubServer(latency=args.latency).start()
+                try:
+                    bench_get(report, workdir, server.url, None, repeat)
+                finally:
+                    server.stop()
+        if "stream" in groups:
+            if args.replay:
+                report.skipped("stream", "needs the stub server")
+            else:
+                bench_stream(report, workdir, STREAM_SIZES[:1] if args.quick else STREAM_SIZES,
+                             max(3, repeat // 20), args.latency)
+        if "cache" in groups:
+            bench_cache_growth(report, workdir, cache_sizes, repeat)
+        if "format" in groups:
+            bench_cache_format(report, workdir, FORMAT_SIZES[:1] if args.quick else FORMAT_SIZES, max(3, repeat // 20))
+        if "models" in groups:
+            bench_models(report, FORMAT_SIZES[:1] if args.quick else FORMAT_SIZES, max(3, repeat // 20))
+        if "aes" in groups:
+            bench_aes(report, workdir, AES_SIZES_MB[:1] if args.quick else AES_SIZES_MB, 3)
+        if "history" in groups:
+            bench_history(report, workdir, repeat)
+        if "trends" in groups:
+            bench_trends(report, workdir, TREND_SIZES[:1] if args.quick else TREND_SIZES, repeat)
+        if "shop" in groups:
+            bench_shop(report, workdir, SHOP_SIZES[:1] if args.quick else SHOP_SIZES, repeat)
+        if "limiter" in groups:
+            bench_limiter(report, LIMITER_THREADS, 2000 if args.quick else 20000)
+        if "render" in groups:
+            bench_render(report, render_sizes, max(3, repeat // 20), args.headless)
+
+    document = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": report.results,
+    }
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        regressions = compare(report.results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+# Command line interface for fortnite_api.py: one subcommand per endpoint, results
+# streamed to stdout as one JSON object per line (NDJSON).
+#
+#   python cli.py shop
+#   python cli.py stats ninja bugha --category solo
+#   python cli.py stats --input players.txt --track > /dev/null   # e.g. daily from cron
+#   python cli.py cosmetics --input names.txt --concurrency 8 > cosmetics.ndjson
+#   cat codes.txt | python cli.py creator-code --input -
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from fortnite_api import (
+    CONFIG_FILE, HTTP_POOL_SIZE, STAT_CATEGORIES, STATS_HISTORY_FILE, FortniteAPI, PlayerStats, SnapshotArchive,
+    StatsHistory, bulk_stats_row, model_json,
+)
+
+CLI_CONCURRENCY = 4  # Parallel lookups for batch input; the shared rate limiter still applies
+API_KEY_ENV = "FORTNITE_API_KEY"
+
+# Subcommand -> (FortniteAPI method, takes a query, help text)
+COMMANDS = {
+    "cosmetics": ("get_cosmetics", True, "search cosmetics by name"),
+    "stats": ("get_stats", True, "player stats by Epic username"),
+    "creator-code": ("get_creator_code", True, "look up creator codes"),
+    "shop": ("get_shop", False, "current item shop"),
+    "news": ("get_news", False, "battle royale news"),
+    "map": ("get_map", False, "map info"),
+    "season": ("get_season", False, "current season"),
+    "languages": ("get_languages", False, "supported languages"),
+    "upcoming": ("get_upcoming", False, "newly added cosmetics"),
+    "creative": ("get_creative", False, "featured creative islands"),
+    "paks": ("get_paks", False, "pak files and AES keys"),
+    "banners": ("get_banners", False, "banners"),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Query fortnite-api.com and print one JSON object per result.")
+    parser.add_argument("--api-key", help=f"API key (default: ${API_KEY_ENV}, then {CONFIG_FILE})")
+    parser.add_argument("--base-url", help="API base URL, e.g. a local mirror or stub_server.py")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="write request metrics on exit: Prometheus text for .prom/.txt, JSON otherwise")
+    snapshot = parser.add_mutually_exclusive_group()
+    snapshot.add_argument("--record", metavar="FILE", help="append every response to a snapshot archive (.ndjson.gz)")
+    snapshot.add_argument("--replay", metavar="FILE", help="serve responses from a snapshot archive instead of the network")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="command")
+    for name, (method, takes_query, help_text) in COMMANDS.items():
+        cmd = sub.add_parser(name, help=help_text)
+        if takes_query:
+            cmd.add_argument("queries", nargs="*", metavar="query")
+            cmd.add_argument("-i", "--input", action="append", default=[], metavar="FILE",
+                             help="read one query per line from FILE ('-' for stdin); may be repeated")
+            cmd.add_argument("-c", "--concurrency", type=int, default=CLI_CONCURRENCY,
+                             help=f"parallel lookups (default {CLI_CONCURRENCY})")
+        if name == "stats":
+            cmd.add_argument("--category", choices=STAT_CATEGORIES,
+                             help="print a flat row of one category instead of the full response")
+            cmd.add_argument("--track", action="store_true",
+                             help=f"also add each result to the stats history ({STATS_HISTORY_FILE}) shown in the GUI")
+    return parser
+
+
+def load_api_key(args):
+    if args.api_key:
+        return args.api_key
+    if os.environ.get(API_KEY_ENV):
+        return os.environ[API_KEY_ENV]
+    try:
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("api_key", "")
+    except (OSError, ValueError):
+        return ""
+
+
+def read_queries(args):
+    # Positional queries first, then each input file in order. Yielded lazily so a large
+    # batch on stdin starts running before it has been read to the end.
+    for query in args.queries:
+        if query.strip():
+            yield query.strip()
+    for path in args.input:
+        f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+        try:
+            for line in f:
+                if line.strip():
+                    yield line.strip()
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def result_record(command, query, data, category=None):
+    if command == "stats" and category:
+        record = bulk_stats_row(query, data, category)
+        record["command"] = command
+        return record
+    record = {"command": command}
+    if query is not None:
+        record["query"] = query
+    if "error" in data:
+        record["status"] = "error"
+        record["error"] = data["error"]
+    else:
+        record["status"] = "ok"
+        record["data"] = data
+    return record
+
+
+def emit(record, out=sys.stdout):
+    # Parsed responses hold models; they are printed in their compact form
+    out.write(json.dumps(record, separators=(",", ":"), default=model_json) + "\n")
+    out.flush()
+
+
+def run_batch(fetch, queries, concurrency, on_result):
+    # Keeps at most `concurrency` lookups in flight and reports each as it finishes, so
+    # neither the input nor the results are ever held in memory all at once.
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        pending = {}
+        for query in queries:
+            pending[pool.submit(fetch, query)] = query
+            if len(pending) >= concurrency:
+                done = next(as_completed(pending))
+                on_result(pending.pop(done), done.result())
+        for done in as_completed(pending):
+            on_result(pending[done], done.result())
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    api_key = load_api_key(args)
+    if not api_key and not args.replay:
+        print(f"No API key: pass --api-key, set ${API_KEY_ENV} or save one in the GUI.", file=sys.stderr)
+        return 2
+    history = None
+    if getattr(args, "track", False):
+        history = StatsHistory()
+        try:
+            history.players()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 2
+    snapshot = None
+    if args.record or args.replay:
+        snapshot = SnapshotArchive(args.record or args.replay, "record" if args.record else "replay")
+    method, takes_query, help_text = COMMANDS[args.command]
+    # Enough pooled connections that no batch worker waits for one
+    pool_size = max(HTTP_POOL_SIZE, args.concurrency) if takes_query else HTTP_POOL_SIZE
+    api = FortniteAPI(api_key or "replay", base_url=args.base_url, snapshot=snapshot, pool_size=pool_size)
+    fetch = getattr(api, method)
+    category = getattr(args, "category", None)
+    failures = 0
+
+    def on_result(query, data):
+        nonlocal failures
+        if history is not None and isinstance(data.get("data"), PlayerStats):
+            history.record(data["data"], query)
+        record = result_record(args.command, query, data, category)
+        if record["status"] != "ok":
+            failures += 1
+        emit(record)
+
+    try:
+        if takes_query:
+            run_batch(fetch, read_queries(args), args.concurrency, on_result)
+        else:
+            on_result(None, fetch())
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); nothing left to report to
+        sys.stderr.close()
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if args.metrics:
+            fmt = "prometheus" if args.metrics.lower().endswith((".prom", ".txt")) else "json"
+            with open(args.metrics, "w", encoding="utf-8") as f:
+                f.write(api.export_metrics(fmt))
+        api.close()
+        api.store.close()
+        if history is not None:
+            history.close()
+        if snapshot is not None:
+            snapshot.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
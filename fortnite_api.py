@@ -1,63 +1,1174 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+# Client for fortnite-api.com: caching, rate limiting and the endpoint methods. Has no
+# tkinter dependency so it can be used headless; the GUI lives in gui.py and the
+# command line interface in cli.py.
+import time
 import threading
-import requests
 import json
-import time
+import csv
+import bisect
+import re
 import os
-from Crypto.Cipher import AES
+import random
+import sqlite3
+import gzip
+import zlib
+import hashlib
+import codecs
 import base64
+import mmap
+from collections import OrderedDict, Counter, deque
+from datetime import datetime
+import sys
+
+# requests, aiohttp and asyncio are imported where they are first used so the GUI window
+# can appear before they load.
 
 CACHE_FILE = "fnapi_cache.json"
-HISTORY_FILE = "fnapi_history.json"
+CACHE_DB_FILE = "fnapi_cache.db"
 CONFIG_FILE = "fnapi_config.json"
-
-RATE_LIMIT_SECONDS = 1.5  # Delay between API calls to avoid spam
-
-
-class FortniteAPI:
+CATALOG_FILE = "fnapi_catalog.json"
+STATS_HISTORY_FILE = "fnapi_stats.bin"  # Player names go next to it in fnapi_stats.players
+SHOP_ARCHIVE_FILE = "fnapi_shop_archive.ndjson"
+SHOP_ARCHIVE_ROTATIONS = 365  # Rotations kept in full; older ones survive only in the last-seen index
+
+RATE_LIMIT_PER_SECOND = 3.0  # Sustained request rate shared by all threads
+RATE_LIMIT_BURST = 6
+# Stricter budgets for endpoints that are expensive on the API side, matched by path prefix
+ENDPOINT_RATE_LIMITS = {
+    "/v2/stats/br/v2": (1.0, 3),
+    "/v2/cosmetics/br/search": (2.0, 4),
+}
+ASYNC_MAX_CONCURRENCY = 16
+# HTTP connection reuse: connections kept open per host (at least the GUI's worker threads
+# plus a CLI batch), hosts with a pool, and how long idle connections are kept alive
+HTTP_POOL_SIZE = 16
+HTTP_POOL_HOSTS = 4
+HTTP_KEEPALIVE_SECONDS = 60
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30.0
+
+CACHE_MAX_ENTRIES = 500
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# How long a cached response stays fresh, matched by path prefix.
+# "rotation" means until the next daily item shop reset at 00:00 UTC.
+CACHE_TTLS = {
+    "/v2/shop/br": "rotation",
+    "/v2/news/br": 5 * 60,
+    "/v2/stats/br/v2": 60,
+    "/v2/cosmetics/br/new": 15 * 60,
+    "/v2/cosmetics/br/search": 60 * 60,
+    "/v2/cosmetics/br": 24 * 60 * 60,
+    "/v2/creative/islands": 15 * 60,
+    "/v2/creatorcode/": 60 * 60,
+    "/v2/seasons/current": 60 * 60,
+    "/v1/map": 60 * 60,
+    "/v1/banners": 24 * 60 * 60,
+    "/v1/languages": 3 * 24 * 60 * 60,
+    "/v2/paks": 3 * 24 * 60 * 60,
+}
+DEFAULT_CACHE_TTL = 10 * 60
+CACHE_PURGE_AFTER = 7 * 24 * 60 * 60  # Drop rows that have been expired this long
+
+# On-disk entry encoding: compact JSON, compressed with zstd when the optional zstandard
+# package is installed and zlib otherwise. The first byte of every stored blob names the
+# codec, so entries written with either remain readable.
+CACHE_FORMAT_VERSION = 2  # PRAGMA user_version of the cache database
+CACHE_COMPRESS_MIN_BYTES = 1024  # Smaller payloads are stored uncompressed
+CACHE_ZLIB_LEVEL = 3  # ~3x faster than the default level 6 for ~20% more bytes
+CACHE_ZSTD_LEVEL = 3
+CACHE_MMAP_BYTES = 256 * 1024 * 1024  # Let SQLite read the database through mmap
+CODEC_RAW = b"j"
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"s"
+
+# Request metrics: histogram bucket bounds (ms, as exported to Prometheus) and how many
+# recent samples each histogram keeps for percentiles
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS_SAMPLES = 1024
+
+# Streaming decode of large list endpoints: bytes read per network chunk, and how much
+# already-parsed text may pile up before the buffer is trimmed
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_COMPACT_CHARS = 1024 * 1024
+
+# AES decryption of batches and large files: ciphertext per worker job (a multiple of the
+# block size), base64 lines per job, and inputs small enough to skip the process pool
+AES_BLOCK_BYTES = 16
+AES_CHUNK_BYTES = 4 * 1024 * 1024
+AES_BATCH_LINES = 512
+AES_INLINE_BYTES = 1024 * 1024
+AES_WORKERS = os.cpu_count() or 1
+
+# Response headers kept in snapshot archives; everything else is dropped
+SNAPSHOT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+# Stats fields in display order with friendly names
+STAT_FIELDS = [
+    ("score", "Score"),
+    ("scorePerMin", "Score Per Minute"),
+    ("scorePerMatch", "Score Per Match"),
+    ("wins", "Wins"),
+    ("top3", "Top 3 Finishes"),
+    ("top5", "Top 5 Finishes"),
+    ("top6", "Top 6 Finishes"),
+    ("top10", "Top 10 Finishes"),
+    ("top12", "Top 12 Finishes"),
+    ("top25", "Top 25 Finishes"),
+    ("kills", "Kills"),
+    ("killsPerMin", "Kills Per Minute"),
+    ("killsPerMatch", "Kills Per Match"),
+    ("deaths", "Deaths"),
+    ("kd", "K/D Ratio"),
+    ("matches", "Matches Played"),
+    ("winRate", "Win Rate (%)"),
+    ("minutesPlayed", "Minutes Played"),
+    ("playersOutlived", "Players Outlived"),
+    ("lastModified", "Last Modified"),
+]
+STAT_CATEGORIES = ["overall", "solo", "duo", "squad", "ltm"]
+# Stats history: lookups per rolling K/D and win rate point, and the header that marks a
+# snapshot file (followed by the number of STAT_FIELDS it was written with)
+STATS_TREND_WINDOW = 5
+STATS_FILE_MAGIC = b"FNSTATS1"
+
+
+def next_shop_rotation(now=None):
+    now = time.time() if now is None else now
+    return (int(now // 86400) + 1) * 86400
+
+
+def cache_expiry(path, now=None):
+    now = time.time() if now is None else now
+    ttl = DEFAULT_CACHE_TTL
+    for prefix, value in CACHE_TTLS.items():
+        if path.startswith(prefix):
+            ttl = value
+            break
+    if ttl == "rotation":
+        return next_shop_rotation(now)
+    return now + ttl
+
+
+def cache_key(path, params=None):
+    # Canonical cache and in-flight key: parameter order does not matter
+    if params:
+        params = dict(sorted(params.items()))
+    return f"{path} {params}"
+
+
+def cache_key_path(key):
+    return key.split(" ", 1)[0]
+
+
+def backoff_delay(attempt):
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate, burst, now=None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic() if now is None else now
+
+    def reserve(self, now):
+        # Take one token, going into debt if none are left, and return how long the
+        # caller has to wait before its token is actually available.
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.tokens -= 1
+        wait = self.updated - now
+        if self.tokens < 0:
+            wait += -self.tokens / self.rate
+        return wait
+
+    def hold_until(self, until):
+        if until > self.updated:
+            self.updated = until
+            self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    # Token-bucket limiter shared by every FortniteAPI client. Callers reserve their slot
+    # under the lock and sleep outside it, so waiters are served in arrival order.
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST, endpoint_limits=None):
+        self.bucket = TokenBucket(rate, burst)
+        self.endpoint_limits = dict(ENDPOINT_RATE_LIMITS if endpoint_limits is None else endpoint_limits)
+        self.endpoint_buckets = {}
+        self.paused_until = 0.0
+        self.total_wait = 0.0
+        self.waits = 0
+        self.lock = threading.Lock()
+
+    def configure(self, rate=None, burst=None, endpoint_limits=None):
+        with self.lock:
+            if rate is not None or burst is not None:
+                self.bucket = TokenBucket(rate or self.bucket.rate, burst or self.bucket.burst)
+            if endpoint_limits is not None:
+                self.endpoint_limits = dict(endpoint_limits)
+                self.endpoint_buckets = {}
+
+    def _endpoint_bucket(self, path, now):
+        for prefix, (rate, burst) in self.endpoint_limits.items():
+            if path.startswith(prefix):
+                if prefix not in self.endpoint_buckets:
+                    # Full as of this reservation, not a moment after it
+                    self.endpoint_buckets[prefix] = TokenBucket(rate, burst, now)
+                return self.endpoint_buckets[prefix]
+        return None
+
+    def reserve(self, path=""):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.bucket.reserve(now)
+            bucket = self._endpoint_bucket(path, now)
+            if bucket is not None:
+                delay = max(delay, bucket.reserve(now))
+            delay = max(delay, self.paused_until - now)
+            if delay > 0:
+                self.total_wait += delay
+                self.waits += 1
+            return delay
+
+    def stats(self):
+        with self.lock:
+            return {
+                "total_wait": self.total_wait,
+                "waits": self.waits,
+                "paused_for": max(0.0, self.paused_until - time.monotonic()),
+            }
+
+    def pause(self, seconds):
+        # Server asked us to back off (429): hold every bucket until the pause is over
+        with self.lock:
+            until = time.monotonic() + seconds
+            self.paused_until = max(self.paused_until, until)
+            self.bucket.hold_until(until)
+            for bucket in self.endpoint_buckets.values():
+                bucket.hold_until(until)
+
+    def acquire(self, path=""):
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+        # A 429 may have arrived while we were queued
+        remaining = self.paused_until - time.monotonic()
+        while remaining > 0:
+            time.sleep(remaining)
+            delay += remaining
+            remaining = self.paused_until - time.monotonic()
+        return delay
+
+
+rate_limiter = RateLimiter()
+
+
+class SingleFlight:
+    # Collapses concurrent calls for the same key into one: the first caller runs the
+    # function and everyone who arrives while it is running gets the same result, or the
+    # same exception.
+    def __init__(self):
+        self.calls = {}
+        self.started = 0
+        self.collapsed = 0
+        self.lock = threading.Lock()
+
+    def do(self, key, func):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = {"done": threading.Event(), "result": None, "error": None}
+                self.started += 1
+            else:
+                self.collapsed += 1
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = func()
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call["done"].set()
+        return call["result"]
+
+    def stats(self):
+        with self.lock:
+            return {"in_flight": len(self.calls), "started": self.started, "collapsed": self.collapsed}
+
+
+class ResponseCache:
+    # In-memory LRU of API responses, bounded by entry count and by serialized size.
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry["expires"] <= now:
+                self.expired += 1
+                self.misses += 1
+                # Stale entries are kept for conditional revalidation when they carry validators
+                if not entry["etag"] and not entry["last_modified"]:
+                    self._remove(key)
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry["data"]
+
+    def peek(self, key):
+        # Entry regardless of freshness, without touching LRU order or counters
+        with self.lock:
+            return self.entries.get(key)
+
+    def put(self, key, data, expires, stored=None, size=None, etag=None, last_modified=None):
+        if size is None:
+            size = len(to_json(data))
+        entry = {
+            "time": time.time() if stored is None else stored,
+            "expires": expires,
+            "size": size,
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        }
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self.entries[key] = entry
+            self.total_bytes += size
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                old_key = next(iter(self.entries))
+                self._remove(old_key)
+                self.evictions += 1
+
+    def refresh(self, key, expires):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["time"] = time.time()
+                entry["expires"] = expires
+                self.entries.move_to_end(key)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.total_bytes -= entry["size"]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def items(self):
+        with self.lock:
+            return list(self.entries.items())
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+zstd = None
+
+
+def load_zstd():
+    # zstandard is optional; None when it isn't installed
+    global zstd
+    if zstd is None:
+        try:
+            import zstandard
+        except ImportError:
+            zstandard = False
+        zstd = zstandard
+    return zstd or None
+
+
+def encode_entry(text, codec=None):
+    # Serialized JSON text -> codec byte + (possibly compressed) UTF-8
+    raw = text.encode("utf-8")
+    if codec is None:
+        if len(raw) < CACHE_COMPRESS_MIN_BYTES:
+            codec = CODEC_RAW
+        else:
+            codec = CODEC_ZSTD if load_zstd() else CODEC_ZLIB
+    if codec == CODEC_RAW:
+        return codec + raw
+    if codec == CODEC_ZLIB:
+        return codec + zlib.compress(raw, CACHE_ZLIB_LEVEL)
+    if codec == CODEC_ZSTD:
+        return codec + load_zstd().ZstdCompressor(level=CACHE_ZSTD_LEVEL).compress(raw)
+    raise ValueError(f"Unknown cache codec: {codec!r}")
+
+
+def decode_entry(blob):
+    # Stored blob -> UTF-8 JSON bytes. Rows from before the binary format hold plain text.
+    if isinstance(blob, str):
+        return blob.encode("utf-8")
+    codec, body = blob[:1], blob[1:]
+    if codec == CODEC_RAW:
+        return body
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(body)
+    if codec == CODEC_ZSTD:
+        if not load_zstd():
+            raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+        return zstd.ZstdDecompressor().decompress(body)
+    raise ValueError(f"Unknown cache codec: {codec!r}")
+
+
+class DiskCache:
+    # Persistent response store in SQLite. Nothing is read until the first lookup,
+    # and every read or write touches a single row. Payloads are stored as compressed
+    # blobs (see encode_entry).
+    def __init__(self, path=CACHE_DB_FILE, legacy_path=CACHE_FILE):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA mmap_size={CACHE_MMAP_BYTES}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, stored REAL NOT NULL, expires REAL NOT NULL, data TEXT NOT NULL, "
+                "etag TEXT, last_modified TEXT)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+            with conn:
+                conn.execute("DELETE FROM responses WHERE expires < ?", (time.time() - CACHE_PURGE_AFTER,))
+            self.conn = conn
+            if conn.execute("PRAGMA user_version").fetchone()[0] < CACHE_FORMAT_VERSION:
+                self._compress_rows()
+            self._migrate_legacy()
+        return self.conn
+
+    def _compress_rows(self):
+        # One-time rewrite of plain-text rows into the compressed format
+        rows = self.conn.execute("SELECT key, data FROM responses WHERE typeof(data) = 'text'").fetchall()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE responses SET data = ? WHERE key = ?", ((encode_entry(text), key) for key, text in rows)
+            )
+            self.conn.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+        if rows:
+            self.conn.execute("VACUUM")
+
+    def _migrate_legacy(self):
+        # One-time import of the old whole-file JSON cache
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except Exception:
+            stored = {}
+        rows = []
+        # The oldest files hold bare responses with no timestamps. Those come in as already
+        # expired, dated by the file: refetched before they are served again, and purged
+        # like any other stale row.
+        now = time.time()
+        written = min(os.path.getmtime(self.legacy_path), now)
+        for key, entry in stored.items():
+            if not isinstance(entry, dict):
+                continue
+            if "expires" in entry and "data" in entry:
+                stored_at, expires, data = entry.get("time", 0), entry["expires"], entry["data"]
+            elif "error" not in entry:
+                stored_at, expires, data = written, now, entry
+            else:
+                continue
+            text = json.dumps(data, separators=(",", ":"))
+            rows.append((key, stored_at, expires, encode_entry(text)))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, stored, expires, data) VALUES (?, ?, ?, ?)", rows
+            )
+        os.replace(self.legacy_path, self.legacy_path + ".migrated")
+
+    def get(self, key):
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT stored, expires, data, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        stored, expires, blob, etag, last_modified = row
+        try:
+            raw = decode_entry(blob)
+        except (ValueError, zlib.error):
+            # Unreadable here (e.g. zstd without zstandard installed): treat as a miss
+            return None
+        return {
+            "time": stored,
+            "expires": expires,
+            "size": len(raw),
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": json.loads(raw),
+        }
+
+    def put(self, key, data, expires, stored=None, text=None, etag=None, last_modified=None):
+        if text is None:
+            text = json.dumps(data, separators=(",", ":"))
+        blob = encode_entry(text)
+        stored = time.time() if stored is None else stored
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, stored, expires, data, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, stored, expires, blob, etag, last_modified),
+                )
+
+    def touch(self, key, expires):
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET stored = ?, expires = ? WHERE key = ?", (time.time(), expires, key)
+                )
+
+    def delete(self, key):
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def __len__(self):
+        with self.lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+def endpoint_name(path):
+    # Metrics label for a request path; paths that embed a parameter share one label
+    if path.startswith("/v2/creatorcode/"):
+        return "/v2/creatorcode"
+    return path or "other"
+
+
+class Histogram:
+    # Bucketed counts for export plus the most recent samples for exact percentiles.
+    # Not locked; Metrics serializes access.
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.samples = deque(maxlen=METRICS_SAMPLES)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def summary(self, samples=None):
+        ordered = sorted(self.samples if samples is None else samples)
+
+        def pick(q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+        }
+
+
+class Metrics:
+    # Per-endpoint counters and timings for one client: requests, errors, bytes, HTTP
+    # latency and JSON parse time (ms), cache hits/misses and time spent waiting on the
+    # rate limiter (seconds).
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.started = time.time()
+
+    def _endpoint(self, path):
+        name = endpoint_name(path)
+        ep = self.endpoints.get(name)
+        if ep is None:
+            ep = self.endpoints[name] = {
+                "requests": 0, "errors": 0, "bytes": 0, "cache_hits": 0, "cache_misses": 0,
+                "limiter_wait": 0.0, "latency": Histogram(), "parse": Histogram(),
+            }
+        return ep
+
+    def record_request(self, path, seconds, status, size):
+        # status is None when the request failed without a response
+        with self.lock:
+            ep = self._endpoint(path)
+            ep["requests"] += 1
+            if status is None or status >= 400:
+                ep["errors"] += 1
+            ep["bytes"] += size
+            ep["latency"].observe(seconds * 1000)
+
+    def record_parse(self, path, seconds):
+        with self.lock:
+            self._endpoint(path)["parse"].observe(seconds * 1000)
+
+    def record_cache(self, path, hit):
+        with self.lock:
+            self._endpoint(path)["cache_hits" if hit else "cache_misses"] += 1
+
+    def record_stream(self, path, size, parse_seconds):
+        # Body size and decode time of a streamed response, known only once it is consumed
+        with self.lock:
+            ep = self._endpoint(path)
+            ep["bytes"] += size
+            ep["parse"].observe(parse_seconds * 1000)
+
+    def record_wait(self, path, seconds):
+        if seconds > 0:
+            with self.lock:
+                self._endpoint(path)["limiter_wait"] += seconds
+
+    def reset(self):
+        with self.lock:
+            self.endpoints = {}
+            self.started = time.time()
+
+    def histograms(self):
+        # Copies of the bucket counts per endpoint, for export
+        with self.lock:
+            copies = {}
+            for name, ep in sorted(self.endpoints.items()):
+                copies[name] = {}
+                for key in ("latency", "parse"):
+                    hist = Histogram(ep[key].buckets)
+                    hist.counts = list(ep[key].counts)
+                    hist.count = ep[key].count
+                    hist.total = ep[key].total
+                    copies[name][key] = hist
+            return copies
+
+    def snapshot(self):
+        with self.lock:
+            endpoints = {}
+            totals = {"requests": 0, "errors": 0, "bytes": 0, "cache_hits": 0, "cache_misses": 0, "limiter_wait": 0.0}
+            latency_samples = []
+            for name, ep in sorted(self.endpoints.items()):
+                endpoints[name] = {key: ep[key] for key in totals}
+                endpoints[name]["latency_ms"] = ep["latency"].summary()
+                endpoints[name]["parse_ms"] = ep["parse"].summary()
+                for key in totals:
+                    totals[key] += ep[key]
+                latency_samples.extend(ep["latency"].samples)
+            overall = Histogram()
+            overall.count = totals["requests"]
+            overall.total = sum(ep["latency"].total for ep in self.endpoints.values())
+            totals["latency_ms"] = overall.summary(latency_samples)
+            return {"uptime": time.time() - self.started, "endpoints": endpoints, "totals": totals}
+
+
+def prometheus_text(diagnostics, histograms, prefix="fnapi"):
+    # Prometheus text exposition of BaseFortniteAPI.diagnostics() and Metrics histograms
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text else f"{prefix}_{name} {value}")
+
+    endpoints = diagnostics["endpoints"]
+    for name, key, help_text in (
+        ("requests_total", "requests", "HTTP requests sent"),
+        ("request_errors_total", "errors", "HTTP requests that failed or returned 4xx/5xx"),
+        ("response_bytes_total", "bytes", "Response body bytes received"),
+        ("limiter_wait_seconds_total", "limiter_wait", "Time spent waiting on the rate limiter"),
+    ):
+        metric(name, "counter", help_text, [({"endpoint": ep}, stats[key]) for ep, stats in endpoints.items()])
+    metric("cache_lookups_total", "counter", "Memory cache lookups by result", [
+        ({"endpoint": ep, "result": result}, stats[key])
+        for ep, stats in endpoints.items() for result, key in (("hit", "cache_hits"), ("miss", "cache_misses"))
+    ])
+    for name, key, help_text in (
+        ("request_duration_seconds", "latency", "HTTP request latency"),
+        ("parse_duration_seconds", "parse", "JSON decode time"),
+    ):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} histogram")
+        for ep, hists in histograms.items():
+            hist = hists[key]
+            cumulative = 0
+            for bound, count in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else bound / 1000
+                lines.append(f'{prefix}_{name}_bucket{{endpoint="{ep}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_{name}_sum{{endpoint="{ep}"}} {hist.total / 1000}')
+            lines.append(f'{prefix}_{name}_count{{endpoint="{ep}"}} {hist.count}')
+    cache = diagnostics["cache"]
+    metric("cache_entries", "gauge", "Entries in the memory cache", [({}, cache["entries"])])
+    metric("cache_bytes", "gauge", "Serialized size of the memory cache", [({}, cache["bytes"])])
+    metric("cache_evictions_total", "counter", "Entries evicted from the memory cache", [({}, cache["evictions"])])
+    metric("cache_expired_total", "counter", "Lookups that found an expired entry", [({}, cache["expired"])])
+    limiter = diagnostics["limiter"]
+    metric("limiter_waits_total", "counter", "Requests that had to wait for the shared limiter", [({}, limiter["waits"])])
+    metric("limiter_paused_seconds", "gauge", "Remaining 429 pause", [({}, limiter["paused_for"])])
+    metric("http_responses_total", "counter", "Responses by HTTP status", [
+        ({"status": status}, count) for status, count in sorted(diagnostics["statuses"].items())
+    ])
+    transport = diagnostics["transport"]
+    metric("http_connections_total", "counter", "TCP connections opened", [({}, transport["connections"])])
+    metric("http_connections_reused_total", "counter", "Requests sent on a pooled connection",
+           [({}, transport["reused"])])
+    metric("http_compressed_responses_total", "counter", "Responses received with a Content-Encoding",
+           [({}, transport["compressed"])])
+    return "\n".join(lines) + "\n"
+
+
+class SnapshotMiss(LookupError):
+    pass
+
+
+class SnapshotResponse:
+    # The parts of requests.Response the client uses, for responses served from a snapshot
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"{self.status_code} Error for url: {self.url}")
+
+
+class SnapshotArchive:
+    # Gzip-compressed NDJSON file of request/response pairs, keyed like the cache.
+    # "record" appends every response the client receives; "replay" serves them back in
+    # recorded order (repeating the last one per key) and never touches the network.
+    def __init__(self, path, mode="replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown snapshot mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.file = None
+        self.responses = {}
+        self.positions = {}
+        if mode == "replay":
+            self.load()
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                self.responses.setdefault(record["key"], []).append(record)
+
+    def record(self, path, params, status, headers, body):
+        record = {
+            "key": cache_key(path, params),
+            "path": path,
+            "params": params or {},
+            "time": time.time(),
+            "status": status,
+            "headers": {name: headers[name] for name in SNAPSHOT_HEADERS if name in headers},
+            "body": body.decode("utf-8", "replace"),
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            if self.file is None:
+                # Appending adds a new gzip member, which readers handle transparently
+                self.file = gzip.open(self.path, "at", encoding="utf-8")
+            self.file.write(line)
+
+    def replay(self, path, params=None, conditional=False):
+        # Returns (status, headers, body) like AsyncFortniteAPI.fetch
+        key = cache_key(path, params)
+        with self.lock:
+            records = self.responses.get(key)
+            if not records:
+                raise SnapshotMiss(f"No recorded response for {key}")
+            position = self.positions.get(key, 0)
+            self.positions[key] = min(position + 1, len(records) - 1)
+            record = records[position]
+            if record["status"] == 304 and not conditional:
+                # Recorded against a warm cache; a cold one needs the full body
+                full = [r for r in records if r["status"] != 304]
+                if full:
+                    record = full[-1]
+        return record["status"], dict(record["headers"]), record["body"].encode("utf-8")
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class JsonArrayStream:
+    # Incremental decoder for a response like {"status": 200, "data": [item, item, ...]}.
+    # Iterating yields the items of one top-level array as soon as their bytes have
+    # arrived; the other top-level members end up in `extra`. Only the unparsed tail of
+    # the body is kept in memory.
+    def __init__(self, chunks, field="data"):
+        self.chunks = iter(chunks)
+        self.field = field
+        self.decoder = json.JSONDecoder()
+        self.text = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes = 0
+        self.parse_seconds = 0.0
+        self.extra = {}
+
+    def fill(self):
+        # Append the next chunk to the buffer; False once the input is exhausted
+        if self.eof:
+            return False
+        chunk = next(self.chunks, None)
+        if self.pos > STREAM_COMPACT_CHARS:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        if chunk is None:
+            self.eof = True
+            self.buf += self.text.decode(b"", final=True)
+        else:
+            self.bytes += len(chunk)
+            self.buf += self.text.decode(chunk)
+        return True
+
+    def peek(self):
+        # Next non-whitespace character, or "" at the end of the input
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError(f"Malformed JSON stream: expected {chars!r}, got {c or 'end of input'!r}")
+        self.pos += 1
+        return c
+
+    def value(self):
+        self.peek()
+        while True:
+            start = time.perf_counter()
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                self.parse_seconds += time.perf_counter() - start
+                # Incomplete: wait for the pending text to double so large values stay linear
+                pending = len(self.buf) - self.pos
+                while len(self.buf) - self.pos < 2 * pending and self.fill():
+                    pass
+                if self.eof and len(self.buf) - self.pos <= pending:
+                    raise
+                continue
+            self.parse_seconds += time.perf_counter() - start
+            # A number cut by a chunk boundary ("1." or "12") decodes as a shorter one; only
+            # accept it once the character after it is known to end the value
+            if (end == len(self.buf) or self.buf[end] not in " \t\r\n,:]}") and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+    def __iter__(self):
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            if key == self.field and self.peek() == "[":
+                self.pos += 1
+                if self.peek() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self.value()
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                self.extra[key] = self.value()
+            if self.expect(",}") == "}":
+                return
+
+
+class HttpTransport:
+    # The sync client's requests.Session: a connection pool sized for concurrent workers,
+    # TCP keep-alive on pooled connections, compressed responses (whatever urllib3 can
+    # decode here: gzip and deflate, br with brotli installed, zstd with zstandard) and an
+    # Authorization header that can be swapped without dropping warm connections.
+    def __init__(self, api_key, pool_size=HTTP_POOL_SIZE, keep_alive=True, keepalive_idle=HTTP_KEEPALIVE_SECONDS):
+        self.api_key = api_key
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.keepalive_idle = keepalive_idle
+        self.session = None
+        self.requests = 0
+        self.connections = 0
+        self.compressed = 0
+        self.lock = threading.Lock()
+
+    def get_session(self):
+        with self.lock:
+            if self.session is None:
+                self.session = self.build_session()
+            return self.session
+
+    def build_session(self):
+        import socket
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        transport = self
+
+        class Counted:
+            # Counts every TCP (and TLS) connect, including reconnects of a pooled connection
+            def connect(self):
+                super().connect()
+                with transport.lock:
+                    transport.connections += 1
+
+        options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive:
+            # Probes keep idle pooled connections from being dropped silently by NATs and proxies
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle))
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=self.pool_size)
+        adapter.init_poolmanager(HTTP_POOL_HOSTS, self.pool_size, socket_options=options)
+        adapter.poolmanager.pool_classes_by_scheme = {
+            "http": type("CountedHTTPPool", (HTTPConnectionPool,), {
+                "ConnectionCls": type("CountedHTTPConnection", (Counted, HTTPConnection), {}),
+            }),
+            "https": type("CountedHTTPSPool", (HTTPSConnectionPool,), {
+                "ConnectionCls": type("CountedHTTPSConnection", (Counted, HTTPSConnection), {}),
+            }),
+        }
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Authorization": self.api_key, "Accept-Encoding": ACCEPT_ENCODING})
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def set_api_key(self, api_key):
+        # Requests already in flight keep the key they were sent with
+        with self.lock:
+            self.api_key = api_key
+            if self.session is not None:
+                self.session.headers["Authorization"] = api_key
+
+    def get(self, url, **kwargs):
+        r = self.get_session().get(url, **kwargs)
+        with self.lock:
+            self.requests += 1
+            if r.headers.get("Content-Encoding"):
+                self.compressed += 1
+        return r
+
+    def stats(self):
+        with self.lock:
+            sent, connections, compressed = self.requests, self.connections, self.compressed
+        return {
+            "pool_size": self.pool_size,
+            "keep_alive": self.keep_alive,
+            "requests": sent,
+            "connections": connections,
+            "reused": max(0, sent - connections),
+            "reuse_ratio": max(0, sent - connections) / sent if sent else 0.0,
+            "compressed": compressed,
+        }
+
+    def close(self):
+        with self.lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+
+class BaseFortniteAPI:
+    # Shared by the sync and async clients: caching, limiter, counters and the endpoint
+    # methods. Subclasses provide get(), which may return a coroutine.
     BASE_URL = "https://fortnite-api.com"
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, limiter=None, cache=None, store=None, base_url=None, snapshot=None, metrics=None):
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": api_key})
-        self.cache = self.load_cache()
-        self.last_call_time = 0
-
-    def load_cache(self):
-        if os.path.exists(CACHE_FILE):
-            try:
-                return json.load(open(CACHE_FILE, "r", encoding="utf-8"))
-            except Exception:
-                return {}
-        return {}
-
-    def save_cache(self):
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.cache, f, indent=2)
-
-    def rate_limit(self):
-        elapsed = time.time() - self.last_call_time
-        if elapsed < RATE_LIMIT_SECONDS:
-            time.sleep(RATE_LIMIT_SECONDS - elapsed)
-        self.last_call_time = time.time()
-
-    def get(self, path, params=None):
-        key = f"{path} {params}"
-        if key in self.cache:
-            return self.cache[key]
-        self.rate_limit()
-        url = f"{self.BASE_URL}{path}"
-        try:
-            r = self.session.get(url, params=params, timeout=10)
-            r.raise_for_status()
-            data = r.json()
-            self.cache[key] = data
-            self.save_cache()
-            return data
-        except Exception as e:
-            return {"error": str(e)}
+        self.snapshot = snapshot
+        self.metrics = Metrics() if metrics is None else metrics
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+        self.cache = ResponseCache() if cache is None else cache
+        if store is None:
+            # Replay must neither be answered from nor write to the user's real cache
+            replaying = snapshot is not None and snapshot.mode == "replay"
+            store = DiskCache(":memory:", legacy_path=None) if replaying else DiskCache()
+        self.store = store
+        self.limiter = rate_limiter if limiter is None else limiter
+        self.status_counts = {}
+        self.stats_lock = threading.Lock()
+
+    def load_cache(self, key):
+        # Memory first, then the on-disk store. Stale entries are returned (and promoted)
+        # too so their validators can be used for revalidation.
+        entry = self.cache.peek(key)
+        if entry is not None:
+            return entry
+        entry = self.store.get(key)
+        if entry is not None:
+            entry["data"] = parse_response(cache_key_path(key), entry["data"])
+            self.cache.put(
+                key, entry["data"], entry["expires"], stored=entry["time"], size=entry["size"],
+                etag=entry["etag"], last_modified=entry["last_modified"],
+            )
+        return entry
+
+    def save_cache(self, key, data, expires, etag=None, last_modified=None):
+        # data may hold models; the disk copy is their compact JSON form
+        text = to_json(data)
+        self.cache.put(key, data, expires, size=len(text), etag=etag, last_modified=last_modified)
+        self.store.put(key, data, expires, text=text, etag=etag, last_modified=last_modified)
+
+    def refresh_cache(self, key, expires):
+        self.cache.refresh(key, expires)
+        self.store.touch(key, expires)
+
+    def cache_entry(self, path, params=None):
+        # Cached entry (with its stored/expires times) if this endpoint has been fetched
+        return self.cache.peek(cache_key(path, params))
+
+    def count_status(self, status):
+        with self.stats_lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def inflight_stats(self):
+        return self.inflight.stats()
+
+    def transport_stats(self):
+        return self.transport.stats()
+
+    def set_api_key(self, api_key):
+        # New key for the following requests; the session, its connections and the cache stay
+        self.api_key = api_key
+        self.transport.set_api_key(api_key)
+
+    def diagnostics(self):
+        # Everything the Diagnostics tab and the metrics export show, as plain data
+        report = self.metrics.snapshot()
+        report["cache"] = self.cache.stats()
+        report["limiter"] = self.limiter.stats()
+        report["single_flight"] = self.inflight_stats()
+        report["transport"] = self.transport_stats()
+        with self.stats_lock:
+            report["statuses"] = dict(self.status_counts)
+        return report
+
+    def export_metrics(self, fmt="json"):
+        if fmt == "prometheus":
+            return prometheus_text(self.diagnostics(), self.metrics.histograms())
+        return json.dumps(self.diagnostics(), indent=2)
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def retry_delay(self, status, headers, attempt):
+        # Seconds to wait before retrying this response, or None to return it as is.
+        # 429 honours Retry-After and pauses the shared limiter, 5xx backs off with jitter.
+        if attempt == MAX_RETRIES:
+            return None
+        if status == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            self.limiter.pause(backoff_delay(attempt) if retry_after is None else retry_after)
+            return 0.0
+        if status >= 500:
+            return backoff_delay(attempt)
+        return None
 
     def get_cosmetics(self, search=""):
         return self.get("/v2/cosmetics/br/search/all", params={"name": search} if search else None)
@@ -96,584 +1207,1420 @@ class FortniteAPI:
         return self.get(f"/v2/creatorcode/{creator_code}")
 
 
-class FortniteApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("fortnite-api.com")
-        self.api_key = ""
-        self.api = None
-        self.history = self.load_history()
-        self.load_config()
-
-        self.create_widgets()
-
-    def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                    self.api_key = cfg.get("api_key", "")
-                    if self.api_key:
-                        self.api = FortniteAPI(self.api_key)
-            except Exception:
-                pass
-
-    def save_config(self):
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump({"api_key": self.api_key}, f, indent=2)
-
-    def load_history(self):
-        if os.path.exists(HISTORY_FILE):
+class FortniteAPI(BaseFortniteAPI):
+    def __init__(self, api_key, limiter=None, cache=None, store=None, base_url=None, snapshot=None, metrics=None,
+                 pool_size=HTTP_POOL_SIZE, keep_alive=True):
+        super().__init__(
+            api_key, limiter=limiter, cache=cache, store=store, base_url=base_url, snapshot=snapshot, metrics=metrics
+        )
+        self.transport = HttpTransport(api_key, pool_size=pool_size, keep_alive=keep_alive)
+        self.inflight = SingleFlight()
+
+    def close(self):
+        self.transport.close()
+
+    def rate_limit(self, path=""):
+        waited = self.limiter.acquire(path)
+        self.metrics.record_wait(path, waited)
+        return waited
+
+    def fetch(self, url, params=None, headers=None, path="", stream=False):
+        # Rate-limited GET with retries on 429, 5xx and network errors. With stream=True the
+        # body is left unread for the caller (who must close the response).
+        if self.snapshot is not None and self.snapshot.mode == "replay":
+            status, resp_headers, body = self.snapshot.replay(path, params, conditional=bool(headers))
+            self.count_status(status)
+            self.metrics.record_request(path, 0.0, status, len(body))
+            return SnapshotResponse(url, status, resp_headers, body)
+        import requests
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.rate_limit(path)
+            start = time.perf_counter()
             try:
-                return json.load(open(HISTORY_FILE, "r", encoding="utf-8"))
-            except Exception:
-                return {}
-        return {}
-
-    def save_history(self):
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, indent=2)
-
-    def add_history(self, category, entry):
-        if category not in self.history:
-            self.history[category] = []
-        self.history[category].append({"time": time.strftime("%Y-%m-%d %H:%M:%S"), "entry": entry})
-        # Limit to last 25
-        if len(self.history[category]) > 25:
-            self.history[category] = self.history[category][-25:]
-        self.save_history()
-
-    def create_widgets(self):
-        # Create Credits button on top right
-        credits_btn = ttk.Button(self.root, text="Credits", command=self.show_credits)
-        credits_btn.pack(anchor="ne", padx=10, pady=5)
-
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(expand=True, fill="both")
-
-        # Create all tabs
-        self.tabs = {}
-
-        tab_names = [
-            "Cosmetics", "News", "Stats", "Shop", "Map Info", "Season Info",
-            "Languages", "Upcoming", "Creative", "Paks", "Banners",
-            "AES Decrypt", "Creator Codes", "Settings"
-        ]
+                r = self.transport.get(url, params=params, headers=headers, timeout=10, stream=stream)
+            except (requests.Timeout, requests.ConnectionError):
+                self.metrics.record_request(path, time.perf_counter() - start, None, 0)
+                if attempt == MAX_RETRIES:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+            size = 0 if stream else len(r.content)
+            self.metrics.record_request(path, time.perf_counter() - start, r.status_code, size)
+            self.count_status(r.status_code)
+            delay = self.retry_delay(r.status_code, r.headers, attempt)
+            if delay is None:
+                if self.snapshot is not None:
+                    self.snapshot.record(path, params, r.status_code, r.headers, r.content)
+                return r
+            r.close()
+            time.sleep(delay)
 
-        for name in tab_names:
-            frame = ttk.Frame(self.notebook)
-            self.notebook.add(frame, text=name)
-            self.tabs[name] = frame
-
-        self.build_cosmetics_tab()
-        self.build_news_tab()
-        self.build_stats_tab()
-        self.build_shop_tab()
-        self.build_map_tab()
-        self.build_season_tab()
-        self.build_languages_tab()
-        self.build_upcoming_tab()
-        self.build_creative_tab()
-        self.build_paks_tab()
-        self.build_banners_tab()
-        self.build_aes_tab()
-        self.build_creator_code_tab()
-        self.build_settings_tab()
-
-        self.status_label = ttk.Label(self.root, text="Welcome to fortnite-api.com", relief=tk.SUNKEN, anchor="w")
-        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
-
-    def show_credits(self):
-        messagebox.showinfo("Credits", "Created by:\n\nhbkvxncent\nynwglobal")
-
-    def set_status(self, text):
-        self.status_label.config(text=text)
-
-    # --- Build individual tabs ---
-
-    def build_cosmetics_tab(self):
-        tab = self.tabs["Cosmetics"]
-        ttk.Label(tab, text="Search Cosmetics by Name:").pack(anchor="w", padx=5, pady=5)
-        self.cos_search_var = tk.StringVar()
-        search_entry = ttk.Entry(tab, textvariable=self.cos_search_var)
-        search_entry.pack(fill="x", padx=5)
-        search_entry.bind("<Return>", lambda e: self.threaded(self.do_cosmetics_search)())
-
-        search_btn = ttk.Button(tab, text="Search", command=self.threaded(self.do_cosmetics_search))
-        search_btn.pack(pady=5)
-
-        self.cos_results = scrolledtext.ScrolledText(tab, height=15, wrap=tk.WORD)
-        self.cos_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_cosmetics_search(self):
-        query = self.cos_search_var.get().strip()
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+    def get(self, path, params=None):
+        key = cache_key(path, params)
+        cached = self.cache.get(key)
+        self.metrics.record_cache(path, cached is not None)
+        if cached is not None:
+            return cached
+        return self.inflight.do(key, lambda: self.fetch_and_cache(key, path, params))
+
+    def stream(self, path, params=None, field="data", cache=True):
+        # Items of the response's `field` array, yielded as they are parsed off the wire, so
+        # the first rows are available after one round trip. Items of LIST_MODELS endpoints
+        # come out as models. The complete response is cached
+        # afterwards unless cache=False. Cached responses and snapshots are served whole.
+        if self.snapshot is not None:
+            data = self.get(path, params)
+            if "error" in data:
+                raise RuntimeError(data["error"])
+            yield from data.get(field) or []
             return
-        if not query:
-            messagebox.showinfo("Input Required", "Please enter a cosmetic name to search.")
+        key = cache_key(path, params)
+        cached = self.cache.get(key)
+        self.metrics.record_cache(path, cached is not None)
+        entry = None
+        if cached is None:
+            entry = self.load_cache(key)
+            if entry is not None and entry["expires"] > time.time():
+                cached = entry["data"]
+        if cached is not None:
+            yield from cached.get(field) or []
             return
+        r = self.fetch(
+            f"{self.BASE_URL}{path}", params=params, headers=self.conditional_headers(entry), path=path, stream=True
+        )
+        try:
+            if r.status_code == 304 and entry is not None:
+                self.refresh_cache(key, cache_expiry(path))
+                yield from entry["data"].get(field) or []
+                return
+            r.raise_for_status()
+            parser = JsonArrayStream(r.iter_content(STREAM_CHUNK_BYTES), field)
+            model = LIST_MODELS.get(path) if field == "data" else None
+            items = [] if cache else None
+            for item in parser:
+                if model is not None:
+                    item = model.from_api(item)
+                if items is not None:
+                    items.append(item)
+                yield item
+            self.metrics.record_stream(path, parser.bytes, parser.parse_seconds)
+            if items is not None:
+                data = dict(parser.extra)
+                data.setdefault(field, items)
+                self.save_cache(
+                    key, data, cache_expiry(path),
+                    etag=r.headers.get("ETag"), last_modified=r.headers.get("Last-Modified"),
+                )
+        finally:
+            r.close()
+
+    def stream_cosmetics(self, search=""):
+        return self.stream("/v2/cosmetics/br/search/all", params={"name": search} if search else None)
+
+    def stream_creative(self):
+        return self.stream("/v2/creative/islands")
+
+    def stream_paks(self):
+        return self.stream("/v2/paks")
+
+    def stream_banners(self):
+        return self.stream("/v1/banners")
+
+    def fetch_and_cache(self, key, path, params=None):
+        # Checks the cache again: another caller may have filled it since our miss
+        entry = self.load_cache(key)
+        if entry is not None and entry["expires"] > time.time():
+            return entry["data"]
+        headers = self.conditional_headers(entry)
+        url = f"{self.BASE_URL}{path}"
+        try:
+            r = self.fetch(url, params=params, headers=headers, path=path)
+            if r.status_code == 304 and entry is not None:
+                self.refresh_cache(key, cache_expiry(path))
+                return entry["data"]
+            r.raise_for_status()
+            start = time.perf_counter()
+            data = parse_response(path, r.json())
+            self.metrics.record_parse(path, time.perf_counter() - start)
+            self.save_cache(
+                key, data, cache_expiry(path),
+                etag=r.headers.get("ETag"), last_modified=r.headers.get("Last-Modified"),
+            )
+            return data
+        except Exception as e:
+            return {"error": str(e)}
 
-        self.set_status(f"Searching cosmetics for '{query}'...")
-        data = self.api.get_cosmetics(query)
-        self.set_status("Search complete.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
 
-        items = data.get("data", [])
-        output = []
-        for item in items:
-            output.append(f"Name: {item.get('name')}")
-            output.append(f"Type: {item.get('type', {}).get('value')}")
-            output.append(f"Rarity: {item.get('rarity', {}).get('value')}")
-            output.append(f"ID: {item.get('id')}")
-            output.append("-" * 40)
-
-        self.cos_results.delete(1.0, tk.END)
-        self.cos_results.insert(tk.END, "\n".join(output))
-        self.add_history("cosmetics", query)
-
-    def build_news_tab(self):
-        tab = self.tabs["News"]
-        refresh_btn = ttk.Button(tab, text="Refresh News", command=self.threaded(self.do_news_refresh))
-        refresh_btn.pack(pady=5)
-        self.news_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.news_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_news_refresh(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching news...")
-        data = self.api.get_news()
-        self.set_status("News fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+class AsyncFortniteAPI(BaseFortniteAPI):
+    # asyncio client on one pooled aiohttp session. Same endpoint methods as FortniteAPI
+    # (awaitable here), bounded concurrency, and the same cache and rate-limit policy.
+    def __init__(self, api_key, limiter=None, cache=None, store=None, base_url=None, snapshot=None, metrics=None,
+                 max_concurrency=ASYNC_MAX_CONCURRENCY, keep_alive=True):
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("AsyncFortniteAPI requires aiohttp (pip install aiohttp)") from None
+        self.aiohttp = aiohttp
+        super().__init__(
+            api_key, limiter=limiter, cache=cache, store=store, base_url=base_url, snapshot=snapshot, metrics=metrics
+        )
+        self.max_concurrency = max_concurrency
+        self.keep_alive = keep_alive
+        self.session = None
+        self.semaphore = None
+        self.connection_counts = {"requests": 0, "connections": 0, "reused": 0, "compressed": 0}
+        self.inflight = {}
+        self.started = 0
+        self.collapsed = 0
+
+    @classmethod
+    def from_client(cls, api, **kwargs):
+        # Share the sync client's cache, store, limiter and keep-alive setting
+        kwargs.setdefault("keep_alive", api.transport.keep_alive)
+        return cls(
+            api.api_key, limiter=api.limiter, cache=api.cache, store=api.store, base_url=api.BASE_URL,
+            snapshot=api.snapshot, metrics=api.metrics, **kwargs
+        )
 
-        news_items = data.get("data", {}).get("br", {}).get("motds", [])
-        output = []
-        for n in news_items:
-            output.append(f"Title: {n.get('title')}")
-            output.append(f"Body: {n.get('body')}")
-            output.append("-" * 40)
-
-        self.news_results.delete(1.0, tk.END)
-        self.news_results.insert(tk.END, "\n".join(output))
-        self.add_history("news", "refresh")
-
-    def build_stats_tab(self):
-        tab = self.tabs["Stats"]
-        ttk.Label(tab, text="Enter Epic Username:").pack(anchor="w", padx=5, pady=5)
-        self.stats_user_var = tk.StringVar()
-        user_entry = ttk.Entry(tab, textvariable=self.stats_user_var)
-        user_entry.pack(fill="x", padx=5)
-        user_entry.bind("<Return>", lambda e: self.threaded(self.do_stats_lookup)())
-
-        stats_btn = ttk.Button(tab, text="Lookup Stats", command=self.threaded(self.do_stats_lookup))
-        stats_btn.pack(pady=5)
-
-        self.stats_results = scrolledtext.ScrolledText(tab, height=25, wrap=tk.WORD)
-        self.stats_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def format_stat_category(self, category_name, stats_dict):
-        # Format each category (Overall, Solo, Duo, Squad, LTM) neat and readable
-        lines = [f"=== {category_name} Stats ==="]
-        # Select keys and display in neat order with friendly names and formatting
-        keys_order = [
-            ("score", "Score"),
-            ("scorePerMin", "Score Per Minute"),
-            ("scorePerMatch", "Score Per Match"),
-            ("wins", "Wins"),
-            ("top3", "Top 3 Finishes"),
-            ("top5", "Top 5 Finishes"),
-            ("top6", "Top 6 Finishes"),
-            ("top10", "Top 10 Finishes"),
-            ("top12", "Top 12 Finishes"),
-            ("top25", "Top 25 Finishes"),
-            ("kills", "Kills"),
-            ("killsPerMin", "Kills Per Minute"),
-            ("killsPerMatch", "Kills Per Match"),
-            ("deaths", "Deaths"),
-            ("kd", "K/D Ratio"),
-            ("matches", "Matches Played"),
-            ("winRate", "Win Rate (%)"),
-            ("minutesPlayed", "Minutes Played"),
-            ("playersOutlived", "Players Outlived"),
-            ("lastModified", "Last Modified"),
-        ]
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def get_session(self):
+        import asyncio
+
+        # Created lazily so it binds to the loop that actually runs the requests. aiohttp
+        # negotiates compression itself (gzip and deflate, br with brotli installed).
+        if self.session is None:
+            trace = self.aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self.count_connection("connections"))
+            trace.on_connection_reuseconn.append(self.count_connection("reused"))
+            if self.keep_alive:
+                connector = self.aiohttp.TCPConnector(
+                    limit=self.max_concurrency, keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+                )
+            else:
+                connector = self.aiohttp.TCPConnector(limit=self.max_concurrency, force_close=True)
+            self.session = self.aiohttp.ClientSession(
+                headers={"Authorization": self.api_key},
+                timeout=self.aiohttp.ClientTimeout(total=10),
+                connector=connector,
+                trace_configs=[trace],
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    def count_connection(self, key):
+        async def on_event(session, context, params):
+            self.connection_counts[key] += 1
+
+        return on_event
+
+    def set_api_key(self, api_key):
+        # Call on the loop thread; the session's default headers apply to later requests
+        self.api_key = api_key
+        if self.session is not None:
+            self.session.headers["Authorization"] = api_key
+
+    def transport_stats(self):
+        counts = dict(self.connection_counts)
+        counts["reuse_ratio"] = counts["reused"] / counts["requests"] if counts["requests"] else 0.0
+        counts["pool_size"] = self.max_concurrency
+        counts["keep_alive"] = self.keep_alive
+        return counts
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def rate_limit(self, path=""):
+        import asyncio
+
+        delay = self.limiter.reserve(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        remaining = self.limiter.paused_until - time.monotonic()
+        while remaining > 0:
+            await asyncio.sleep(remaining)
+            delay += remaining
+            remaining = self.limiter.paused_until - time.monotonic()
+        self.metrics.record_wait(path, delay)
+        return delay
+
+    async def fetch(self, url, params=None, headers=None, path=""):
+        import asyncio
+
+        # Returns (status, headers, body) after the same retry policy as FortniteAPI.fetch
+        if self.snapshot is not None and self.snapshot.mode == "replay":
+            status, resp_headers, body = self.snapshot.replay(path, params, conditional=bool(headers))
+            self.count_status(status)
+            self.metrics.record_request(path, 0.0, status, len(body))
+            return status, resp_headers, body
+        session = self.get_session()
+        for attempt in range(MAX_RETRIES + 1):
+            await self.rate_limit(path)
+            try:
+                async with self.semaphore:
+                    start = time.perf_counter()
+                    async with session.get(url, params=params, headers=headers) as r:
+                        status, resp_headers, body = r.status, r.headers, await r.read()
+                self.connection_counts["requests"] += 1
+                if resp_headers.get("Content-Encoding"):
+                    self.connection_counts["compressed"] += 1
+            except (asyncio.TimeoutError, self.aiohttp.ClientConnectionError):
+                self.metrics.record_request(path, time.perf_counter() - start, None, 0)
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            self.metrics.record_request(path, time.perf_counter() - start, status, len(body))
+            self.count_status(status)
+            delay = self.retry_delay(status, resp_headers, attempt)
+            if delay is None:
+                if self.snapshot is not None:
+                    self.snapshot.record(path, params, status, resp_headers, body)
+                return status, resp_headers, body
+            await asyncio.sleep(delay)
+
+    async def get(self, path, params=None):
+        import asyncio
+
+        key = cache_key(path, params)
+        cached = self.cache.get(key)
+        self.metrics.record_cache(path, cached is not None)
+        if cached is not None:
+            return cached
+        # Concurrent callers for the same key await one shared task
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.fetch_and_cache(key, path, params))
+            self.inflight[key] = task
+            task.add_done_callback(lambda t: self.inflight.pop(key, None))
+            self.started += 1
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(task)
 
-        for key, label in keys_order:
-            if key in stats_dict:
-                value = stats_dict[key]
-                # Format floats nicely
-                if isinstance(value, float):
-                    value = f"{value:.3f}"
-                lines.append(f"{label}: {value}")
-        lines.append("")  # blank line for spacing
-        return "\n".join(lines)
-
-    def do_stats_lookup(self):
-        username = self.stats_user_var.get().strip()
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        if not username:
-            messagebox.showinfo("Input Required", "Please enter an Epic username.")
-            return
+    async def fetch_and_cache(self, key, path, params=None):
+        import asyncio
 
-        self.set_status(f"Fetching stats for {username}...")
-        data = self.api.get_stats(username)
-        self.set_status("Stats fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+        entry = await asyncio.to_thread(self.load_cache, key)
+        if entry is not None and entry["expires"] > time.time():
+            return entry["data"]
+        headers = self.conditional_headers(entry)
+        url = f"{self.BASE_URL}{path}"
+        try:
+            status, resp_headers, body = await self.fetch(url, params=params, headers=headers, path=path)
+            if status == 304 and entry is not None:
+                await asyncio.to_thread(self.refresh_cache, key, cache_expiry(path))
+                return entry["data"]
+            if status >= 400:
+                raise RuntimeError(f"{status} Error for url: {url}")
+            start = time.perf_counter()
+            data = parse_response(path, json.loads(body))
+            self.metrics.record_parse(path, time.perf_counter() - start)
+            await asyncio.to_thread(
+                self.save_cache, key, data, cache_expiry(path),
+                resp_headers.get("ETag"), resp_headers.get("Last-Modified"),
+            )
+            return data
+        except Exception as e:
+            return {"error": str(e)}
 
-        stats_data = data.get("data", {}).get("stats", {}).get("all", {})
+    def inflight_stats(self):
+        return {"in_flight": len(self.inflight), "started": self.started, "collapsed": self.collapsed}
 
-        # Categories to format: Overall, Solo, Duo, Squad, Ltm
-        output_sections = []
-        for cat in ["overall", "solo", "duo", "squad", "ltm"]:
-            cat_stats = stats_data.get(cat, {})
-            if cat_stats:
-                name = cat.capitalize()
-                section_text = self.format_stat_category(name, cat_stats)
-                output_sections.append(section_text)
 
-        if not output_sections:
-            self.stats_results.delete(1.0, tk.END)
-            self.stats_results.insert(tk.END, "No stats available for this user.")
-        else:
-            self.stats_results.delete(1.0, tk.END)
-            self.stats_results.insert(tk.END, "\n".join(output_sections))
+class AsyncLoopThread:
+    # Runs an asyncio loop in a daemon thread so synchronous code such as the Tk app can
+    # submit coroutines and get concurrent.futures.Future objects back.
+    def __init__(self):
+        import asyncio
 
-        self.add_history("stats", username)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
 
-    def build_shop_tab(self):
-        tab = self.tabs["Shop"]
-        refresh_btn = ttk.Button(tab, text="Refresh Shop", command=self.threaded(self.do_shop_refresh))
-        refresh_btn.pack(pady=5)
-        self.shop_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.shop_results.pack(expand=True, fill="both", padx=5, pady=5)
+    def submit(self, coro):
+        import asyncio
 
-    def do_shop_refresh(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
 
-        self.set_status("Fetching shop data...")
-        data = self.api.get_shop()
-        self.set_status("Shop data fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
 
-        items = data.get("data", {}).get("featured", []) + data.get("data", {}).get("daily", [])
-        output = []
-        for item in items:
-            output.append(f"{item.get('name')} - Price: {item.get('price')} V-Bucks - Rarity: {item.get('rarity', {}).get('value')}")
-            output.append("-" * 40)
-
-        self.shop_results.delete(1.0, tk.END)
-        self.shop_results.insert(tk.END, "\n".join(output))
-        self.add_history("shop", "refresh")
-
-    def build_map_tab(self):
-        tab = self.tabs["Map Info"]
-        refresh_btn = ttk.Button(tab, text="Refresh Map Info", command=self.threaded(self.do_map_info))
-        refresh_btn.pack(pady=5)
-        self.map_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.map_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_map_info(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching map info...")
-        data = self.api.get_map()
-        self.set_status("Map info fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
 
-        pois = data.get("data", {}).get("pois", [])
-        output = []
-        for p in pois:
-            coords = p.get("coordinates", "")
-            output.append(f"{p.get('name')} - Coordinates: {coords}")
-        self.map_results.delete(1.0, tk.END)
-        self.map_results.insert(tk.END, "\n".join(output))
-
-    def build_season_tab(self):
-        tab = self.tabs["Season Info"]
-        refresh_btn = ttk.Button(tab, text="Refresh Season Info", command=self.threaded(self.do_season_info))
-        refresh_btn.pack(pady=5)
-        self.season_results = scrolledtext.ScrolledText(tab, height=10, wrap=tk.WORD)
-        self.season_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_season_info(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching season info...")
-        data = self.api.get_season()
-        self.set_status("Season info fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+# Typed models for the endpoints the app renders. Responses are parsed into these once,
+# on arrival, and the memory cache holds them as they are. Only the displayed fields are
+# kept, and strings that repeat across items (rarity, type, set names) are interned.
+# to_dict() gives the compact JSON form written to the disk cache and printed by the
+# CLI. It uses the API's own key names, so from_api() reads it back as well.
+
+def api_str(value):
+    # Accepts both the API's {"value": ..., "displayValue": ...} objects and plain strings
+    if isinstance(value, dict):
+        value = value.get("value")
+    return value if isinstance(value, str) else ""
+
+
+class Model:
+    __slots__ = ()
 
-        d = data.get("data", {})
-        text = (
-            f"Chapter: {d.get('chapter')}\n"
-            f"Season: {d.get('season')}\n"
-            f"Start Date: {d.get('startDate')}\n"
-            f"End Date: {d.get('endDate')}"
+    def values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.values() == other.values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def parse_list(cls, items):
+        return [cls.from_api(item) for item in items or () if isinstance(item, dict)]
+
+
+class Cosmetic(Model):
+    __slots__ = ("id", "name", "type", "rarity", "set")
+
+    def __init__(self, id, name, type, rarity, set):
+        self.id = id
+        self.name = name
+        self.type = sys.intern(type)
+        self.rarity = sys.intern(rarity)
+        self.set = sys.intern(set)
+
+    @classmethod
+    def from_api(cls, item):
+        return cls(
+            item.get("id") or "", item.get("name") or "", api_str(item.get("type")),
+            api_str(item.get("rarity")), api_str(item.get("set")),
         )
-        self.season_results.delete(1.0, tk.END)
-        self.season_results.insert(tk.END, text)
-
-    def build_languages_tab(self):
-        tab = self.tabs["Languages"]
-        refresh_btn = ttk.Button(tab, text="Refresh Languages", command=self.threaded(self.do_languages_list))
-        refresh_btn.pack(pady=5)
-        self.lang_results = scrolledtext.ScrolledText(tab, height=15, wrap=tk.WORD)
-        self.lang_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_languages_list(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching languages...")
-        data = self.api.get_languages()
-        self.set_status("Languages fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
 
-        languages = data.get("data", [])
-        output = [f"{l.get('code')}: {l.get('name')}" for l in languages]
-        self.lang_results.delete(1.0, tk.END)
-        self.lang_results.insert(tk.END, "\n".join(output))
-
-    def build_upcoming_tab(self):
-        tab = self.tabs["Upcoming"]
-        refresh_btn = ttk.Button(tab, text="Refresh Upcoming Cosmetics", command=self.threaded(self.do_upcoming))
-        refresh_btn.pack(pady=5)
-        self.upcoming_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.upcoming_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_upcoming(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching upcoming cosmetics...")
-        data = self.api.get_upcoming()
-        self.set_status("Upcoming cosmetics fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+    def to_dict(self):
+        return {"id": self.id, "name": self.name, "type": self.type, "rarity": self.rarity, "set": self.set}
 
-        items = data.get("data", [])
-        output = []
-        for item in items:
-            output.append(f"{item.get('name')} ({item.get('type', {}).get('value')})")
-            output.append("-" * 40)
-
-        self.upcoming_results.delete(1.0, tk.END)
-        self.upcoming_results.insert(tk.END, "\n".join(output))
-
-    def build_creative_tab(self):
-        tab = self.tabs["Creative"]
-        refresh_btn = ttk.Button(tab, text="Refresh Creative Islands", command=self.threaded(self.do_creative))
-        refresh_btn.pack(pady=5)
-        self.creative_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.creative_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_creative(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching creative islands...")
-        data = self.api.get_creative()
-        self.set_status("Creative islands fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
 
-        islands = data.get("data", [])
-        output = []
-        for island in islands:
-            output.append(f"{island.get('title')} by {island.get('creatorName')}")
-            output.append(f"Code: {island.get('code')}")
-            output.append("-" * 40)
-
-        self.creative_results.delete(1.0, tk.END)
-        self.creative_results.insert(tk.END, "\n".join(output))
-
-    def build_paks_tab(self):
-        tab = self.tabs["Paks"]
-        refresh_btn = ttk.Button(tab, text="Refresh Paks Info", command=self.threaded(self.do_paks))
-        refresh_btn.pack(pady=5)
-        self.paks_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.paks_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_paks(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching paks info...")
-        data = self.api.get_paks()
-        self.set_status("Paks info fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+class ShopEntry(Model):
+    __slots__ = ("section", "id", "name", "price", "rarity")
 
-        paks = data.get("data", [])
-        output = []
-        for pak in paks:
-            output.append(f"Name: {pak.get('name')}")
-            output.append(f"Path: {pak.get('path')}")
-            output.append("-" * 40)
-
-        self.paks_results.delete(1.0, tk.END)
-        self.paks_results.insert(tk.END, "\n".join(output))
-
-    def build_banners_tab(self):
-        tab = self.tabs["Banners"]
-        refresh_btn = ttk.Button(tab, text="Refresh Banners", command=self.threaded(self.do_banners))
-        refresh_btn.pack(pady=5)
-        self.banners_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
-        self.banners_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_banners(self):
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        self.set_status("Fetching banners...")
-        data = self.api.get_banners()
-        self.set_status("Banners fetched.")
-        if "error" in data:
-            messagebox.showerror("API Error", data["error"])
-            return
+    def __init__(self, section, id, name, price, rarity):
+        self.section = sys.intern(section)
+        self.id = id
+        self.name = name
+        self.price = price
+        self.rarity = sys.intern(rarity)
 
-        banners = data.get("data", [])
-        output = []
-        for b in banners:
-            output.append(f"Name: {b.get('name')}")
-            output.append(f"Category: {b.get('category')}")
-            output.append("-" * 40)
-
-        self.banners_results.delete(1.0, tk.END)
-        self.banners_results.insert(tk.END, "\n".join(output))
-
-    def build_aes_tab(self):
-        tab = self.tabs["AES Decrypt"]
-        ttk.Label(tab, text="Enter Base64 Encrypted Text:").pack(anchor="w", padx=5, pady=5)
-        self.aes_input = tk.Text(tab, height=5)
-        self.aes_input.pack(fill="x", padx=5)
-
-        ttk.Label(tab, text="Enter Key (16, 24 or 32 chars):").pack(anchor="w", padx=5, pady=5)
-        self.aes_key_var = tk.StringVar()
-        aes_key_entry = ttk.Entry(tab, textvariable=self.aes_key_var, show="*")
-        aes_key_entry.pack(fill="x", padx=5)
-
-        decrypt_btn = ttk.Button(tab, text="Decrypt", command=self.do_aes_decrypt)
-        decrypt_btn.pack(pady=5)
-
-        ttk.Label(tab, text="Decrypted Text:").pack(anchor="w", padx=5, pady=5)
-        self.aes_output = scrolledtext.ScrolledText(tab, height=10, wrap=tk.WORD)
-        self.aes_output.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_aes_decrypt(self):
-        enc_text = self.aes_input.get("1.0", "end").strip()
-        key = self.aes_key_var.get()
-        if not enc_text or not key:
-            messagebox.showerror("Input Error", "Both encrypted text and key are required.")
-            return
+    @classmethod
+    def from_api(cls, item, section=""):
+        return cls(
+            item.get("section") or section, item.get("id") or "", item.get("name") or "", item.get("price"),
+            api_str(item.get("rarity")),
+        )
+
+    @classmethod
+    def parse_shop(cls, shop):
+        # The API groups entries by section; the compact form is already a flat list
+        if isinstance(shop, list):
+            return cls.parse_list(shop)
+        if not isinstance(shop, dict):
+            return []
+        return [
+            cls.from_api(item, label)
+            for key, label in (("featured", "Featured"), ("daily", "Daily"))
+            for item in shop.get(key) or () if isinstance(item, dict)
+        ]
+
+    def to_dict(self):
+        return {"section": self.section, "id": self.id, "name": self.name, "price": self.price, "rarity": self.rarity}
 
-        try:
-            raw = base64.b64decode(enc_text)
-            cipher = AES.new(key.encode("utf-8"), AES.MODE_ECB)
-            decrypted = cipher.decrypt(raw)
-            # Remove PKCS7 padding
-            pad_len = decrypted[-1]
-            decrypted = decrypted[:-pad_len]
-            self.aes_output.delete(1.0, tk.END)
-            self.aes_output.insert(tk.END, decrypted.decode("utf-8"))
-        except Exception as e:
-            messagebox.showerror("Decryption Error", str(e))
-
-    def build_creator_code_tab(self):
-        tab = self.tabs["Creator Codes"]
-        ttk.Label(tab, text="Enter Creator Code:").pack(anchor="w", padx=5, pady=5)
-        self.creator_code_var = tk.StringVar()
-        creator_code_entry = ttk.Entry(tab, textvariable=self.creator_code_var)
-        creator_code_entry.pack(fill="x", padx=5)
-        creator_code_entry.bind("<Return>", lambda e: self.threaded(self.do_creator_code_lookup)())
-
-        lookup_btn = ttk.Button(tab, text="Lookup", command=self.threaded(self.do_creator_code_lookup))
-        lookup_btn.pack(pady=5)
-
-        self.creator_code_results = scrolledtext.ScrolledText(tab, height=15, wrap=tk.WORD)
-        self.creator_code_results.pack(expand=True, fill="both", padx=5, pady=5)
-
-    def do_creator_code_lookup(self):
-        code = self.creator_code_var.get().strip()
-        if not self.api:
-            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
-            return
-        if not code:
-            messagebox.showinfo("Input Required", "Please enter a creator code.")
-            return
 
-        self.set_status(f"Looking up creator code '{code}'...")
-        data = self.api.get_creator_code(code)
-        self.set_status("Lookup complete.")
+class PlayerStats(Model):
+    # Each category is a tuple aligned with STAT_FIELDS (None where the API had no value)
+    # rather than a dict per category
+    __slots__ = ("name", "categories")
+
+    def __init__(self, name, categories):
+        self.name = name
+        self.categories = categories
+
+    @classmethod
+    def from_api(cls, data):
+        account = data.get("account") or {}
+        stats = (data.get("stats") or {}).get("all") or {}
+        categories = {}
+        for category in STAT_CATEGORIES:
+            values = stats.get(category)
+            if values:
+                categories[category] = tuple(values.get(key) for key, label in STAT_FIELDS)
+        return cls(account.get("name") or "", categories)
+
+    def category(self, name):
+        # {stat key: value} for the fields this category has, in STAT_FIELDS order
+        values = self.categories.get(name) or ()
+        return {key: value for (key, label), value in zip(STAT_FIELDS, values) if value is not None}
+
+    def to_dict(self):
+        return {
+            "account": {"name": self.name},
+            "stats": {"all": {category: self.category(category) for category in self.categories}},
+        }
+
+
+class Island(Model):
+    __slots__ = ("code", "title", "creator")
+
+    def __init__(self, code, title, creator):
+        self.code = code
+        self.title = title
+        self.creator = sys.intern(creator)
+
+    @classmethod
+    def from_api(cls, item):
+        return cls(item.get("code") or "", item.get("title") or "", item.get("creatorName") or "")
+
+    def to_dict(self):
+        return {"code": self.code, "title": self.title, "creatorName": self.creator}
+
+
+class Pak(Model):
+    __slots__ = ("name", "path")
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+
+    @classmethod
+    def from_api(cls, item):
+        return cls(item.get("name") or "", item.get("path") or "")
+
+    def to_dict(self):
+        return {"name": self.name, "path": self.path}
+
+
+class Banner(Model):
+    __slots__ = ("id", "name", "category")
+
+    def __init__(self, id, name, category):
+        self.id = id
+        self.name = name
+        self.category = sys.intern(category)
+
+    @classmethod
+    def from_api(cls, item):
+        return cls(item.get("id") or "", item.get("name") or "", item.get("category") or "")
+
+    def to_dict(self):
+        return {"id": self.id, "name": self.name, "category": self.category}
+
+
+# List endpoints whose items are parsed into a model; stream() yields these too
+LIST_MODELS = {
+    "/v2/cosmetics/br": Cosmetic,
+    "/v2/cosmetics/br/search/all": Cosmetic,
+    "/v2/creative/islands": Island,
+    "/v2/paks": Pak,
+    "/v1/banners": Banner,
+}
+
+
+def parse_response(path, data):
+    # Response with its payload replaced by models, for the endpoints that have them.
+    # Accepts raw API responses and the compact form alike.
+    payload = data.get("data") if isinstance(data, dict) else None
+    if payload is None:
+        return data
+    model = LIST_MODELS.get(path)
+    if model is not None:
+        parsed = model.parse_list(payload)
+    elif path == "/v2/cosmetics/br/new":
+        parsed = {
+            "hash": payload.get("hash") if isinstance(payload, dict) else None,
+            "items": Cosmetic.parse_list(new_cosmetic_items(data)),
+        }
+    elif path == "/v2/shop/br":
+        parsed = ShopEntry.parse_shop(payload)
+    elif path == "/v2/stats/br/v2" and isinstance(payload, dict):
+        parsed = PlayerStats.from_api(payload)
+    else:
+        return data
+    return dict(data, data=parsed)
+
+
+def model_json(obj):
+    # json.dumps default= hook for responses holding models
+    if isinstance(obj, Model):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json(data):
+    return json.dumps(data, separators=(",", ":"), default=model_json)
+
+
+def new_cosmetic_items(data):
+    # /v2/cosmetics/br/new has returned both a bare list and {"items": [...]} / {"items": {"br": [...]}}
+    d = data.get("data")
+    if isinstance(d, list):
+        return d
+    if isinstance(d, dict):
+        items = d.get("items")
+        if isinstance(items, dict):
+            items = items.get("br")
+        return items or []
+    return []
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+WORD_RE = re.compile(r"[\w']+")
+FUZZY_MIN_SCORE = 0.5  # Share of the query's trigrams a name must contain to count as a fuzzy match
+
+
+class CosmeticIndex:
+    # In-memory search index over name, type, rarity, set and ID: a sorted word list for
+    # prefix matches and a trigram index for substring and fuzzy matches.
+    def __init__(self, items):
+        self.items = items
+        self.texts = []
+        self.name_grams = []
+        self.ids = {}
+        self.names = []
+        self.words = []
+        self.grams = {}
+        self.name_index = {}
+        for i, item in enumerate(items):
+            fields = [item.name.lower(), item.type.lower(), item.rarity.lower(), item.set.lower(), item.id.lower()]
+            text = "\n".join(fields)
+            self.texts.append(text)
+            self.ids[fields[4]] = i
+            self.names.append((fields[0], i))
+            name_grams = trigrams(fields[0])
+            self.name_grams.append(name_grams)
+            for gram in name_grams:
+                self.name_index.setdefault(gram, []).append(i)
+            for word in set(WORD_RE.findall(text)):
+                self.words.append((word, i))
+            for gram in trigrams(text):
+                self.grams.setdefault(gram, set()).add(i)
+        self.names.sort()
+        self.words.sort()
+
+    def _prefix(self, pairs, prefix):
+        start = bisect.bisect_left(pairs, (prefix,))
+        for j in range(start, len(pairs)):
+            term, i = pairs[j]
+            if not term.startswith(prefix):
+                break
+            yield i
+
+    def search(self, query, limit=200):
+        # Ranked: exact ID, name prefix, word prefix, substring, then fuzzy by trigram similarity
+        q = query.strip().lower()
+        if not q:
+            return []
+        results = []
+        seen = set()
+
+        def add(indices):
+            for i in indices:
+                if i not in seen:
+                    seen.add(i)
+                    results.append(i)
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        if q in self.ids and add([self.ids[q]]):
+            return [self.items[i] for i in results]
+        if add(self._prefix(self.names, q)) or add(self._prefix(self.words, q)):
+            return [self.items[i] for i in results]
+
+        query_grams = trigrams(q) if len(q) >= 3 else set()
+        # Interior trigrams only, so the padding does not force word boundaries for substrings
+        inner = {q[i:i + 3] for i in range(len(q) - 2)}
+        if inner:
+            postings = sorted((self.grams.get(g, set()) for g in inner), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            if add(i for i in sorted(candidates) if q in self.texts[i]):
+                return [self.items[i] for i in results]
+
+        if query_grams:
+            scores = Counter()
+            for gram in query_grams:
+                scores.update(self.name_index.get(gram, ()))
+            needed = FUZZY_MIN_SCORE * len(query_grams)
+            ranked = []
+            for i, shared in scores.items():
+                if shared >= needed and i not in seen:
+                    # Ties on coverage go to the closest overall name
+                    similarity = shared / len(query_grams | self.name_grams[i])
+                    ranked.append((-shared, -similarity, i))
+            ranked.sort()
+            add(i for shared, similarity, i in ranked)
+        return [self.items[i] for i in results]
+
+
+class CosmeticsCatalog:
+    # Local copy of the full BR cosmetics list. Downloaded once, then kept current from
+    # /v2/cosmetics/br/new, so searching never needs the network.
+    def __init__(self, path=CATALOG_FILE):
+        self.path = path
+        self.items = {}
+        self.updated = 0
+        self.new_hash = None
+        self.index = None
+        self.lock = threading.Lock()
+
+    def available(self):
+        return self.index is not None
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except Exception:
+            return False
+        with self.lock:
+            self.items = {item.id: item for item in Cosmetic.parse_list(stored.get("items"))}
+            self.updated = stored.get("updated", 0)
+            self.new_hash = stored.get("new_hash")
+            self.index = CosmeticIndex(list(self.items.values()))
+        return True
+
+    def save(self):
+        with self.lock:
+            stored = {"updated": self.updated, "new_hash": self.new_hash, "items": list(self.items.values())}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(to_json(stored))
+        os.replace(tmp, self.path)
+
+    def download(self, api):
+        # Full list straight from the API, not through the response cache: the catalog file is its cache
+        # and items are parsed as they stream in, so the full payload is never held in memory
+        items = list(api.stream("/v2/cosmetics/br", cache=False))
+        with self.lock:
+            self.items = {item.id: item for item in items}
+            self.updated = time.time()
+            self.index = CosmeticIndex(list(self.items.values()))
+        self.save()
+        return len(items)
+
+    def refresh(self, api):
+        # Merge the latest additions; returns how many items were new or changed
+        data = api.get_upcoming()
         if "error" in data:
-            messagebox.showerror("API Error", data["error"])
+            raise RuntimeError(data["error"])
+        d = data.get("data")
+        new_hash = d.get("hash") if isinstance(d, dict) else None
+        if new_hash and new_hash == self.new_hash:
+            return 0
+        changed = 0
+        with self.lock:
+            for item in new_cosmetic_items(data):
+                if item.id and self.items.get(item.id) != item:
+                    self.items[item.id] = item
+                    changed += 1
+            self.new_hash = new_hash
+            self.updated = time.time()
+            if changed:
+                self.index = CosmeticIndex(list(self.items.values()))
+        self.save()
+        return changed
+
+    def search(self, query, limit=200):
+        index = self.index
+        return index.search(query, limit) if index is not None else []
+
+
+def content_hash(item):
+    # Short digest of an entry's compact JSON form; equal content gives an equal hash
+    return hashlib.blake2b(to_json(item).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def shop_entry_key(entry):
+    return entry.id or entry.name
+
+
+def news_entry_key(motd):
+    if not isinstance(motd, dict):
+        return ""
+    return motd.get("id") or motd.get("title") or ""
+
+
+class SnapshotDiff:
+    # One snapshot of a list of entries (shop offers, news MOTDs) keyed by ID, with its
+    # content hashes and what was added, changed and removed since the previous snapshot.
+    # Without a previous snapshot nothing counts as added.
+    def __init__(self, items, key, previous=None):
+        self.keys = []
+        seen = Counter()
+        for item in items:
+            # The same ID twice (e.g. one offer in two sections) gets a numbered key
+            k = key(item)
+            seen[k] += 1
+            self.keys.append(k if seen[k] == 1 else f"{k}#{seen[k]}")
+        self.items = dict(zip(self.keys, items))
+        self.hashes = {k: content_hash(item) for k, item in self.items.items()}
+        old = previous.hashes if previous is not None else self.hashes
+        self.added = [k for k in self.keys if k not in old]
+        self.changed = [k for k in self.keys if k in old and old[k] != self.hashes[k]]
+        self.removed = [k for k in old if k not in self.hashes]
+        self.removed_items = [previous.items[k] for k in self.removed]
+        self.unchanged = len(self.keys) - len(self.added) - len(self.changed)
+        self.statuses = dict.fromkeys(self.added, "new")
+        self.statuses.update(dict.fromkeys(self.changed, "changed"))
+        self.statuses.update(dict.fromkeys(self.removed, "removed"))
+
+    def modified(self):
+        return bool(self.statuses)
+
+    def status(self, key):
+        # "new", "changed", "removed" or "" for an unchanged entry
+        return self.statuses.get(key, "")
+
+    def summary(self):
+        return (f"{len(self.added)} new, {len(self.changed)} changed, {len(self.removed)} removed, "
+                f"{self.unchanged} unchanged")
+
+
+class ShopArchive:
+    # Rolling archive of shop rotations: one NDJSON line per distinct shop seen, the last
+    # SHOP_ARCHIVE_ROTATIONS of them kept in full. A last-seen index maps every offer ever
+    # archived to the most recent rotation it was in, so "when was X last in the shop" never
+    # needs the network. Compaction folds dropped rotations into a leading {"seen": ...} line.
+    # Offers are held in their compact dict form; only lookup results become ShopEntry models.
+    def __init__(self, path=SHOP_ARCHIVE_FILE, max_rotations=SHOP_ARCHIVE_ROTATIONS):
+        self.path = path
+        self.max_rotations = max_rotations
+        self.rotations = deque()  # (time, shop hash, [offer dict])
+        self.base = {}  # key -> (time, offer dict) from rotations no longer kept
+        self.seen = {}  # key -> (time, offer dict) for every rotation
+        self.names = {}  # lowercased name -> keys of the offers with that name
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def load(self):
+        # Reads the file on first use; callers hold the lock
+        if self.loaded:
             return
-
-        d = data.get("data", {})
-        output = [
-            f"Creator: {d.get('account', {}).get('name')}",
-            f"Share Code: {d.get('account', {}).get('shareCode')}",
-            f"Platform: {d.get('account', {}).get('platform')}",
-            f"Total Payments: {d.get('payments', 0)}",
-        ]
-        self.creator_code_results.delete(1.0, tk.END)
-        self.creator_code_results.insert(tk.END, "\n".join(output))
-
-    def build_settings_tab(self):
-        tab = self.tabs["Settings"]
-        ttk.Label(tab, text="Enter Your Fortnite API Key:").pack(anchor="w", padx=5, pady=5)
-        self.api_key_var = tk.StringVar(value=self.api_key)
-        api_entry = ttk.Entry(tab, textvariable=self.api_key_var, show="*")
-        api_entry.pack(fill="x", padx=5)
-
-        save_btn = ttk.Button(tab, text="Save API Key", command=self.save_api_key)
-        save_btn.pack(pady=5)
-
-    def save_api_key(self):
-        key = self.api_key_var.get().strip()
-        if not key:
-            messagebox.showerror("Input Error", "API Key cannot be empty.")
+        self.loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if "seen" in record:
+                            self.base.update((self.key(item), (when, item)) for when, item in record["seen"])
+                        else:
+                            self.rotations.append((record["t"], record["hash"], record["items"]))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue  # A line cut short by a crash
+        except OSError:
+            pass
+        for key, (when, item) in self.base.items():
+            self.remember(key, when, item)
+        for rotation in self.rotations:
+            self.index(rotation)
+
+    @staticmethod
+    def key(item):
+        return item.get("id") or item.get("name") or ""
+
+    def remember(self, key, when, item):
+        previous = self.seen.get(key)
+        self.seen[key] = (when, item)
+        if previous is None or previous[1].get("name") != item.get("name"):
+            self.names.setdefault(str(item.get("name", "")).lower(), set()).add(key)
+
+    def index(self, rotation):
+        when, shop_hash, items = rotation
+        for item in items:
+            self.remember(self.key(item), when, item)
+
+    def record(self, entries, when=None):
+        # Archives a list of ShopEntry if it differs from the latest rotation; True when it did
+        items = [entry.to_dict() for entry in entries]
+        shop_hash = content_hash(items)
+        with self.lock:
+            self.load()
+            if self.rotations and self.rotations[-1][1] == shop_hash:
+                return False
+            rotation = (time.time() if when is None else when, shop_hash, items)
+            self.rotations.append(rotation)
+            self.index(rotation)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(to_json({"t": rotation[0], "hash": shop_hash, "items": items}) + "\n")
+            # Compact in steps rather than rewriting the file on every rotation
+            if len(self.rotations) > self.max_rotations + self.max_rotations // 10:
+                self.compact()
+            return True
+
+    def compact(self):
+        while len(self.rotations) > self.max_rotations:
+            when, shop_hash, items = self.rotations.popleft()
+            for item in items:
+                self.base[self.key(item)] = (when, item)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(to_json({"seen": list(self.base.values())}) + "\n")
+            for when, shop_hash, items in self.rotations:
+                f.write(to_json({"t": when, "hash": shop_hash, "items": items}) + "\n")
+        os.replace(tmp, self.path)
+
+    def last_seen(self, query, limit=20):
+        # [(time, ShopEntry)] most recent first: the offer with this ID, else offers whose
+        # name matches exactly, else offers whose name contains the query
+        query = query.strip()
+        with self.lock:
+            self.load()
+            if query in self.seen:
+                keys = [query]
+            else:
+                needle = query.lower()
+                keys = self.names.get(needle) or [k for name, ks in self.names.items() if needle in name for k in ks]
+            matches = [self.seen[k] for k in dict.fromkeys(keys)]
+        matches.sort(key=lambda seen: seen[0], reverse=True)
+        return [(when, ShopEntry.from_api(item)) for when, item in matches[:limit]]
+
+    def stats(self):
+        with self.lock:
+            self.load()
+            latest = self.rotations[-1][0] if self.rotations else None
+            return {"rotations": len(self.rotations), "offers": len(self.seen), "latest": latest}
+
+
+def bulk_stats_row(username, data, category):
+    row = {"username": username, "mode": category, "status": "ok", "stats": {}}
+    if "error" in data:
+        row["status"] = data["error"]
+        return row
+    stats = data.get("data")
+    row["stats"] = stats.category(category) if isinstance(stats, PlayerStats) else {}
+    if not row["stats"]:
+        row["status"] = "no stats"
+    return row
+
+
+class StatsExporter:
+    # Streams bulk stats rows to disk as they arrive: NDJSON for .ndjson/.jsonl/.json, CSV otherwise
+    def __init__(self, path):
+        self.ndjson = path.lower().endswith((".ndjson", ".jsonl", ".json"))
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = None
+        if not self.ndjson:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(["Username", "Mode", "Status"] + [label for key, label in STAT_FIELDS])
+
+    def write(self, row):
+        if self.ndjson:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            stats = row["stats"]
+            self.writer.writerow([row["username"], row["mode"], row["status"]] + [stats.get(key, "") for key, label in STAT_FIELDS])
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def stat_number(value):
+    # Stat value as a float for the history store: NaN when missing, epoch seconds for
+    # timestamps such as lastModified
+    if value is None or isinstance(value, bool):
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return float("nan")
+
+
+class StatsHistory:
+    # Every stats lookup as a row in a columnar store: time, player and mode columns plus
+    # one float64 array per STAT_FIELDS key, grown by doubling. On disk it is an append-only
+    # file of fixed-size records, read back in one numpy call. A lookup identical to the
+    # player's last one for that mode (e.g. served from cache) adds nothing. numpy is
+    # imported on first use, so creating a StatsHistory is free.
+    def __init__(self, path=STATS_HISTORY_FILE):
+        self.path = path
+        self.players_path = os.path.splitext(path)[0] + ".players"
+        self.np = None
+        self.dtype = None
+        self.names = []
+        self.ids = {}  # lowercased name -> player id
+        self.latest = {}  # (player id, mode index) -> row of its last snapshot
+        self.count = 0
+        self.times = self.player_col = self.mode_col = self.values = None
+        self.file = None
+        self.lock = threading.Lock()
+
+    def open(self):
+        # Imports numpy and loads the file on first use; callers hold the lock
+        if self.np is not None:
             return
-        self.api_key = key
-        self.api = FortniteAPI(self.api_key)
-        self.save_config()
-        messagebox.showinfo("Saved", "API Key saved successfully.")
-        self.set_status("API Key updated.")
+        try:
+            import numpy
+        except ImportError:
+            raise RuntimeError("Stats history requires numpy (pip install numpy)") from None
+        np = numpy
+        self.dtype = np.dtype([("time", "<f8"), ("player", "<u4"), ("mode", "<u4"), ("values", "<f8", (len(STAT_FIELDS),))])
+        header = STATS_FILE_MAGIC + len(STAT_FIELDS).to_bytes(4, "little")
+        records = np.zeros(0, self.dtype)
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                if f.read(len(header)) == header:
+                    records = np.fromfile(f, self.dtype)
+                else:
+                    records = None
+            if records is None:
+                # Written with different STAT_FIELDS: keep it aside rather than misread it
+                os.replace(self.path, self.path + ".old")
+                records = np.zeros(0, self.dtype)
+        if os.path.exists(self.players_path):
+            with open(self.players_path, "r", encoding="utf-8") as f:
+                self.names = [line.rstrip("\n") for line in f]
+            self.ids = {name.lower(): i for i, name in enumerate(self.names)}
+        # Rows for players whose name line never made it to disk are unusable
+        records = records[records["player"] < len(self.names)]
+        self.np = np
+        self.count = 0
+        self.grow(max(1024, len(records)))
+        self.count = len(records)
+        self.times[:self.count] = records["time"]
+        self.player_col[:self.count] = records["player"]
+        self.mode_col[:self.count] = records["mode"]
+        self.values[:, :self.count] = records["values"].T
+        for row, key in enumerate(zip(records["player"].tolist(), records["mode"].tolist())):
+            self.latest[key] = row
+        # Rewrite through the header whenever the file was missing, partial or set aside
+        size = len(header) + self.count * self.dtype.itemsize
+        if not os.path.exists(self.path) or os.path.getsize(self.path) != size:
+            with open(self.path, "wb") as f:
+                f.write(header)
+                records.tofile(f)
+        self.file = open(self.path, "ab")
+
+    def grow(self, capacity):
+        np = self.np
+        n = self.count
+        times, players, modes = np.empty(capacity), np.empty(capacity, np.uint32), np.empty(capacity, np.uint32)
+        values = np.empty((len(STAT_FIELDS), capacity))
+        if n:
+            times[:n], players[:n], modes[:n] = self.times[:n], self.player_col[:n], self.mode_col[:n]
+            values[:, :n] = self.values[:, :n]
+        self.times, self.player_col, self.mode_col, self.values = times, players, modes, values
+
+    def player_id(self, name, create=False):
+        pid = self.ids.get(name.lower())
+        if pid is None and create:
+            pid = len(self.names)
+            with open(self.players_path, "a", encoding="utf-8") as f:
+                f.write(name.replace("\n", " ") + "\n")
+            self.names.append(name)
+            self.ids[name.lower()] = pid
+        return pid
+
+    def record(self, stats, name=None, when=None):
+        # Adds one row per mode of a PlayerStats that changed since the last lookup; returns
+        # how many were added
+        name = (stats.name or name or "").strip()
+        if not name or not stats.categories:
+            return 0
+        when = time.time() if when is None else when
+        with self.lock:
+            self.open()
+            np = self.np
+            pid = self.player_id(name, create=True)
+            rows = []
+            for mode, values in stats.categories.items():
+                if mode not in STAT_CATEGORIES:
+                    continue
+                m = STAT_CATEGORIES.index(mode)
+                column = np.array([stat_number(v) for v in values])
+                last = self.latest.get((pid, m))
+                if last is not None and np.array_equal(self.values[:, last], column, equal_nan=True):
+                    continue
+                if self.count == len(self.times):
+                    self.grow(2 * self.count)
+                row = self.count
+                self.times[row], self.player_col[row], self.mode_col[row] = when, pid, m
+                self.values[:, row] = column
+                self.latest[(pid, m)] = row
+                self.count += 1
+                rows.append((when, pid, m, column))
+            if rows:
+                np.array(rows, self.dtype).tofile(self.file)
+                self.file.flush()
+            return len(rows)
+
+    def players(self):
+        with self.lock:
+            self.open()
+            return list(self.names)
+
+    def series(self, name, mode="overall"):
+        # (times, {stat key: values}) for one player and mode, oldest first
+        with self.lock:
+            self.open()
+            np = self.np
+            pid = self.player_id(name)
+            if pid is None or mode not in STAT_CATEGORIES:
+                return np.empty(0), {key: np.empty(0) for key, label in STAT_FIELDS}
+            n = self.count
+            rows = np.flatnonzero((self.player_col[:n] == pid) & (self.mode_col[:n] == STAT_CATEGORIES.index(mode)))
+            values = self.values[:, rows]
+            return self.times[rows], {key: values[i] for i, (key, label) in enumerate(STAT_FIELDS)}
+
+    def deltas(self, name, mode="overall"):
+        # Change in every stat between consecutive lookups: (times of the later lookups, {key: deltas})
+        times, columns = self.series(name, mode)
+        np = self.np
+        return times[1:], {key: np.diff(values) for key, values in columns.items()}
+
+    def trends(self, name, mode="overall", window=STATS_TREND_WINDOW):
+        # K/D and win rate over the last `window` lookups at each point, from differences of
+        # the career totals; NaN where no deaths or matches happened in the window
+        times, columns = self.series(name, mode)
+        np = self.np
+        base = np.maximum(np.arange(len(times)) - window, 0)
+        kills, deaths = columns["kills"], columns["deaths"]
+        wins, matches = columns["wins"], columns["matches"]
+        d_deaths, d_matches = deaths - deaths[base], matches - matches[base]
+        kd = np.divide(kills - kills[base], d_deaths, out=np.full(len(times), np.nan), where=d_deaths > 0)
+        win_rate = np.divide(100 * (wins - wins[base]), d_matches, out=np.full(len(times), np.nan), where=d_matches > 0)
+        return times, kd, win_rate
+
+    def leaderboard(self, key, mode="overall", limit=10):
+        # [(name, value)] for every tracked player's latest lookup, best first
+        with self.lock:
+            self.open()
+            np = self.np
+            if mode not in STAT_CATEGORIES:
+                return []
+            m = STAT_CATEGORIES.index(mode)
+            field = [k for k, label in STAT_FIELDS].index(key)
+            # Rows are in recording order, so a player's latest is their first row from the end
+            rows = np.flatnonzero(self.mode_col[:self.count] == m)[::-1]
+            pids, first = np.unique(self.player_col[rows], return_index=True)
+            values = self.values[field, rows[first]]
+            keep = ~np.isnan(values)
+            pids, values = pids[keep], values[keep]
+            order = np.argsort(-values, kind="stable")[:limit]
+            return [(self.names[pid], float(value)) for pid, value in zip(pids[order].tolist(), values[order])]
+
+    def close(self):
+        # The next call loads the file again
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            self.np = None
+            self.latest = {}
+
+
+def aes_key_bytes(key):
+    key = key.encode("utf-8") if isinstance(key, str) else bytes(key)
+    if len(key) not in (16, 24, 32):
+        raise ValueError(f"AES keys are 16, 24 or 32 bytes long, not {len(key)}")
+    return key
+
+
+def pkcs7_unpad(data, block_size=AES_BLOCK_BYTES):
+    # Checks every padding byte, not just the last one, so a wrong key is reported as an
+    # error instead of returning garbage with a few bytes cut off
+    if not data or len(data) % block_size:
+        raise ValueError("Invalid PKCS7 padding: not a whole number of blocks")
+    pad = data[-1]
+    if not 1 <= pad <= block_size or data[-pad:] != bytes([pad]) * pad:
+        raise ValueError("Invalid PKCS7 padding (wrong key?)")
+    return data[:-pad]
+
+
+def aes_decrypt(key, data, last=True):
+    # AES-ECB over whole blocks; only the final piece of a message carries the padding
+    from Crypto.Cipher import AES
+
+    if not data or len(data) % AES_BLOCK_BYTES:
+        raise ValueError(f"Ciphertext must be a non-empty multiple of {AES_BLOCK_BYTES} bytes, got {len(data)}")
+    plain = AES.new(key, AES.MODE_ECB).decrypt(data)
+    return pkcs7_unpad(plain) if last else plain
+
+
+def decrypt_base64(key, text):
+    return aes_decrypt(key, base64.b64decode(text, validate=True))
+
+
+def aes_lines_job(key, lines):
+    # Worker: (plaintext, None) or (None, error) for each base64 line
+    results = []
+    for line in lines:
+        try:
+            results.append((decrypt_base64(key, line), None))
+        except ValueError as e:
+            results.append((None, str(e)))
+    return results
+
+
+def aes_chunk_job(key, path, offset, length, last):
+    # Worker: maps its own slice of the file, so ciphertext never passes through the parent
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return aes_decrypt(key, m[offset:offset + length], last)
+
+
+def aes_size_job(size):
+    # Stands in for the chunks of a file that cannot be a ciphertext, so its error is
+    # reported in order with the other files
+    raise ValueError(f"Ciphertext must be a non-empty multiple of {AES_BLOCK_BYTES} bytes, got {size}")
+
+
+class AesBatch:
+    # Decrypts many base64 lines or large binary files with one key. Work is cut into
+    # fixed-size jobs and fanned out over a process pool; results come back in input order
+    # and are written as they arrive, so memory stays at a few jobs' worth whatever the
+    # input size. Inputs under AES_INLINE_BYTES are decrypted in-process.
+    def __init__(self, key, workers=AES_WORKERS, on_progress=None):
+        self.key = aes_key_bytes(key)
+        self.workers = max(1, workers)
+        self.on_progress = on_progress  # on_progress(done_bytes, total_bytes, seconds)
+        self.stopped = threading.Event()
+        self.pool = None
+        self.done_bytes = 0
+        self.total_bytes = 0
+        self.start = None
+
+    def stop(self):
+        self.stopped.set()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def throughput(self):
+        # Ciphertext MB/s since the run started
+        elapsed = time.perf_counter() - self.start if self.start else 0.0
+        return self.done_bytes / elapsed / 1e6 if elapsed > 0 else 0.0
+
+    def executor(self):
+        if self.pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn, not fork: the GUI calls this from a worker thread of a threaded process
+            self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.pool
+
+    def begin(self, total_bytes):
+        self.stopped.clear()
+        self.done_bytes = 0
+        self.total_bytes = total_bytes
+        self.start = time.perf_counter()
+
+    def run_jobs(self, jobs, inline):
+        # jobs yields (tag, size, func, args); yields (tag, result, error) in the same order
+        # with at most two jobs per worker in flight
+        pending = deque()
+        inline = inline or self.workers == 1
+
+        def finish():
+            tag, size, future = pending.popleft()
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            return self.progress(tag, size, result, error)
+
+        for tag, size, func, args in jobs:
+            if self.stopped.is_set():
+                break
+            if inline:
+                try:
+                    result, error = func(*args), None
+                except Exception as e:
+                    result, error = None, e
+                yield self.progress(tag, size, result, error)
+                continue
+            pending.append((tag, size, self.executor().submit(func, *args)))
+            if len(pending) >= 2 * self.workers:
+                yield finish()
+        while pending and not self.stopped.is_set():
+            yield finish()
+        for tag, size, future in pending:
+            future.cancel()
+
+    def progress(self, tag, size, result, error):
+        self.done_bytes += size
+        if self.on_progress is not None:
+            self.on_progress(self.done_bytes, self.total_bytes, time.perf_counter() - self.start)
+        return tag, result, error
+
+    def decrypt_files(self, paths, out_dir, on_item=None):
+        # Each file is one ciphertext; writes <out_dir>/<name>.dec, or <name>_2.dec and so on
+        # when files from different folders share a name. on_item(record) reports every file
+        # as it finishes. Returns a summary. A file passed more than once is decrypted once.
+        unique = {}
+        for path in paths:
+            unique.setdefault(os.path.normcase(os.path.abspath(path)), path)
+        paths = list(unique.values())
+        sizes = {path: os.path.getsize(path) for path in paths}
+        self.begin(sum(sizes.values()))
+        os.makedirs(out_dir, exist_ok=True)
+        targets = {}
+        used = set()
+        for path in sizes:
+            stem, ext = os.path.splitext(os.path.basename(path))
+            name, n = stem + ext, 1
+            # Case-insensitive, as the names would collide on Windows
+            while name.lower() in used:
+                n += 1
+                name = f"{stem}_{n}{ext}"
+            used.add(name.lower())
+            targets[path] = os.path.join(out_dir, name + ".dec")
+
+        def jobs():
+            for path in paths:
+                size = sizes[path]
+                if size == 0 or size % AES_BLOCK_BYTES:
+                    yield path, size, aes_size_job, (size,)
+                    continue
+                for offset in range(0, size, AES_CHUNK_BYTES):
+                    length = min(AES_CHUNK_BYTES, size - offset)
+                    yield path, length, aes_chunk_job, (self.key, path, offset, length, offset + length == size)
+
+        summary = {"items": 0, "failed": 0, "bytes": 0}
+        chunks_left = {path: max(1, -(-sizes[path] // AES_CHUNK_BYTES)) for path in paths}
+        current = out = None
+        failed = False
+
+        def report(path, error=None):
+            summary["items"] += 1
+            record = {"input": path, "output": target(path), "bytes": sizes[path], "status": "ok"}
+            if error is not None:
+                summary["failed"] += 1
+                record.update(status="error", error=str(error), output=None)
+            if on_item is not None:
+                on_item(record)
+
+        def target(path):
+            return targets[path]
 
-    # Utility for threading API calls to avoid freezing GUI
-    def threaded(self, func):
-        def wrapper(*args, **kwargs):
-            threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True).start()
-        return wrapper
+        try:
+            for path, plain, error in self.run_jobs(jobs(), self.total_bytes <= AES_INLINE_BYTES):
+                if path != current:
+                    if out is not None:
+                        out.close()
+                        report(current)
+                    current, out, failed = path, None, False
+                chunks_left[path] -= 1
+                if failed:
+                    continue
+                if error is not None:
+                    # Drop the partial output; the rest of this file's chunks are skipped
+                    if out is not None:
+                        out.close()
+                        os.remove(target(path))
+                        out = None
+                    failed = True
+                    report(path, error)
+                    continue
+                if out is None:
+                    out = open(target(path), "wb")
+                out.write(plain)
+                summary["bytes"] += len(plain)
+            if out is not None:
+                out.close()
+                out = None
+                if chunks_left[current]:
+                    os.remove(target(current))
+                    report(current, "Stopped before the end of the file")
+                else:
+                    report(current)
+        finally:
+            if out is not None:
+                out.close()
+        summary["stopped"] = self.stopped.is_set()
+        summary["seconds"] = time.perf_counter() - self.start
+        return summary
+
+    def decrypt_lines(self, path, out_path, on_item=None):
+        # One base64 ciphertext per line. Writes one NDJSON record per line: {"line", "text"}
+        # ({"line", "base64"} for binary plaintext) or {"line", "error"}. on_item gets the
+        # failed lines only.
+        self.begin(os.path.getsize(path))
+
+        def jobs():
+            with open(path, "r", encoding="utf-8") as f:
+                batch, size = [], 0
+                for number, line in enumerate(f, 1):
+                    size += len(line)
+                    if line.strip():
+                        batch.append((number, line.strip()))
+                    if len(batch) >= AES_BATCH_LINES:
+                        yield [n for n, text in batch], size, aes_lines_job, (self.key, [text for n, text in batch])
+                        batch, size = [], 0
+                if batch or size:
+                    yield [n for n, text in batch], size, aes_lines_job, (self.key, [text for n, text in batch])
+
+        summary = {"items": 0, "failed": 0, "bytes": 0}
+        with open(out_path, "w", encoding="utf-8") as out:
+            for numbers, results, error in self.run_jobs(jobs(), self.total_bytes <= AES_INLINE_BYTES):
+                if error is not None:
+                    results = [(None, str(error))] * len(numbers)
+                for number, (plain, message) in zip(numbers, results):
+                    summary["items"] += 1
+                    if message is not None:
+                        summary["failed"] += 1
+                        record = {"line": number, "error": message}
+                        if on_item is not None:
+                            on_item(record)
+                    else:
+                        summary["bytes"] += len(plain)
+                        try:
+                            record = {"line": number, "text": plain.decode("utf-8")}
+                        except UnicodeDecodeError:
+                            record = {"line": number, "base64": base64.b64encode(plain).decode("ascii")}
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        summary["stopped"] = self.stopped.is_set()
+        summary["seconds"] = time.perf_counter() - self.start
+        return summary
+
+
+def main():
+    # With arguments this is the command line interface, without them the GUI. Run as a
+    # script, this module is __main__; cli and gui are given it as fortnite_api so they
+    # share its limiter, caches and classes instead of importing a second copy.
+    sys.modules.setdefault("fortnite_api", sys.modules[__name__])
+    if len(sys.argv) > 1:
+        import cli
+
+        return cli.main()
+    import gui
+
+    return gui.main()
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    root.geometry("900x700")
-    app = FortniteApp(root)
-    root.mainloop()
+    sys.exit(main())
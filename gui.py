@@ -0,0 +1,1936 @@
+# Tkinter front end for the client in fortnite_api.py
+import time
+
+STARTED_AT = time.perf_counter()  # Reference point for the startup-time measurement
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+import threading
+import json
+import bisect
+import heapq
+import queue
+import os
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+
+from fortnite_api import (
+    CONFIG_FILE, STAT_CATEGORIES, STAT_FIELDS, STATS_TREND_WINDOW, AesBatch, AsyncFortniteAPI, AsyncLoopThread,
+    CosmeticsCatalog, Histogram, FortniteAPI, PlayerStats, ShopArchive, SnapshotArchive, SnapshotDiff, StatsExporter,
+    StatsHistory, aes_key_bytes, bulk_stats_row, cache_expiry, decrypt_base64, new_cosmetic_items, news_entry_key,
+    shop_entry_key,
+)
+
+# pycryptodome is imported where it is first used so the window can appear before it loads.
+
+HISTORY_FILE = "fnapi_history.ndjson"
+LEGACY_HISTORY_FILE = "fnapi_history.json"  # Imported once, when the journal doesn't exist yet
+HISTORY_MAX_ENTRIES = 5000  # Distinct entries kept per category; the least recently used go first
+HISTORY_COMPACT_RATIO = 2  # Compact once the journal has this many lines per live entry
+HISTORY_COMPACT_MIN_LINES = 1000
+
+# Search-as-you-type delays (ms). Local catalog search is cheap; network lookups wait
+# for a longer pause in typing.
+SEARCH_DEBOUNCE_LOCAL_MS = 80
+SEARCH_DEBOUNCE_REMOTE_MS = 400
+STATS_DEBOUNCE_MS = 800
+MIN_REMOTE_QUERY_LENGTH = 3
+MAX_SUGGESTIONS = 15
+
+WORKER_THREADS = 4  # Concurrent API calls from the GUI
+UI_POLL_MS = 30  # How often the Tk thread drains finished work
+# Streamed results reach the Tk thread in batches of this many items, or sooner when
+# the items arrive slowly
+STREAM_BATCH_ITEMS = 200
+STREAM_BATCH_SECONDS = 0.1
+
+# Tabs warmed at startup and re-fetched in the background when their cached data
+# expires (see CACHE_TTLS): tab -> (path, FortniteAPI method, FortniteApp renderer)
+WARM_ENDPOINTS = {
+    "Shop": ("/v2/shop/br", "get_shop", "show_shop"),
+    "News": ("/v2/news/br", "get_news", "show_news"),
+    "Season Info": ("/v2/seasons/current", "get_season", "show_season_info"),
+    "Upcoming": ("/v2/cosmetics/br/new", "get_upcoming", "show_upcoming"),
+}
+REFRESH_GRACE_SECONDS = 30  # Give the API a moment to publish after a change point
+MIN_REFRESH_SECONDS = 60
+AGE_UPDATE_MS = 30 * 1000
+STARTUP_TARGET_MS = 200  # Budget from launch to a usable window; reported in the status bar
+METRICS_UPDATE_MS = 2000  # Status bar metrics and the Diagnostics tab refresh
+AES_PROGRESS_SECONDS = 0.2  # Minimum interval between AES batch progress updates
+# Leaderboards under Stats > Tracked Players: (stat key, title, value format)
+LEADERBOARD_FIELDS = [
+    ("kd", "K/D Ratio", ".2f"),
+    ("winRate", "Win Rate (%)", ".2f"),
+    ("wins", "Wins", ",.0f"),
+    ("kills", "Kills", ",.0f"),
+    ("matches", "Matches Played", ",.0f"),
+]
+
+
+class TaskRunner:
+    # Bounded worker pool for the GUI. Workers never touch Tk: results go on a queue that
+    # the main thread drains with root.after. Each tab keeps only its latest task, so the
+    # results of superseded or cancelled tasks are dropped instead of rendered.
+    def __init__(self, root, max_workers=WORKER_THREADS, on_change=None):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fnapi-worker")
+        self.results = queue.Queue()
+        self.generations = {}
+        self.futures = {}
+        self.queued = 0
+        self.running = 0
+        self.lock = threading.Lock()
+        self.on_change = on_change
+        self.last_state = None
+        self.closed = False
+        self.render_times = {}  # tab -> Histogram of time spent in done() on the Tk thread (ms)
+        self.root.after(UI_POLL_MS, self.drain)
+
+    def submit(self, tab, work, done=None, error=None, on_batch=None):
+        # work() runs on a worker; done(result) or error(exception) later runs on the Tk thread.
+        # With on_batch, work() returns an iterable that is consumed on the worker and handed
+        # to on_batch(list) piece by piece as it arrives; done then gets the item count.
+        with self.lock:
+            generation = self.generations.get(tab, 0) + 1
+            self.generations[tab] = generation
+            self.queued += 1
+        self.cancel_future(tab)
+        self.futures[tab] = self.executor.submit(self.run, tab, generation, work, done, error, on_batch)
+        return generation
+
+    def run(self, tab, generation, work, done, error, on_batch=None):
+        with self.lock:
+            self.queued -= 1
+            if self.generations.get(tab) != generation:
+                return
+            self.running += 1
+        try:
+            result = work()
+            if on_batch is not None:
+                result = self.stream(tab, generation, result, on_batch)
+            callback, args = done, (result,)
+        except Exception as e:
+            callback, args = error or self.report_error, (e,)
+        finally:
+            with self.lock:
+                self.running -= 1
+        self.results.put((tab, generation, callback, args))
+
+    def stream(self, tab, generation, items, on_batch):
+        # Posts batches under the task's generation, so a superseded task's rows are dropped
+        # like its result would be; stops reading once the task is no longer current
+        count = 0
+        batch = []
+        flushed = time.monotonic()
+        for item in items:
+            batch.append(item)
+            if len(batch) >= STREAM_BATCH_ITEMS or time.monotonic() - flushed >= STREAM_BATCH_SECONDS:
+                if not self.is_current(tab, generation):
+                    break
+                self.results.put((tab, generation, on_batch, (batch,)))
+                count += len(batch)
+                batch = []
+                flushed = time.monotonic()
+        else:
+            if batch:
+                self.results.put((tab, generation, on_batch, (batch,)))
+                count += len(batch)
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+        return count
+
+    def call_soon(self, func, *args):
+        # Lets worker code hand UI updates to the Tk thread mid-task
+        self.results.put((None, None, func, args))
+
+    def cancel_future(self, tab):
+        future = self.futures.pop(tab, None)
+        if future is not None and future.cancel():
+            with self.lock:
+                self.queued -= 1
+
+    def cancel(self, tab):
+        with self.lock:
+            self.generations[tab] = self.generations.get(tab, 0) + 1
+        self.cancel_future(tab)
+
+    def is_current(self, tab, generation):
+        with self.lock:
+            return self.generations.get(tab) == generation
+
+    def report_error(self, error):
+        messagebox.showerror("Error", str(error))
+
+    def drain(self):
+        try:
+            for _ in range(100):
+                try:
+                    tab, generation, callback, args = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                if tab is not None and not self.is_current(tab, generation):
+                    continue
+                if callback is not None:
+                    start = time.perf_counter()
+                    callback(*args)
+                    if tab is not None:
+                        self.render_times.setdefault(tab, Histogram()).observe((time.perf_counter() - start) * 1000)
+        finally:
+            state = (self.running, self.queued)
+            if state != self.last_state and self.on_change:
+                self.last_state = state
+                self.on_change(*state)
+            if not self.closed:
+                self.root.after(UI_POLL_MS, self.drain)
+
+    def shutdown(self):
+        self.closed = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class RefreshScheduler:
+    # Prefetches the time-sensitive tabs in parallel at startup and re-fetches each one
+    # when its data naturally changes: the shop at the daily rotation, news every few
+    # minutes. Runs under its own task keys so a manual refresh never cancels it.
+    def __init__(self, app, endpoints=WARM_ENDPOINTS):
+        self.app = app
+        self.endpoints = endpoints
+        self.jobs = {}
+        self.age_job = None
+
+    def start(self):
+        for tab in self.endpoints:
+            self.refresh(tab)
+        if self.age_job is None:
+            self.update_ages()
+
+    def stop(self):
+        for job in self.jobs.values():
+            self.app.root.after_cancel(job)
+        self.jobs.clear()
+
+    def refresh(self, tab):
+        self.jobs.pop(tab, None)
+        api = self.app.api
+        if api is None:
+            return
+        path, fetch, render = self.endpoints[tab]
+        self.app.tasks.submit(
+            f"warm:{tab}", lambda: self.app.fetched(tab, getattr(api, fetch)()), lambda data: self.on_data(tab, data),
+            lambda e: self.schedule(tab, MIN_REFRESH_SECONDS),
+        )
+
+    def on_data(self, tab, data):
+        path, fetch, render = self.endpoints[tab]
+        if "error" in data:
+            self.app.set_status(f"Background refresh of {tab} failed: {data['error']}")
+            self.schedule(tab, MIN_REFRESH_SECONDS)
+            return
+        if tab in self.app.built_tabs:
+            # Tabs that haven't been opened yet pick the data up from the cache when built
+            getattr(self.app, render)(data)
+        entry = self.app.api.cache_entry(path)
+        expires = entry["expires"] if entry else cache_expiry(path)
+        self.schedule(tab, expires - time.time() + REFRESH_GRACE_SECONDS)
+        self.update_age(tab)
+
+    def render_cached(self, tab):
+        path, fetch, render = self.endpoints[tab]
+        entry = self.app.api.cache_entry(path) if self.app.api else None
+        if entry is not None and "error" not in entry["data"]:
+            getattr(self.app, render)(entry["data"])
+
+    def schedule(self, tab, seconds):
+        job = self.jobs.pop(tab, None)
+        if job is not None:
+            self.app.root.after_cancel(job)
+        delay_ms = int(max(seconds, MIN_REFRESH_SECONDS) * 1000)
+        self.jobs[tab] = self.app.root.after(delay_ms, lambda: self.refresh(tab))
+
+    def update_age(self, tab):
+        var = self.app.age_vars.get(tab)
+        if var is None:
+            return
+        entry = self.app.api.cache_entry(self.endpoints[tab][0]) if self.app.api else None
+        if entry is None:
+            var.set("Not loaded yet")
+            return
+        var.set(f"Updated {format_age(time.time() - entry['time'])} ago")
+
+    def update_ages(self):
+        for tab in self.endpoints:
+            self.update_age(tab)
+        self.age_job = self.app.root.after(AGE_UPDATE_MS, self.update_ages)
+
+
+def format_age(seconds):
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60} min"
+    if seconds < 86400:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    return f"{seconds // 86400}d"
+
+
+class VirtualTable(ttk.Frame):
+    # Treeview that only ever holds the rows on screen. Results stay in a Python list and
+    # are converted to rows a page at a time when first shown; scrolling, sorting and
+    # filtering only change which slice of that list is displayed.
+    PAGE_SIZE = 200
+
+    def __init__(self, parent, columns):
+        super().__init__(parent)
+        self.init_state(columns)
+
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", pady=(0, 3))
+        ttk.Label(bar, text="Filter:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        ttk.Entry(bar, textvariable=self.filter_var).pack(side=tk.LEFT, expand=True, fill="x", padx=5)
+        self.filter_var.trace_add("write", lambda *args: self.on_filter())
+        self.count_var = tk.StringVar(value="0 rows")
+        ttk.Label(bar, textvariable=self.count_var).pack(side=tk.RIGHT)
+
+        body = ttk.Frame(self)
+        body.pack(expand=True, fill="both")
+        self.tree = ttk.Treeview(body, columns=[c[0] for c in columns], show="headings", selectmode="browse")
+        for key, heading, width in columns:
+            self.tree.heading(key, text=heading, command=lambda k=key: self.sort_by(k))
+            self.tree.column(key, width=width, anchor="w")
+        self.scrollbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(expand=True, fill="both")
+
+        self.tree.bind("<Configure>", lambda e: self.render())
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_by(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(1, "pages"))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(len(self.view)))
+
+    def init_state(self, columns):
+        # Everything but the widgets; also used by the headless table in bench.py
+        self.columns = columns  # [(key, heading, width), ...]
+        self.items = []
+        self.row_func = self.default_row
+        self.rows = []
+        self.search_text = []
+        self.view = []
+        self.slot_rows = []  # Values currently in each Treeview row, so unchanged rows aren't rewritten
+        self.offset = 0
+        self.sort_key = None
+        self.sort_reverse = False
+
+    def default_row(self, item):
+        # Items are models (see fortnite_api.Model); columns name their attributes
+        return tuple(getattr(item, key, "") for key, heading, width in self.columns)
+
+    def set_items(self, items, row_func=None):
+        self.offset = 0
+        self.update_items(items, row_func)
+
+    def update_items(self, items, row_func=None):
+        # Like set_items, but for a refresh of the same list: the scroll position is kept, and
+        # render() only rewrites rows whose values changed
+        self.items = list(items)
+        self.row_func = row_func or self.default_row
+        self.rows = [None] * len(self.items)
+        self.search_text = [None] * len(self.items)
+        self.refresh_view()
+
+    def append_items(self, items):
+        items = list(items)
+        self.items.extend(items)
+        self.rows.extend([None] * len(items))
+        self.search_text.extend([None] * len(items))
+        self.refresh_view()
+
+    def clear(self):
+        self.set_items([])
+
+    def row(self, index):
+        # Convert the page containing this row on first access
+        if self.rows[index] is None:
+            start = index - index % self.PAGE_SIZE
+            for i in range(start, min(start + self.PAGE_SIZE, len(self.items))):
+                if self.rows[i] is None:
+                    self.rows[i] = tuple("" if v is None else v for v in self.row_func(self.items[i]))
+        return self.rows[index]
+
+    def row_text(self, index):
+        if self.search_text[index] is None:
+            self.search_text[index] = "\n".join(str(v) for v in self.row(index)).lower()
+        return self.search_text[index]
+
+    def refresh_view(self):
+        view = range(len(self.items))
+        needle = self.filter_var.get().strip().lower()
+        if needle:
+            view = [i for i in view if needle in self.row_text(i)]
+        if self.sort_key is not None:
+            col = [c[0] for c in self.columns].index(self.sort_key)
+            view = sorted(view, key=lambda i: sort_value(self.row(i)[col]), reverse=self.sort_reverse)
+        self.view = list(view)
+        if needle:
+            self.count_var.set(f"{len(self.view)} of {len(self.items)} rows")
+        else:
+            self.count_var.set(f"{len(self.items)} rows")
+        self.scroll_to(self.offset)
+
+    def on_filter(self):
+        self.offset = 0
+        self.refresh_view()
+
+    def sort_by(self, key):
+        if self.sort_key == key:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_key = key
+            self.sort_reverse = False
+        for k, heading, width in self.columns:
+            arrow = (" \u25bc" if self.sort_reverse else " \u25b2") if k == key else ""
+            self.tree.heading(k, text=heading + arrow)
+        self.offset = 0
+        self.refresh_view()
+
+    def visible_count(self):
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or 20
+        # One row's worth of height goes to the heading
+        return max(1, self.tree.winfo_height() // int(row_height) - 1)
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.view) - self.visible_count()))
+        self.render()
+
+    def scroll_by(self, amount, what):
+        step = self.visible_count() if what == "pages" else 3
+        self.scroll_to(self.offset + int(amount) * step)
+        return "break"
+
+    def on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * len(self.view)))
+        elif action == "scroll":
+            self.scroll_by(int(args[0]), args[1])
+
+    def render(self):
+        visible = self.visible_count()
+        shown = self.view[self.offset:self.offset + visible]
+        slots = self.tree.get_children()
+        for i, (slot, index) in enumerate(zip(slots, shown)):
+            row = self.row(index)
+            if self.slot_rows[i] != row:
+                self.tree.item(slot, values=row)
+                self.slot_rows[i] = row
+        for index in shown[len(slots):]:
+            self.tree.insert("", tk.END, values=self.row(index))
+            self.slot_rows.append(self.row(index))
+        if len(slots) > len(shown):
+            self.tree.delete(*slots[len(shown):])
+            del self.slot_rows[len(shown):]
+        total = len(self.view)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+def sort_value(value):
+    # Numbers sort numerically and before text
+    try:
+        return (0, float(value), "")
+    except (TypeError, ValueError):
+        return (1, 0.0, str(value).lower())
+
+
+class HistoryJournal:
+    # Search history as an append-only NDJSON journal: each search adds one {"c", "e", "t"}
+    # line and compaction rewrites the file as one line per entry with its use count "n".
+    # Per category, entries are held with their counts and a sorted array of lowercased
+    # keys, so prefix lookups are a bisect. add() and suggest() only touch memory; a writer
+    # thread loads the journal and does all the file I/O.
+    def __init__(self, path=HISTORY_FILE, legacy_path=LEGACY_HISTORY_FILE, max_entries=HISTORY_MAX_ENTRIES):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.max_entries = max_entries
+        self.entries = {}  # category -> {lowercased entry: [count, last used, entry]}
+        self.keys = {}  # category -> sorted lowercased entries
+        self.lines = 0
+        self.lock = threading.Lock()
+        self.pending = queue.Queue()
+        self.loaded = threading.Event()
+        self.writer = threading.Thread(target=self.write_loop, name="history-writer", daemon=True)
+        self.writer.start()
+
+    def load(self):
+        # Replays the journal, or imports the old JSON history, and merges it with anything
+        # added meanwhile; True when the journal needs writing from memory
+        loaded = {}
+        imported = False
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            self.record(loaded, record["c"], record["e"], record.get("n", 1), record.get("t", 0))
+                        except (ValueError, KeyError, TypeError, AttributeError):
+                            continue  # A line cut short by a crash
+                        self.lines += 1
+            elif self.legacy_path and os.path.exists(self.legacy_path):
+                with open(self.legacy_path, "r", encoding="utf-8") as f:
+                    legacy = json.load(f)
+                for category, items in legacy.items():
+                    for item in items:
+                        try:
+                            when = time.mktime(time.strptime(item["time"], "%Y-%m-%d %H:%M:%S"))
+                        except (ValueError, KeyError, TypeError):
+                            when = 0
+                        self.record(loaded, category, str(item.get("entry", "")), 1, when)
+                imported = bool(loaded)
+        except (OSError, ValueError, AttributeError):
+            pass
+        with self.lock:
+            for category, entries in self.entries.items():
+                for stats in entries.values():
+                    self.record(loaded, category, stats[2], stats[0], stats[1])
+            self.entries = loaded
+            for category in loaded:
+                self.trim(category)
+        self.loaded.set()
+        return imported
+
+    @staticmethod
+    def record(entries, category, entry, count, when):
+        # True when the entry is new to its category
+        entry = entry.strip()
+        if not entry:
+            return False
+        entries = entries.setdefault(category, {})
+        key = entry.lower()
+        stats = entries.get(key)
+        if stats is None:
+            entries[key] = [count, when, entry]
+            return True
+        stats[0] += count
+        if when >= stats[1]:
+            stats[1] = when
+            stats[2] = entry
+        return False
+
+    def trim(self, category):
+        # Keep the most recently used entries and rebuild the prefix index
+        entries = self.entries[category]
+        if len(entries) > self.max_entries:
+            keep = heapq.nlargest(self.max_entries, entries.items(), key=lambda item: item[1][1])
+            entries = self.entries[category] = dict(keep)
+        self.keys[category] = sorted(entries)
+
+    def add(self, category, entry):
+        entry = entry.strip()
+        if not entry:
+            return
+        now = time.time()
+        line = json.dumps({"c": category, "e": entry, "t": round(now)}) + "\n"
+        with self.lock:
+            if self.record(self.entries, category, entry, 1, now):
+                keys = self.keys.setdefault(category, [])
+                bisect.insort(keys, entry.lower())
+                # Trim in steps so a full category doesn't pay for a sort on every add
+                if len(keys) > self.max_entries + self.max_entries // 10:
+                    self.trim(category)
+            self.pending.put(line)
+
+    def suggest(self, category, prefix="", limit=MAX_SUGGESTIONS):
+        # Entries starting with prefix, most used first, then most recent
+        prefix = prefix.strip().lower()
+        with self.lock:
+            entries = self.entries.get(category)
+            if not entries:
+                return []
+            keys = self.keys[category]
+            start = bisect.bisect_left(keys, prefix) if prefix else 0
+            end = bisect.bisect_left(keys, prefix[:-1] + chr(ord(prefix[-1]) + 1)) if prefix else len(keys)
+            # [count, last used, entry] lists order by count, then recency
+            best = heapq.nlargest(limit, map(entries.__getitem__, keys[start:end]))
+        return [stats[2] for stats in best]
+
+    def size(self):
+        with self.lock:
+            return sum(len(entries) for entries in self.entries.values())
+
+    def write_loop(self):
+        # Appends whatever has been queued in one write, and compacts once the journal has
+        # grown well past the number of live entries
+        if self.load():
+            self.pending.put("compact")
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item for item in batch if item not in ("compact", "close")]
+            try:
+                if lines:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.writelines(lines)
+                    self.lines += len(lines)
+                if "compact" in batch or self.lines > max(HISTORY_COMPACT_MIN_LINES, HISTORY_COMPACT_RATIO * self.size()):
+                    if self.compact():
+                        batch.append("close")
+            except OSError:
+                pass  # History is best effort; the searches themselves already succeeded
+            if "close" in batch:
+                return
+
+    def compact(self):
+        # Rewrites the journal from memory. Lines still queued are already counted in memory,
+        # so they are dropped here; True when a close request was among them.
+        with self.lock:
+            closing = False
+            while True:
+                try:
+                    closing = self.pending.get_nowait() == "close" or closing
+                except queue.Empty:
+                    break
+            lines = [json.dumps({"c": category, "e": stats[2], "t": round(stats[1]), "n": stats[0]}) + "\n"
+                     for category, entries in self.entries.items() for stats in entries.values()]
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp, self.path)
+        self.lines = len(lines)
+        return closing
+
+    def close(self, timeout=5):
+        # Waits for queued lines to reach the file
+        self.pending.put("close")
+        self.writer.join(timeout)
+
+
+class FortniteApp:
+    def __init__(self, root, snapshot=None):
+        self.root = root
+        self.root.title("fortnite-api.com")
+        self.api_key = ""
+        self.api = None
+        self.snapshot = snapshot
+        self.async_api = None
+        self.loop_thread = None
+        self.bulk_future = None
+        self.aes_batch = None
+        self.catalog = CosmeticsCatalog()
+        self.debounce_jobs = {}
+        self.completing = False  # Set while autocomplete writes a suggestion into an entry
+        self.completions = {}  # StringVar name -> (completed text, what was actually typed)
+        self.age_vars = {}
+        self.history = HistoryJournal()
+        self.stats_history = StatsHistory()
+        self.shop_archive = ShopArchive()
+        self.shop_diff = None
+        self.news_diff = None
+        self.news_tags = {}  # MOTD key -> Text tag spanning its block
+        self.news_tag_count = 0
+        self.load_config()
+        if self.api is None and snapshot is not None and snapshot.mode == "replay":
+            # Replay never reaches the API, so no key is needed
+            self.api = FortniteAPI("replay", snapshot=snapshot)
+
+        self.create_widgets()
+        self.tasks = TaskRunner(self.root, on_change=self.update_busy)
+        self.root.bind("<Escape>", lambda e: self.cancel_current_tab())
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.scheduler = RefreshScheduler(self)
+        # Background work starts once the window is up
+        self.root.after_idle(self.on_startup)
+
+    def on_startup(self):
+        elapsed = (time.perf_counter() - STARTED_AT) * 1000
+        note = "" if elapsed <= STARTUP_TARGET_MS else f" (target {STARTUP_TARGET_MS} ms)"
+        self.set_status(f"Welcome to fortnite-api.com - started in {elapsed:.0f} ms{note}")
+        self.load_catalog()
+        if self.api:
+            self.scheduler.start()
+        self.update_metrics()
+
+    def load_config(self):
+        if os.path.exists(CONFIG_FILE):
+            try:
+                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                    cfg = json.load(f)
+                    self.api_key = cfg.get("api_key", "")
+                    if self.api_key:
+                        self.api = FortniteAPI(self.api_key, snapshot=self.snapshot)
+            except Exception:
+                pass
+
+    def save_config(self):
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump({"api_key": self.api_key}, f, indent=2)
+
+    def add_history(self, category, entry):
+        # Memory only; the journal is written from its own thread
+        self.history.add(category, entry)
+
+    def create_widgets(self):
+        # Create Credits button on top right
+        credits_btn = ttk.Button(self.root, text="Credits", command=self.show_credits)
+        credits_btn.pack(anchor="ne", padx=10, pady=5)
+
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(expand=True, fill="both")
+
+        # Create all tabs
+        self.tabs = {}
+
+        tab_names = [
+            "Cosmetics", "News", "Stats", "Bulk Stats", "Shop", "Map Info", "Season Info",
+            "Languages", "Upcoming", "Creative", "Paks", "Banners",
+            "AES Decrypt", "Creator Codes", "Diagnostics", "Settings"
+        ]
+
+        for name in tab_names:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=name)
+            self.tabs[name] = frame
+
+        # Tabs are filled in the first time they are opened, so only Cosmetics is built at startup
+        self.tab_builders = {
+            "Cosmetics": self.build_cosmetics_tab,
+            "News": self.build_news_tab,
+            "Stats": self.build_stats_tab,
+            "Bulk Stats": self.build_bulk_stats_tab,
+            "Shop": self.build_shop_tab,
+            "Map Info": self.build_map_tab,
+            "Season Info": self.build_season_tab,
+            "Languages": self.build_languages_tab,
+            "Upcoming": self.build_upcoming_tab,
+            "Creative": self.build_creative_tab,
+            "Paks": self.build_paks_tab,
+            "Banners": self.build_banners_tab,
+            "AES Decrypt": self.build_aes_tab,
+            "Creator Codes": self.build_creator_code_tab,
+            "Diagnostics": self.build_diagnostics_tab,
+            "Settings": self.build_settings_tab,
+        }
+        self.built_tabs = set()
+        self.ensure_tab(tab_names[0])
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.ensure_tab(self.current_tab()))
+
+        status_bar = ttk.Frame(self.root)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.busy_label = ttk.Label(status_bar, text="Idle", relief=tk.SUNKEN, anchor="e", width=24)
+        self.busy_label.pack(side=tk.RIGHT)
+        self.metrics_label = ttk.Label(status_bar, text="", relief=tk.SUNKEN, anchor="e")
+        self.metrics_label.pack(side=tk.RIGHT)
+        self.status_label = ttk.Label(status_bar, text="Welcome to fortnite-api.com", relief=tk.SUNKEN, anchor="w")
+        self.status_label.pack(side=tk.LEFT, expand=True, fill=tk.X)
+
+    def show_credits(self):
+        messagebox.showinfo("Credits", "Created by:\n\nhbkvxncent\nynwglobal")
+
+    def set_status(self, text):
+        self.status_label.config(text=text)
+
+    def update_busy(self, running, queued):
+        if running or queued:
+            self.busy_label.config(text=f"Busy: {running} running, {queued} queued")
+        else:
+            self.busy_label.config(text="Idle")
+
+    def current_tab(self):
+        return self.notebook.tab(self.notebook.select(), "text")
+
+    def ensure_tab(self, name):
+        if name in self.built_tabs:
+            return
+        self.built_tabs.add(name)
+        self.tab_builders[name]()
+        if name in WARM_ENDPOINTS:
+            # Show whatever the background refresh has already fetched
+            self.scheduler.render_cached(name)
+            self.scheduler.update_age(name)
+
+    def cancel_current_tab(self):
+        tab = self.current_tab()
+        self.tasks.cancel(tab)
+        if tab == "AES Decrypt":
+            self.stop_aes_batch()
+        self.set_status(f"{tab}: cancelled.")
+
+    def add_age_label(self, tab):
+        self.age_vars[tab] = tk.StringVar(value="Not loaded yet")
+        ttk.Label(self.tabs[tab], textvariable=self.age_vars[tab]).pack(anchor="e", padx=5)
+
+    def on_close(self):
+        self.stop_aes_batch()
+        self.scheduler.stop()
+        self.tasks.shutdown()
+        if self.snapshot is not None:
+            self.snapshot.close()
+        self.history.close()
+        self.stats_history.close()
+        self.root.destroy()
+
+    # --- Build individual tabs ---
+
+    def progressive(self, table, label):
+        # on_batch callback that fills a VirtualTable while a response streams in; the first
+        # batch replaces the previous rows so they stay visible until new ones arrive
+        shown = [0]
+
+        def on_batch(batch):
+            if shown[0]:
+                table.append_items(batch)
+            else:
+                table.set_items(batch)
+            shown[0] += len(batch)
+            self.set_status(f"{label}: {shown[0]} so far...")
+
+        return on_batch
+
+    def build_cosmetics_tab(self):
+        tab = self.tabs["Cosmetics"]
+        ttk.Label(tab, text="Search Cosmetics by Name:").pack(anchor="w", padx=5, pady=5)
+        self.cos_search_var = tk.StringVar()
+        search_entry = ttk.Combobox(tab, textvariable=self.cos_search_var)
+        self.add_autocomplete(search_entry, self.cos_search_var, "cosmetics")
+        search_entry.pack(fill="x", padx=5)
+        search_entry.bind("<Return>", lambda e: self.start_search("Cosmetics", self.do_cosmetics_search))
+        self.cos_search_var.trace_add("write", lambda *args: self.on_cosmetics_typed())
+
+        buttons = ttk.Frame(tab)
+        buttons.pack(pady=5)
+        search_btn = ttk.Button(buttons, text="Search", command=lambda: self.start_search("Cosmetics", self.do_cosmetics_search))
+        search_btn.pack(side=tk.LEFT, padx=5)
+        update_btn = ttk.Button(buttons, text="Update Catalog", command=self.do_catalog_update)
+        update_btn.pack(side=tk.LEFT, padx=5)
+        self.catalog_status_var = tk.StringVar(value="Local catalog: not loaded (searching online)")
+        ttk.Label(tab, textvariable=self.catalog_status_var).pack(anchor="w", padx=5)
+
+        self.cos_results = VirtualTable(tab, [
+            ("name", "Name", 200), ("type", "Type", 100), ("rarity", "Rarity", 100),
+            ("set", "Set", 160), ("id", "ID", 220),
+        ])
+        self.cos_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def update_catalog_status(self):
+        if self.catalog.available():
+            updated = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.catalog.updated))
+            self.catalog_status_var.set(f"Local catalog: {len(self.catalog.items)} items, updated {updated}")
+        else:
+            self.catalog_status_var.set("Local catalog: not loaded (searching online)")
+
+    def load_catalog(self):
+        # Startup: load the local catalog, then fetch it once or merge the latest additions
+        self.tasks.submit("Catalog", self.catalog.load, self.on_catalog_loaded)
+
+    def on_catalog_loaded(self, loaded):
+        self.update_catalog_status()
+        if self.api:
+            self.do_catalog_update(quiet=loaded)
+
+    def do_catalog_update(self, quiet=False):
+        if not self.api:
+            if not quiet:
+                messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        api = self.api
+
+        def work():
+            if self.catalog.available():
+                return f"Catalog updated: {self.catalog.refresh(api)} new or changed cosmetics."
+            return f"Catalog downloaded: {self.catalog.download(api)} cosmetics."
+
+        def failed(e):
+            self.set_status("Catalog update failed.")
+            self.update_catalog_status()
+            if not quiet:
+                messagebox.showerror("Catalog Error", str(e))
+
+        self.set_status("Updating cosmetics catalog...")
+        self.tasks.submit("Catalog", work, self.on_catalog_updated, failed)
+
+    def on_catalog_updated(self, message):
+        self.set_status(message)
+        self.update_catalog_status()
+
+    # --- Search as you type ---
+
+    def history_suggestions(self, category, prefix=""):
+        # Most used first, matching what has been typed so far
+        return self.history.suggest(category, prefix)
+
+    def add_autocomplete(self, combobox, var, category):
+        # The dropdown lists history matches; typing at the end of the text also completes
+        # to the best match, with the completed part selected so the next key replaces it
+        combobox.configure(postcommand=lambda: combobox.configure(
+            values=self.history_suggestions(category, var.get())))
+
+        def complete(event):
+            if not event.char or not event.char.isprintable():
+                return
+            typed = var.get()
+            if combobox.index(tk.INSERT) != len(typed):
+                return
+            best = self.history.suggest(category, typed, 1)
+            if best and len(best[0]) > len(typed) and best[0].lower().startswith(typed.lower()):
+                completed = typed + best[0][len(typed):]
+                self.completions[str(var)] = (completed, typed)
+                # The search-as-you-type traces skip this write; they already saw the keystroke
+                self.completing = True
+                try:
+                    var.set(completed)
+                finally:
+                    self.completing = False
+                combobox.icursor(len(typed))
+                combobox.select_range(len(typed), tk.END)
+
+        combobox.bind("<KeyRelease>", complete, add="+")
+
+    def typed_text(self, var):
+        # What the user typed, without a suggestion autocomplete has filled in after it
+        value = var.get()
+        completed = self.completions.get(str(var))
+        return completed[1] if completed and completed[0] == value else value
+
+    def schedule_search(self, tab, func, delay):
+        job = self.debounce_jobs.pop(tab, None)
+        if job is not None:
+            self.root.after_cancel(job)
+        self.debounce_jobs[tab] = self.root.after(delay, lambda: self.start_search(tab, func, typed=True))
+
+    def start_search(self, tab, func, typed=False):
+        job = self.debounce_jobs.pop(tab, None)
+        if job is not None:
+            self.root.after_cancel(job)
+        func(typed)
+
+    def on_cosmetics_typed(self):
+        if self.completing:
+            return
+        delay = SEARCH_DEBOUNCE_LOCAL_MS if self.catalog.available() else SEARCH_DEBOUNCE_REMOTE_MS
+        self.schedule_search("Cosmetics", self.do_cosmetics_search, delay)
+
+    def on_stats_typed(self):
+        if self.completing:
+            return
+        if len(self.typed_text(self.stats_user_var).strip()) >= MIN_REMOTE_QUERY_LENGTH:
+            self.schedule_search("Stats", self.do_stats_lookup, STATS_DEBOUNCE_MS)
+
+    def do_cosmetics_search(self, typed=False):
+        # Search-as-you-type looks for what was typed; Enter or Search accepts the completion
+        query = (self.typed_text(self.cos_search_var) if typed else self.cos_search_var.get()).strip()
+        if not query:
+            self.tasks.cancel("Cosmetics")
+            if typed:
+                self.cos_results.clear()
+            else:
+                messagebox.showinfo("Input Required", "Please enter a cosmetic name to search.")
+            return
+
+        if self.catalog.available():
+            # Local search is fast enough to run right here; drop any remote search still in flight
+            self.tasks.cancel("Cosmetics")
+            start = time.perf_counter()
+            items = self.catalog.search(query)
+            elapsed = (time.perf_counter() - start) * 1000
+            self.set_status(f"{len(items)} local results for '{query}' in {elapsed:.2f} ms.")
+            self.cos_results.set_items(items)
+            if not typed:
+                self.add_history("cosmetics", query)
+            return
+
+        if not self.api:
+            if not typed:
+                messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        if typed and len(query) < MIN_REMOTE_QUERY_LENGTH:
+            return
+        self.set_status(f"Searching cosmetics for '{query}'...")
+        api = self.api
+        self.tasks.submit(
+            "Cosmetics", lambda: api.stream_cosmetics(query),
+            lambda count: self.show_cosmetics(query, count, typed),
+            lambda e: self.cosmetics_failed(query, e, typed),
+            self.progressive(self.cos_results, f"Cosmetics matching '{query}'"),
+        )
+
+    def show_cosmetics(self, query, count, typed):
+        self.set_status(f"Search complete: {count} cosmetics.")
+        if not count:
+            self.cos_results.clear()
+        if not typed:
+            self.add_history("cosmetics", query)
+
+    def cosmetics_failed(self, query, error, typed):
+        self.cos_results.clear()
+        if typed:
+            self.set_status(f"No results for '{query}': {error}")
+        else:
+            self.set_status("Search failed.")
+            messagebox.showerror("API Error", str(error))
+
+    def build_news_tab(self):
+        tab = self.tabs["News"]
+        refresh_btn = ttk.Button(tab, text="Refresh News", command=self.do_news_refresh)
+        refresh_btn.pack(pady=5)
+        self.add_age_label("News")
+        self.news_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
+        self.news_results.pack(expand=True, fill="both", padx=5, pady=5)
+        self.news_results.tag_configure("news_new", background="#e3f6e3")
+        self.news_results.tag_configure("news_changed", background="#fff4d6")
+
+    def do_news_refresh(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching news...")
+        api = self.api
+        self.tasks.submit("News", lambda: self.fetched("News", api.get_news()), self.show_news)
+        self.add_history("news", "refresh")
+
+    def fetched(self, tab, data):
+        # Runs on the worker after every fetch of a tab, manual or scheduled, for work that
+        # shouldn't happen on the Tk thread
+        if tab == "Shop" and isinstance(data.get("data"), list):
+            try:
+                self.shop_archive.record(data["data"])
+            except OSError:
+                pass  # The archive is best effort; the shop itself still shows
+        return data
+
+    def news_block(self, motd):
+        return f"Title: {motd.get('title')}\nBody: {motd.get('body')}\n{'-' * 40}\n"
+
+    def show_news(self, data):
+        if "error" in data:
+            self.set_status("News fetched.")
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        news_items = data.get("data", {}).get("br", {}).get("motds", [])
+        previous = self.news_diff
+        diff = self.news_diff = SnapshotDiff([n for n in news_items if isinstance(n, dict)], news_entry_key, previous)
+        text = self.news_results
+        self.scheduler.update_age("News")
+        if previous is not None and not diff.modified():
+            self.set_status(f"News unchanged ({diff.unchanged} items).")
+            return
+        self.set_status(f"News fetched: {diff.summary()}." if previous is not None else "News fetched.")
+        kept = [k for k in diff.keys if k in previous.hashes] if previous is not None else None
+        if kept is None or kept != [k for k in previous.keys if k in diff.hashes]:
+            # First load, or the surviving items were reordered: lay out every block
+            text.delete(1.0, tk.END)
+            for tag in self.news_tags.values():
+                text.tag_delete(tag)
+            self.news_tags = {}
+            for k in diff.keys:
+                status = diff.status(k)
+                text.insert(tk.END, self.news_block(diff.items[k]),
+                            (self.news_tag(k),) + ((f"news_{status}",) if status else ()))
+            return
+        # Only the blocks that changed are touched; highlights move to this refresh's changes
+        text.tag_remove("news_new", 1.0, tk.END)
+        text.tag_remove("news_changed", 1.0, tk.END)
+        for k in diff.removed:
+            tag = self.news_tags.pop(k)
+            text.delete(*text.tag_ranges(tag))
+            text.tag_delete(tag)
+        for k in diff.changed:
+            start, end = text.tag_ranges(self.news_tags[k])
+            text.delete(start, end)
+            text.insert(start, self.news_block(diff.items[k]), (self.news_tags[k], "news_changed"))
+        # Added blocks go in front of the next block already shown, working back from the end
+        for i in range(len(diff.keys) - 1, -1, -1):
+            k = diff.keys[i]
+            if k in self.news_tags:
+                continue
+            following = next((self.news_tags[n] for n in diff.keys[i + 1:] if n in self.news_tags), None)
+            index = text.tag_ranges(following)[0] if following else tk.END
+            text.insert(index, self.news_block(diff.items[k]), (self.news_tag(k), "news_new"))
+
+    def news_tag(self, key):
+        # A fresh Text tag for one MOTD's block
+        self.news_tag_count += 1
+        self.news_tags[key] = f"motd{self.news_tag_count}"
+        return self.news_tags[key]
+
+    def build_stats_tab(self):
+        tab = self.tabs["Stats"]
+        ttk.Label(tab, text="Enter Epic Username:").pack(anchor="w", padx=5, pady=5)
+        self.stats_user_var = tk.StringVar()
+        user_entry = ttk.Combobox(tab, textvariable=self.stats_user_var)
+        self.add_autocomplete(user_entry, self.stats_user_var, "stats")
+        user_entry.pack(fill="x", padx=5)
+        user_entry.bind("<Return>", lambda e: self.start_search("Stats", self.do_stats_lookup))
+        self.stats_user_var.trace_add("write", lambda *args: self.on_stats_typed())
+
+        buttons = ttk.Frame(tab)
+        buttons.pack(pady=5)
+        stats_btn = ttk.Button(buttons, text="Lookup Stats", command=lambda: self.start_search("Stats", self.do_stats_lookup))
+        stats_btn.pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Tracked Players", command=self.do_stats_leaderboard).pack(side=tk.LEFT, padx=5)
+
+        self.stats_results = scrolledtext.ScrolledText(tab, height=25, wrap=tk.WORD)
+        self.stats_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def format_stat_category(self, category_name, stats_dict):
+        # Format each category (Overall, Solo, Duo, Squad, LTM) neat and readable
+        lines = [f"=== {category_name} Stats ==="]
+        # Display keys in neat order with friendly names and formatting
+        for key, label in STAT_FIELDS:
+            if key in stats_dict:
+                value = stats_dict[key]
+                # Format floats nicely
+                if isinstance(value, float):
+                    value = f"{value:.3f}"
+                lines.append(f"{label}: {value}")
+        lines.append("")  # blank line for spacing
+        return "\n".join(lines)
+
+    def do_stats_lookup(self, typed=False):
+        username = (self.typed_text(self.stats_user_var) if typed else self.stats_user_var.get()).strip()
+        if not self.api:
+            if not typed:
+                messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        if not username:
+            if not typed:
+                messagebox.showinfo("Input Required", "Please enter an Epic username.")
+            return
+
+        self.set_status(f"Fetching stats for {username}...")
+        api = self.api
+
+        def work():
+            # Recorded and summarised here so neither the file write nor numpy runs on the Tk thread.
+            # Search-as-you-type lookups of partial names are never recorded.
+            data = api.get_stats(username)
+            tracked = not typed and self.track_stats(username, data)
+            return data, self.stats_progress(username) if tracked else ""
+
+        self.tasks.submit("Stats", work, lambda result: self.show_stats(username, result[0], typed, result[1]))
+
+    def track_stats(self, username, data):
+        # Adds a lookup to the stats history; False when there was nothing to track
+        player = data.get("data")
+        if "error" in data or not isinstance(player, PlayerStats):
+            return False
+        try:
+            self.stats_history.record(player, username)
+        except (RuntimeError, OSError):
+            return False
+        return True
+
+    def stats_progress(self, username):
+        # Change since the previous lookup and rolling trends, for each mode looked up more than once
+        history = self.stats_history
+        sections = []
+        for mode in STAT_CATEGORIES:
+            times, kd, win_rate = history.trends(username, mode)
+            if len(times) < 2:
+                continue
+            since, deltas = history.deltas(username, mode)
+            last = {key: deltas[key][-1] for key in ("matches", "wins", "kills", "deaths")}
+            changes = [f"{value:+.0f} {key}" for key, value in last.items() if not history.np.isnan(value)]
+            lines = [
+                f"=== {mode.capitalize()} Progress ===",
+                f"Lookups tracked: {len(times)} since {time.strftime('%Y-%m-%d', time.localtime(times[0]))}",
+                "Since last lookup: " + (", ".join(changes) or "no change"),
+            ]
+            for label, values in (("K/D", kd), ("Win Rate %", win_rate)):
+                recent = values[~history.np.isnan(values)][-STATS_TREND_WINDOW:]
+                if len(recent):
+                    trend = " -> ".join(f"{value:.2f}" for value in recent)
+                    lines.append(f"{label} over the last {STATS_TREND_WINDOW} lookups: {trend}")
+            lines.append("")
+            sections.append("\n".join(lines))
+        return "\n".join(sections)
+
+    def do_stats_leaderboard(self):
+        history = self.stats_history
+
+        def work():
+            output = [f"Tracked players: {len(history.players())}", ""]
+            for key, label, fmt in LEADERBOARD_FIELDS:
+                output.append(f"=== {label} (Overall) ===")
+                board = history.leaderboard(key, "overall")
+                output.extend(f"{rank}. {name}: {value:{fmt}}" for rank, (name, value) in enumerate(board, 1))
+                output.append("")
+            return "\n".join(output)
+
+        def failed(e):
+            self.set_status(f"Stats history unavailable: {e}")
+
+        self.set_status("Loading stats history...")
+        self.tasks.submit("Stats", work, self.show_stats_leaderboard, failed)
+
+    def show_stats_leaderboard(self, text):
+        self.set_status("Leaderboards ready.")
+        self.stats_results.delete(1.0, tk.END)
+        self.stats_results.insert(tk.END, text)
+
+    def show_stats(self, username, data, typed, progress=""):
+        self.set_status("Stats fetched.")
+        if "error" in data:
+            if typed:
+                self.set_status(f"No stats for '{username}': {data['error']}")
+            else:
+                messagebox.showerror("API Error", data["error"])
+            return
+
+        player = data.get("data")
+        if not isinstance(player, PlayerStats):
+            player = PlayerStats("", {})
+
+        # Categories to format: Overall, Solo, Duo, Squad, Ltm
+        output_sections = []
+        for cat in STAT_CATEGORIES:
+            cat_stats = player.category(cat)
+            if cat_stats:
+                name = cat.capitalize()
+                section_text = self.format_stat_category(name, cat_stats)
+                output_sections.append(section_text)
+
+        if not output_sections:
+            self.stats_results.delete(1.0, tk.END)
+            self.stats_results.insert(tk.END, "No stats available for this user.")
+        else:
+            self.stats_results.delete(1.0, tk.END)
+            self.stats_results.insert(tk.END, "\n".join(output_sections + [progress]))
+
+        if not typed:
+            self.add_history("stats", username)
+
+    def build_bulk_stats_tab(self):
+        tab = self.tabs["Bulk Stats"]
+        ttk.Label(tab, text="Epic Usernames (one per line):").pack(anchor="w", padx=5, pady=5)
+        self.bulk_input = scrolledtext.ScrolledText(tab, height=6, wrap=tk.WORD)
+        self.bulk_input.pack(fill="x", padx=5)
+
+        controls = ttk.Frame(tab)
+        controls.pack(fill="x", padx=5, pady=5)
+        ttk.Button(controls, text="Load File...", command=self.load_bulk_file).pack(side=tk.LEFT)
+        ttk.Label(controls, text="Mode:").pack(side=tk.LEFT, padx=(10, 2))
+        self.bulk_mode_var = tk.StringVar(value="overall")
+        mode_box = ttk.Combobox(controls, textvariable=self.bulk_mode_var, values=STAT_CATEGORIES, state="readonly", width=10)
+        mode_box.pack(side=tk.LEFT)
+        ttk.Button(controls, text="Export To...", command=self.choose_bulk_export).pack(side=tk.LEFT, padx=(10, 0))
+        self.bulk_export_var = tk.StringVar()
+        ttk.Label(controls, textvariable=self.bulk_export_var).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Stop", command=self.stop_bulk_stats).pack(side=tk.RIGHT)
+        ttk.Button(controls, text="Run Batch", command=self.do_bulk_stats).pack(side=tk.RIGHT, padx=5)
+
+        table_frame = ttk.Frame(tab)
+        table_frame.pack(expand=True, fill="both", padx=5, pady=5)
+        columns = ["username", "status"] + [key for key, label in STAT_FIELDS]
+        self.bulk_table = ttk.Treeview(table_frame, columns=columns, show="headings")
+        self.bulk_table.heading("username", text="Username")
+        self.bulk_table.heading("status", text="Status")
+        self.bulk_table.column("username", width=140)
+        self.bulk_table.column("status", width=80)
+        for key, label in STAT_FIELDS:
+            self.bulk_table.heading(key, text=label)
+            self.bulk_table.column(key, width=90, anchor="e")
+        y_scroll = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.bulk_table.yview)
+        x_scroll = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.bulk_table.xview)
+        self.bulk_table.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        y_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        self.bulk_table.pack(expand=True, fill="both")
+
+    def load_bulk_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            self.bulk_input.delete(1.0, tk.END)
+            self.bulk_input.insert(tk.END, f.read())
+
+    def choose_bulk_export(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=".csv", filetypes=[("CSV", "*.csv"), ("NDJSON", "*.ndjson"), ("All files", "*.*")]
+        )
+        self.bulk_export_var.set(path or "")
+
+    def get_async_api(self):
+        if self.loop_thread is None:
+            self.loop_thread = AsyncLoopThread()
+        if self.async_api is None:
+            self.async_api = AsyncFortniteAPI.from_client(self.api)
+        return self.async_api
+
+    def do_bulk_stats(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        if self.bulk_future is not None and not self.bulk_future.done():
+            messagebox.showinfo("Busy", "A batch is already running.")
+            return
+        text = self.bulk_input.get("1.0", "end")
+        usernames = list(dict.fromkeys(n.strip() for n in text.replace(",", "\n").splitlines() if n.strip()))
+        if not usernames:
+            messagebox.showinfo("Input Required", "Please enter at least one Epic username.")
+            return
+        try:
+            api = self.get_async_api()
+            exporter = StatsExporter(self.bulk_export_var.get()) if self.bulk_export_var.get() else None
+        except Exception as e:
+            messagebox.showerror("Bulk Stats Error", str(e))
+            return
+
+        self.bulk_table.delete(*self.bulk_table.get_children())
+        self.bulk_results = queue.Queue()
+        self.bulk_progress = {"total": len(usernames), "done": 0, "failed": 0, "start": time.time()}
+        category = self.bulk_mode_var.get()
+        self.bulk_future = self.loop_thread.submit(
+            self.run_bulk_stats(api, usernames, category, exporter, self.bulk_results)
+        )
+        self.set_status(f"Bulk stats: fetching {len(usernames)} players...")
+        self.root.after(100, self.poll_bulk_results)
+        self.add_history("bulk_stats", f"{len(usernames)} players ({category})")
+
+    async def run_bulk_stats(self, api, usernames, category, exporter, results):
+        # Runs on the background loop; rows go to the exporter and the results queue as they complete
+        import asyncio
+
+        async def lookup(name):
+            return name, await api.get_stats(name)
+
+        tasks = [asyncio.ensure_future(lookup(name)) for name in usernames]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, data = await next_done
+                row = bulk_stats_row(name, data, category)
+                # numpy and a file append: kept off the loop so other lookups keep running
+                await asyncio.to_thread(self.track_stats, name, data)
+                if exporter:
+                    exporter.write(row)
+                results.put(row)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if exporter:
+                exporter.close()
+            results.put(None)
+
+    def poll_bulk_results(self):
+        future_done = self.bulk_future.done()
+        finished = False
+        for _ in range(200):
+            try:
+                row = self.bulk_results.get_nowait()
+            except queue.Empty:
+                break
+            if row is None:
+                finished = True
+                break
+            self.bulk_progress["done"] += 1
+            if row["status"] != "ok":
+                self.bulk_progress["failed"] += 1
+            values = [row["username"], row["status"]]
+            for key, label in STAT_FIELDS:
+                value = row["stats"].get(key, "")
+                values.append(f"{value:.3f}" if isinstance(value, float) else value)
+            self.bulk_table.insert("", tk.END, values=values)
+        if future_done and self.bulk_results.empty():
+            # Cancelled before the coroutine got to run
+            finished = True
+
+        p = self.bulk_progress
+        elapsed = max(time.time() - p["start"], 1e-6)
+        summary = f"{p['done']}/{p['total']} players ({p['failed']} failed) - {p['done'] / elapsed:.1f} players/s"
+        if finished:
+            self.set_status(f"Bulk stats finished: {summary}")
+        else:
+            self.set_status(f"Bulk stats: {summary}")
+            self.root.after(100, self.poll_bulk_results)
+
+    def stop_bulk_stats(self):
+        if self.bulk_future is not None and not self.bulk_future.done():
+            self.bulk_future.cancel()
+
+    def build_shop_tab(self):
+        tab = self.tabs["Shop"]
+        refresh_btn = ttk.Button(tab, text="Refresh Shop", command=self.do_shop_refresh)
+        refresh_btn.pack(pady=5)
+        self.add_age_label("Shop")
+        lookup = ttk.Frame(tab)
+        lookup.pack(fill="x", padx=5)
+        ttk.Label(lookup, text="Item name or ID:").pack(side=tk.LEFT)
+        self.last_seen_var = tk.StringVar()
+        last_seen_entry = ttk.Entry(lookup, textvariable=self.last_seen_var)
+        last_seen_entry.pack(side=tk.LEFT, expand=True, fill="x", padx=5)
+        last_seen_entry.bind("<Return>", lambda e: self.do_last_seen())
+        ttk.Button(lookup, text="Last In Shop", command=self.do_last_seen).pack(side=tk.LEFT)
+        self.shop_results = VirtualTable(tab, [
+            ("change", "Change", 80), ("section", "Section", 90), ("name", "Name", 240),
+            ("price", "Price (V-Bucks)", 110), ("rarity", "Rarity", 110),
+        ])
+        self.shop_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_shop_refresh(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+
+        self.set_status("Fetching shop data...")
+        api = self.api
+        self.tasks.submit("Shop", lambda: self.fetched("Shop", api.get_shop()), self.show_shop)
+        self.add_history("shop", "refresh")
+
+    def show_shop(self, data):
+        if "error" in data:
+            self.set_status("Shop data fetched.")
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        previous = self.shop_diff
+        diff = self.shop_diff = SnapshotDiff(data.get("data") or [], shop_entry_key, previous)
+        self.scheduler.update_age("Shop")
+        if previous is not None and not diff.modified():
+            self.set_status(f"Shop unchanged ({diff.unchanged} offers).")
+            return
+        self.set_status(f"Shop fetched: {diff.summary()}." if previous is not None else "Shop data fetched.")
+        # Offers that left the shop stay listed, marked removed, until the next refresh
+        items = [diff.items[k] for k in diff.keys] + diff.removed_items
+        changes = {id(item): diff.status(k) for k, item in zip(diff.keys + diff.removed, items)}
+        table = self.shop_results
+        table.update_items(items, lambda item: (changes[id(item)],) + table.default_row(item)[1:])
+
+    def do_last_seen(self):
+        query = self.last_seen_var.get().strip()
+        if not query:
+            messagebox.showinfo("Input Required", "Please enter an item name or ID.")
+            return
+        archive = self.shop_archive
+
+        def work():
+            stats = archive.stats()
+            lines = []
+            for when, entry in archive.last_seen(query):
+                seen = "in the shop now" if when == stats["latest"] else time.strftime("%Y-%m-%d", time.localtime(when))
+                lines.append(f"{entry.name} ({entry.section}, {entry.price} V-Bucks): {seen}")
+            return stats, lines
+
+        self.tasks.submit("Last Seen", work, lambda result: self.show_last_seen(query, *result))
+
+    def show_last_seen(self, query, stats, lines):
+        archived = f"{stats['rotations']} rotations, {stats['offers']} offers archived"
+        if not lines:
+            self.set_status(f"'{query}' hasn't been in the shop since archiving started ({archived}).")
+            return
+        self.set_status(f"Last in shop: {lines[0]}")
+        messagebox.showinfo("Last In Shop", "\n".join(lines) + f"\n\n({archived})")
+
+    def build_map_tab(self):
+        tab = self.tabs["Map Info"]
+        refresh_btn = ttk.Button(tab, text="Refresh Map Info", command=self.do_map_info)
+        refresh_btn.pack(pady=5)
+        self.map_results = scrolledtext.ScrolledText(tab, height=20, wrap=tk.WORD)
+        self.map_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_map_info(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching map info...")
+        self.tasks.submit("Map Info", self.api.get_map, self.show_map_info)
+
+    def show_map_info(self, data):
+        self.set_status("Map info fetched.")
+        if "error" in data:
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        pois = data.get("data", {}).get("pois", [])
+        output = []
+        for p in pois:
+            coords = p.get("coordinates", "")
+            output.append(f"{p.get('name')} - Coordinates: {coords}")
+        self.map_results.delete(1.0, tk.END)
+        self.map_results.insert(tk.END, "\n".join(output))
+
+    def build_season_tab(self):
+        tab = self.tabs["Season Info"]
+        refresh_btn = ttk.Button(tab, text="Refresh Season Info", command=self.do_season_info)
+        refresh_btn.pack(pady=5)
+        self.add_age_label("Season Info")
+        self.season_results = scrolledtext.ScrolledText(tab, height=10, wrap=tk.WORD)
+        self.season_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_season_info(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching season info...")
+        self.tasks.submit("Season Info", self.api.get_season, self.show_season_info)
+
+    def show_season_info(self, data):
+        self.set_status("Season info fetched.")
+        if "error" in data:
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        d = data.get("data", {})
+        text = (
+            f"Chapter: {d.get('chapter')}\n"
+            f"Season: {d.get('season')}\n"
+            f"Start Date: {d.get('startDate')}\n"
+            f"End Date: {d.get('endDate')}"
+        )
+        self.season_results.delete(1.0, tk.END)
+        self.season_results.insert(tk.END, text)
+        self.scheduler.update_age("Season Info")
+
+    def build_languages_tab(self):
+        tab = self.tabs["Languages"]
+        refresh_btn = ttk.Button(tab, text="Refresh Languages", command=self.do_languages_list)
+        refresh_btn.pack(pady=5)
+        self.lang_results = scrolledtext.ScrolledText(tab, height=15, wrap=tk.WORD)
+        self.lang_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_languages_list(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching languages...")
+        self.tasks.submit("Languages", self.api.get_languages, self.show_languages)
+
+    def show_languages(self, data):
+        self.set_status("Languages fetched.")
+        if "error" in data:
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        languages = data.get("data", [])
+        output = [f"{l.get('code')}: {l.get('name')}" for l in languages]
+        self.lang_results.delete(1.0, tk.END)
+        self.lang_results.insert(tk.END, "\n".join(output))
+
+    def build_upcoming_tab(self):
+        tab = self.tabs["Upcoming"]
+        refresh_btn = ttk.Button(tab, text="Refresh Upcoming Cosmetics", command=self.do_upcoming)
+        refresh_btn.pack(pady=5)
+        self.add_age_label("Upcoming")
+        self.upcoming_results = VirtualTable(tab, [
+            ("name", "Name", 220), ("type", "Type", 110), ("rarity", "Rarity", 110), ("id", "ID", 240),
+        ])
+        self.upcoming_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_upcoming(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching upcoming cosmetics...")
+        self.tasks.submit("Upcoming", self.api.get_upcoming, self.show_upcoming)
+
+    def show_upcoming(self, data):
+        self.set_status("Upcoming cosmetics fetched.")
+        if "error" in data:
+            messagebox.showerror("API Error", data["error"])
+            return
+
+        self.upcoming_results.set_items(new_cosmetic_items(data))
+        self.scheduler.update_age("Upcoming")
+
+    def build_creative_tab(self):
+        tab = self.tabs["Creative"]
+        refresh_btn = ttk.Button(tab, text="Refresh Creative Islands", command=self.do_creative)
+        refresh_btn.pack(pady=5)
+        self.creative_results = VirtualTable(tab, [
+            ("title", "Title", 260), ("creator", "Creator", 160), ("code", "Code", 140),
+        ])
+        self.creative_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_creative(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching creative islands...")
+        self.tasks.submit(
+            "Creative", self.api.stream_creative, self.show_creative, self.stream_failed,
+            self.progressive(self.creative_results, "Creative islands"),
+        )
+
+    def show_creative(self, count):
+        self.set_status(f"Creative islands fetched: {count} entries.")
+        if not count:
+            self.creative_results.clear()
+
+    def stream_failed(self, error):
+        self.set_status("Request failed.")
+        messagebox.showerror("API Error", str(error))
+
+    def build_paks_tab(self):
+        tab = self.tabs["Paks"]
+        refresh_btn = ttk.Button(tab, text="Refresh Paks Info", command=self.do_paks)
+        refresh_btn.pack(pady=5)
+        self.paks_results = VirtualTable(tab, [("name", "Name", 220), ("path", "Path", 420)])
+        self.paks_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_paks(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching paks info...")
+        self.tasks.submit(
+            "Paks", self.api.stream_paks, self.show_paks, self.stream_failed,
+            self.progressive(self.paks_results, "Paks info"),
+        )
+
+    def show_paks(self, count):
+        self.set_status(f"Paks info fetched: {count} entries.")
+        if not count:
+            self.paks_results.clear()
+
+    def build_banners_tab(self):
+        tab = self.tabs["Banners"]
+        refresh_btn = ttk.Button(tab, text="Refresh Banners", command=self.do_banners)
+        refresh_btn.pack(pady=5)
+        self.banners_results = VirtualTable(tab, [
+            ("name", "Name", 220), ("category", "Category", 160), ("id", "ID", 220),
+        ])
+        self.banners_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_banners(self):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        self.set_status("Fetching banners...")
+        self.tasks.submit(
+            "Banners", self.api.stream_banners, self.show_banners, self.stream_failed,
+            self.progressive(self.banners_results, "Banners"),
+        )
+
+    def show_banners(self, count):
+        self.set_status(f"Banners fetched: {count} entries.")
+        if not count:
+            self.banners_results.clear()
+
+    def build_aes_tab(self):
+        tab = self.tabs["AES Decrypt"]
+        ttk.Label(tab, text="Enter Base64 Encrypted Text:").pack(anchor="w", padx=5, pady=5)
+        self.aes_input = tk.Text(tab, height=5)
+        self.aes_input.pack(fill="x", padx=5)
+
+        ttk.Label(tab, text="Enter Key (16, 24 or 32 chars):").pack(anchor="w", padx=5, pady=5)
+        self.aes_key_var = tk.StringVar()
+        aes_key_entry = ttk.Entry(tab, textvariable=self.aes_key_var, show="*")
+        aes_key_entry.pack(fill="x", padx=5)
+
+        buttons = ttk.Frame(tab)
+        buttons.pack(pady=5)
+        ttk.Button(buttons, text="Decrypt", command=self.do_aes_decrypt).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Decrypt Files...", command=self.do_aes_files).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Decrypt Folder...", command=self.do_aes_folder).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Decrypt Base64 Lines...", command=self.do_aes_lines).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Stop", command=self.stop_aes_batch).pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(tab, text="Decrypted Text / Report:").pack(anchor="w", padx=5, pady=5)
+        self.aes_output = scrolledtext.ScrolledText(tab, height=10, wrap=tk.WORD)
+        self.aes_output.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_aes_decrypt(self):
+        enc_text = self.aes_input.get("1.0", "end").strip()
+        key = self.aes_key_var.get()
+        if not enc_text or not key:
+            messagebox.showerror("Input Error", "Both encrypted text and key are required.")
+            return
+
+        def work():
+            return decrypt_base64(aes_key_bytes(key), enc_text).decode("utf-8")
+
+        self.tasks.submit("AES Decrypt", work, self.show_aes_result,
+                          lambda e: messagebox.showerror("Decryption Error", str(e)))
+
+    def show_aes_result(self, text):
+        self.aes_output.delete(1.0, tk.END)
+        self.aes_output.insert(tk.END, text)
+
+    # --- Batch decryption: files, folders and files of base64 lines ---
+
+    def do_aes_files(self):
+        paths = filedialog.askopenfilenames(title="Encrypted files")
+        if paths:
+            self.start_aes_files(list(paths))
+
+    def do_aes_folder(self):
+        folder = filedialog.askdirectory(title="Folder of encrypted files")
+        if not folder:
+            return
+        paths = sorted(entry.path for entry in os.scandir(folder) if entry.is_file())
+        if not paths:
+            messagebox.showinfo("Input Required", "That folder has no files.")
+            return
+        self.start_aes_files(paths)
+
+    def start_aes_files(self, paths):
+        out_dir = filedialog.askdirectory(title="Write decrypted files to")
+        if out_dir:
+            self.run_aes_batch(f"{len(paths)} files", lambda batch, on_item: batch.decrypt_files(paths, out_dir, on_item))
+
+    def do_aes_lines(self):
+        path = filedialog.askopenfilename(
+            title="File of base64 ciphertexts, one per line", filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        out_path = filedialog.asksaveasfilename(
+            title="Write results to", defaultextension=".ndjson", filetypes=[("NDJSON", "*.ndjson"), ("All files", "*.*")]
+        )
+        if out_path:
+            self.run_aes_batch(os.path.basename(path), lambda batch, on_item: batch.decrypt_lines(path, out_path, on_item))
+
+    def run_aes_batch(self, label, run):
+        # run(batch, on_item) executes on a worker thread and drives the process pool; items,
+        # progress and the final summary come back through the task queue
+        if self.aes_batch is not None:
+            messagebox.showinfo("Busy", "A decryption batch is already running.")
+            return
+        last_update = [0.0]
+
+        def on_progress(done, total, seconds):
+            now = time.monotonic()
+            if now - last_update[0] >= AES_PROGRESS_SECONDS or done == total:
+                last_update[0] = now
+                rate = done / 1e6 / seconds if seconds > 0 else 0.0
+                self.tasks.call_soon(
+                    self.set_status, f"AES {label}: {done / 1e6:.1f}/{total / 1e6:.1f} MB, {rate:.1f} MB/s"
+                )
+
+        try:
+            batch = AesBatch(self.aes_key_var.get(), on_progress=on_progress)
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.aes_batch = batch
+        self.aes_output.delete(1.0, tk.END)
+
+        def work():
+            try:
+                with batch:
+                    return run(batch, lambda record: self.tasks.call_soon(self.show_aes_item, record))
+            finally:
+                # Not tied to the task generation, so a cancelled batch still frees the tab
+                self.tasks.call_soon(self.aes_batch_done, batch)
+
+        def failed(e):
+            self.set_status(f"AES {label}: failed.")
+            messagebox.showerror("Decryption Error", str(e))
+
+        self.set_status(f"AES {label}: starting...")
+        # Its own task key, so a paste decrypt meanwhile doesn't supersede the batch's summary
+        self.tasks.submit("AES Batch", work, lambda summary: self.show_aes_summary(label, summary), failed)
+
+    def aes_batch_done(self, batch):
+        if self.aes_batch is batch:
+            self.aes_batch = None
+
+    def stop_aes_batch(self):
+        if self.aes_batch is not None:
+            self.aes_batch.stop()
+
+    def show_aes_item(self, record):
+        if "line" in record:
+            text = f"line {record['line']}: {record['error']}"
+        elif record["status"] == "ok":
+            text = f"{os.path.basename(record['input'])}: ok -> {record['output']}"
+        else:
+            text = f"{os.path.basename(record['input'])}: {record['error']}"
+        self.aes_output.insert(tk.END, text + "\n")
+
+    def show_aes_summary(self, label, summary):
+        rate = summary["bytes"] / 1e6 / summary["seconds"] if summary["seconds"] > 0 else 0.0
+        state = "stopped" if summary["stopped"] else "finished"
+        text = (f"AES {label} {state}: {summary['items']} items, {summary['failed']} failed, "
+                f"{summary['bytes'] / 1e6:.1f} MB in {summary['seconds']:.1f} s ({rate:.1f} MB/s)")
+        self.aes_output.insert(tk.END, text + "\n")
+        self.set_status(text)
+
+    def build_creator_code_tab(self):
+        tab = self.tabs["Creator Codes"]
+        ttk.Label(tab, text="Enter Creator Code:").pack(anchor="w", padx=5, pady=5)
+        self.creator_code_var = tk.StringVar()
+        creator_code_entry = ttk.Combobox(tab, textvariable=self.creator_code_var)
+        self.add_autocomplete(creator_code_entry, self.creator_code_var, "creator_codes")
+        creator_code_entry.pack(fill="x", padx=5)
+        creator_code_entry.bind("<Return>", lambda e: self.do_creator_code_lookup())
+
+        lookup_btn = ttk.Button(tab, text="Lookup", command=self.do_creator_code_lookup)
+        lookup_btn.pack(pady=5)
+
+        self.creator_code_results = scrolledtext.ScrolledText(tab, height=15, wrap=tk.WORD)
+        self.creator_code_results.pack(expand=True, fill="both", padx=5, pady=5)
+
+    def do_creator_code_lookup(self):
+        code = self.creator_code_var.get().strip()
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        if not code:
+            messagebox.showinfo("Input Required", "Please enter a creator code.")
+            return
+
+        self.set_status(f"Looking up creator code '{code}'...")
+        api = self.api
+        self.tasks.submit("Creator Codes", lambda: api.get_creator_code(code),
+                          lambda data: self.show_creator_code(code, data))
+
+    def show_creator_code(self, code, data):
+        self.set_status("Lookup complete.")
+        if "error" in data:
+            messagebox.showerror("API Error", data["error"])
+            return
+        self.add_history("creator_codes", code)
+
+        d = data.get("data", {})
+        output = [
+            f"Creator: {d.get('account', {}).get('name')}",
+            f"Share Code: {d.get('account', {}).get('shareCode')}",
+            f"Platform: {d.get('account', {}).get('platform')}",
+            f"Total Payments: {d.get('payments', 0)}",
+        ]
+        self.creator_code_results.delete(1.0, tk.END)
+        self.creator_code_results.insert(tk.END, "\n".join(output))
+
+    def build_diagnostics_tab(self):
+        tab = self.tabs["Diagnostics"]
+        buttons = ttk.Frame(tab)
+        buttons.pack(pady=5)
+        ttk.Button(buttons, text="Refresh", command=self.show_diagnostics).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Reset", command=self.reset_metrics).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Export JSON", command=lambda: self.export_metrics("json")).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Export Prometheus", command=lambda: self.export_metrics("prometheus")).pack(side=tk.LEFT, padx=5)
+        self.diag_summary_var = tk.StringVar(value="No requests yet.")
+        ttk.Label(tab, textvariable=self.diag_summary_var, justify=tk.LEFT).pack(anchor="w", padx=5)
+        self.diag_results = VirtualTable(tab, [
+            ("endpoint", "Endpoint", 200), ("requests", "Requests", 70), ("errors", "Errors", 60),
+            ("p50", "p50 ms", 70), ("p95", "p95 ms", 70), ("p99", "p99 ms", 70), ("kb", "KB", 80),
+            ("parse", "Parse ms", 70), ("hits", "Cache hits", 75), ("misses", "Misses", 65), ("wait", "Wait s", 65),
+        ])
+        self.diag_results.pack(expand=True, fill="both", padx=5, pady=5)
+        self.show_diagnostics()
+
+    def update_metrics(self):
+        # One-line summary in the status bar, and a live Diagnostics tab while it is shown
+        if self.api:
+            totals = self.api.diagnostics()["totals"]
+            lookups = totals["cache_hits"] + totals["cache_misses"]
+            hit_ratio = totals["cache_hits"] * 100 / lookups if lookups else 0.0
+            render_p95 = max((h.summary()["p95"] for h in self.tasks.render_times.values()), default=0.0)
+            self.metrics_label.config(text=(
+                f"API p95 {totals['latency_ms']['p95']:.0f} ms | cache {hit_ratio:.0f}% | "
+                f"limiter {totals['limiter_wait']:.1f} s | render p95 {render_p95:.0f} ms"
+            ))
+        if "Diagnostics" in self.built_tabs and self.current_tab() == "Diagnostics":
+            self.show_diagnostics()
+        self.root.after(METRICS_UPDATE_MS, self.update_metrics)
+
+    def show_diagnostics(self):
+        if not self.api:
+            self.diag_summary_var.set("No API key set.")
+            return
+        report = self.api.diagnostics()
+        rows = []
+        for name, ep in report["endpoints"].items():
+            rows.append({
+                "endpoint": name, "requests": ep["requests"], "errors": ep["errors"],
+                "p50": f"{ep['latency_ms']['p50']:.1f}", "p95": f"{ep['latency_ms']['p95']:.1f}",
+                "p99": f"{ep['latency_ms']['p99']:.1f}", "kb": f"{ep['bytes'] / 1024:.1f}",
+                "parse": f"{ep['parse_ms']['mean']:.2f}", "hits": ep["cache_hits"], "misses": ep["cache_misses"],
+                "wait": f"{ep['limiter_wait']:.2f}",
+            })
+        self.diag_results.set_items(rows)
+        cache, limiter, flights, transport = report["cache"], report["limiter"], report["single_flight"], report["transport"]
+        render = ", ".join(
+            f"{tab} {h.summary()['p95']:.0f} ms" for tab, h in sorted(self.tasks.render_times.items())
+        )
+        paused = f", paused for {limiter['paused_for']:.0f} s" if limiter["paused_for"] else ""
+        self.diag_summary_var.set("\n".join([
+            f"Cache: {cache['entries']} entries, {cache['bytes'] / 1024:.0f} KB, "
+            f"hit ratio {cache['hit_ratio']:.0%}, {cache['evictions']} evictions",
+            f"Limiter: {limiter['total_wait']:.1f} s waited over {limiter['waits']} requests{paused}",
+            f"Coalesced requests: {flights['collapsed']} of {flights['started'] + flights['collapsed']}",
+            f"Connections: {transport['connections']} opened for {transport['requests']} requests "
+            f"({transport['reuse_ratio']:.0%} reused), {transport['compressed']} compressed responses",
+            f"Render p95 per tab: {render or 'nothing rendered yet'}",
+        ]))
+
+    def reset_metrics(self):
+        if self.api:
+            self.api.metrics.reset()
+        self.tasks.render_times.clear()
+        self.show_diagnostics()
+
+    def export_metrics(self, fmt):
+        if not self.api:
+            messagebox.showerror("API Key Missing", "Please enter a valid API key in Settings.")
+            return
+        if fmt == "prometheus":
+            filetypes = [("Prometheus text", "*.prom"), ("All files", "*.*")]
+        else:
+            filetypes = [("JSON", "*.json"), ("All files", "*.*")]
+        path = filedialog.asksaveasfilename(defaultextension=filetypes[0][1][1:], filetypes=filetypes)
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.api.export_metrics(fmt))
+        self.set_status(f"Metrics exported to {path}.")
+
+    def build_settings_tab(self):
+        tab = self.tabs["Settings"]
+        ttk.Label(tab, text="Enter Your Fortnite API Key:").pack(anchor="w", padx=5, pady=5)
+        self.api_key_var = tk.StringVar(value=self.api_key)
+        api_entry = ttk.Entry(tab, textvariable=self.api_key_var, show="*")
+        api_entry.pack(fill="x", padx=5)
+
+        save_btn = ttk.Button(tab, text="Save API Key", command=self.save_api_key)
+        save_btn.pack(pady=5)
+
+    def save_api_key(self):
+        key = self.api_key_var.get().strip()
+        if not key:
+            messagebox.showerror("Input Error", "API Key cannot be empty.")
+            return
+        self.api_key = key
+        if self.api is None:
+            self.api = FortniteAPI(self.api_key, snapshot=self.snapshot)
+        else:
+            # Same session, warm connections and cache; only the Authorization header changes
+            self.api.set_api_key(key)
+            if self.async_api is not None:
+                self.loop_thread.loop.call_soon_threadsafe(self.async_api.set_api_key, key)
+        self.save_config()
+        messagebox.showinfo("Saved", "API Key saved successfully.")
+        self.set_status("API Key updated.")
+        self.scheduler.stop()
+        self.scheduler.start()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="fortnite-api.com desktop client")
+    snapshot = parser.add_mutually_exclusive_group()
+    snapshot.add_argument("--record", metavar="FILE", help="append every response to a snapshot archive (.ndjson.gz)")
+    snapshot.add_argument("--replay", metavar="FILE", help="serve responses from a snapshot archive instead of the network")
+    args = parser.parse_args(argv)
+    archive = None
+    if args.record or args.replay:
+        archive = SnapshotArchive(args.record or args.replay, "record" if args.record else "replay")
+    root = tk.Tk()
+    root.geometry("900x700")
+    FortniteApp(root, snapshot=archive)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
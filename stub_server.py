@@ -0,0 +1,277 @@
+# Local stand-in for fortnite-api.com. Serves synthetic, deterministic data for every
+# endpoint the client uses, with configurable latency, 429 injection and payload size, so
+# caching, concurrency and rate limiting can be exercised offline. Bodies over
+# GZIP_MIN_BYTES are gzipped for clients that accept it, as the real API does.
+#
+#   python stub_server.py --port 8765 --latency 0.05 --throttle-every 10 --items 20000
+#   python cli.py --base-url http://127.0.0.1:8765 --api-key test shop
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from fortnite_api import STAT_CATEGORIES
+
+RARITIES = ["common", "uncommon", "rare", "epic", "legendary"]
+TYPES = ["outfit", "backpack", "pickaxe", "glider", "emote", "wrap"]
+WORDS = [
+    "storm", "midas", "raven", "drift", "peely", "jonesy", "shadow", "neon", "frost", "crystal",
+    "galaxy", "llama", "tactical", "royale", "cuddle", "team", "leader", "dark", "bomber", "ghost",
+]
+GZIP_MIN_BYTES = 1024
+
+
+class StubData:
+    # Payloads generated once from a seed; the same settings always produce the same data
+    def __init__(self, items=1000, item_bytes=64, seed=0):
+        rng = random.Random(seed)
+        self.cosmetics = []
+        for i in range(items):
+            name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+            self.cosmetics.append({
+                "id": f"cid_{i:06d}",
+                "name": name,
+                "description": " ".join(rng.choice(WORDS) for _ in range(item_bytes // 6 + 1))[:item_bytes],
+                "type": {"value": rng.choice(TYPES)},
+                "rarity": {"value": rng.choice(RARITIES)},
+                "set": {"value": f"{rng.choice(WORDS).title()} Set"},
+            })
+        shop_size = max(1, items // 50)
+        self.shop = {
+            "featured": [dict(c, price=rng.choice([800, 1200, 1500, 2000])) for c in self.cosmetics[:shop_size]],
+            "daily": [dict(c, price=rng.choice([200, 500, 800])) for c in self.cosmetics[shop_size:2 * shop_size]],
+        }
+        self.new_items = self.cosmetics[-max(1, items // 20):]
+
+    def route(self, path, query):
+        # (status, payload) for a request path, or None when the path is unknown
+        name = (query.get("name") or [""])[0]
+        if path == "/v2/cosmetics/br/search/all":
+            needle = name.lower()
+            matches = [c for c in self.cosmetics if needle in c["name"].lower()]
+            return (200, matches) if matches else (404, None)
+        if path == "/v2/cosmetics/br":
+            return 200, self.cosmetics
+        if path == "/v2/cosmetics/br/new":
+            return 200, {"hash": f"{zlib.crc32(json.dumps(self.new_items).encode()):08x}", "items": {"br": self.new_items}}
+        if path == "/v2/shop/br":
+            return 200, self.shop
+        if path == "/v2/news/br":
+            return 200, {"br": {"motds": [{"id": f"motd{i}", "title": f"News {i}", "body": "Stub news item."} for i in range(5)]}}
+        if path == "/v2/stats/br/v2":
+            return self.stats(name)
+        if path == "/v2/seasons/current":
+            return 200, {"chapter": 5, "season": 1, "startDate": "2026-01-01", "endDate": "2026-03-01"}
+        if path == "/v1/map":
+            return 200, {"pois": [{"name": f"POI {i}", "coordinates": f"{i * 100},{i * 50}"} for i in range(30)]}
+        if path == "/v1/languages":
+            return 200, [{"code": code, "name": code.upper()} for code in ("en", "de", "es", "fr", "it", "ja")]
+        if path == "/v2/creative/islands":
+            return 200, [{"title": f"Island {i}", "creatorName": f"creator{i}", "code": f"{i:04d}-{i:04d}-{i:04d}"} for i in range(100)]
+        if path == "/v2/paks":
+            return 200, [{"name": f"pakchunk{i}", "path": f"FortniteGame/Content/Paks/pakchunk{i}-WindowsClient.pak"} for i in range(40)]
+        if path == "/v1/banners":
+            return 200, [{"id": f"banner_{i}", "name": f"Banner {i}", "category": "Standard"} for i in range(200)]
+        if path.startswith("/v2/creatorcode/"):
+            code = path.rsplit("/", 1)[1]
+            if code.startswith("unknown"):
+                return 404, None
+            return 200, {"account": {"name": code, "shareCode": code, "platform": "epic"}, "payments": len(code)}
+        return None
+
+    def stats(self, name):
+        if not name or name.startswith("unknown"):
+            return 404, None
+        rng = random.Random(name)
+        categories = {}
+        for category in STAT_CATEGORIES:
+            matches = rng.randint(10, 2000)
+            wins = rng.randint(0, matches // 5)
+            kills = rng.randint(matches, matches * 4)
+            deaths = max(1, matches - wins)
+            categories[category] = {
+                "matches": matches, "wins": wins, "kills": kills, "deaths": deaths,
+                "kd": round(kills / deaths, 3), "winRate": round(wins * 100 / matches, 3),
+                "score": kills * 50 + wins * 500, "minutesPlayed": matches * 18,
+            }
+        return 200, {"account": {"name": name}, "stats": {"all": categories}}
+
+
+class StubServer:
+    # Threaded HTTP server around StubData. Use start()/stop() to run it in the background
+    # of a test or benchmark, or serve_forever() from the command line.
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, throttle_every=0,
+                 throttle_rate=0.0, retry_after=1, items=1000, item_bytes=64, seed=0, api_key=None, compress=True):
+        self.data = StubData(items=items, item_bytes=item_bytes, seed=seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_every = throttle_every
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.api_key = api_key
+        self.compress = compress
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.bodies = {}
+        self.gzipped = {}
+        self.counts = {"requests": 0, "throttled": 0, "not_modified": 0, "unauthorized": 0, "gzipped": 0}
+        self.thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self.handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this, Nagle plus delayed
+            # ACKs add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def decide(self):
+        # Delay and whether to throttle this request, drawn under the lock so a given seed
+        # and request order always produce the same sequence
+        with self.lock:
+            self.counts["requests"] += 1
+            n = self.counts["requests"]
+            delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            throttle = bool(self.throttle_every and n % self.throttle_every == 0)
+            if self.throttle_rate and self.rng.random() < self.throttle_rate:
+                throttle = True
+            if throttle:
+                self.counts["throttled"] += 1
+        return delay, throttle
+
+    def body(self, path, query):
+        # Encoded once per distinct request so serving cost doesn't depend on payload building
+        key = (path, tuple(sorted((k, tuple(v)) for k, v in query.items())))
+        with self.lock:
+            cached = self.bodies.get(key)
+        if cached is not None:
+            return cached
+        routed = self.data.route(path, query)
+        if routed is None:
+            status, payload = 404, None
+        else:
+            status, payload = routed
+        if status == 200:
+            body = json.dumps({"status": 200, "data": payload}).encode("utf-8")
+        else:
+            body = json.dumps({"status": status, "error": "Not found"}).encode("utf-8")
+        cached = (status, body, f'"{zlib.crc32(body):08x}"')
+        with self.lock:
+            self.bodies[key] = cached
+        return cached
+
+    def handle(self, request):
+        delay, throttle = self.decide()
+        if delay > 0:
+            time.sleep(delay)
+        if self.api_key is not None and request.headers.get("Authorization") != self.api_key:
+            with self.lock:
+                self.counts["unauthorized"] += 1
+            self.respond(request, 401, json.dumps({"status": 401, "error": "Invalid API key"}).encode("utf-8"))
+            return
+        if throttle:
+            self.respond(request, 429, b'{"status":429,"error":"Too many requests"}',
+                         {"Retry-After": str(self.retry_after)})
+            return
+        url = urlparse(request.path)
+        status, body, etag = self.body(url.path, parse_qs(url.query))
+        if status == 200 and request.headers.get("If-None-Match") == etag:
+            with self.lock:
+                self.counts["not_modified"] += 1
+            self.respond(request, 304, b"", {"ETag": etag})
+            return
+        headers = {"ETag": etag} if status == 200 else {}
+        if self.compress and len(body) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = self.gzip_body(etag, body)
+            headers["Content-Encoding"] = "gzip"
+        self.respond(request, status, body, headers)
+
+    def gzip_body(self, etag, body):
+        with self.lock:
+            self.counts["gzipped"] += 1
+            cached = self.gzipped.get(etag)
+        if cached is None:
+            cached = gzip.compress(body, compresslevel=5)
+            with self.lock:
+                self.gzipped[etag] = cached
+        return cached
+
+    def respond(self, request, status, body, headers=None):
+        request.send_response(status)
+        if body:
+            request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        if body:
+            request.wfile.write(body)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def serve_forever(self):
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.httpd.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stub of the fortnite-api.com endpoints used by the client.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds, drawn from --seed")
+    parser.add_argument("--throttle-every", type=int, default=0, metavar="N", help="answer every Nth request with 429")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, metavar="P", help="answer with 429 with probability P")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--items", type=int, default=1000, help="cosmetics in the catalog; scales shop and search payloads")
+    parser.add_argument("--item-bytes", type=int, default=64, help="description length per cosmetic")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--api-key", help="reject requests without this Authorization header")
+    parser.add_argument("--no-gzip", action="store_true", help="never compress responses")
+    args = parser.parse_args(argv)
+    server = StubServer(
+        args.host, args.port, latency=args.latency, jitter=args.jitter, throttle_every=args.throttle_every,
+        throttle_rate=args.throttle_rate, retry_after=args.retry_after, items=args.items,
+        item_bytes=args.item_bytes, seed=args.seed, api_key=args.api_key, compress=not args.no_gzip,
+    )
+    print(f"Serving stub fortnite-api.com on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import json
+
+import bench
+
+
+def test_quick_headless_run(tmp_path):
+    # Smoke run of the documented bench flow against the stub server: every group must
+    # finish and report something, with the window-free table standing in for Tk
+    output = tmp_path / "report.json"
+    assert bench.main(["--headless", "--quick", "--repeat", "3", "-o", str(output)]) == 0
+    results = json.loads(output.read_text(encoding="utf-8"))["results"]
+    names = {result["name"] for result in results}
+    assert {"get_miss", "list_first_item", "save_cache", "render_cosmetics", "format_stats"} <= names
@@ -0,0 +1,250 @@
+import json
+import threading
+import time
+
+import pytest
+
+import fortnite_api
+from fortnite_api import (
+    FortniteAPI, JsonArrayStream, MAX_RETRIES, RateLimiter, SingleFlight, TokenBucket, parse_retry_after,
+)
+
+
+def test_token_bucket_queues_reservations_in_order():
+    bucket = TokenBucket(rate=2, burst=2)
+    t0 = bucket.updated
+    # The burst is free; after that each caller waits one token longer than the one before
+    assert [bucket.reserve(t0) for _ in range(4)] == [0, 0, 0.5, 1.0]
+    # A second's refill pays the debt back, so the next token is half a second away
+    assert bucket.reserve(t0 + 1) == pytest.approx(0.5)
+
+
+def test_token_bucket_refill_is_capped_at_burst():
+    bucket = TokenBucket(rate=10, burst=3)
+    t0 = bucket.updated
+    assert [bucket.reserve(t0 + 60) for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve(t0 + 60) == pytest.approx(0.1)
+
+
+def test_token_bucket_hold_until_delays_the_next_token():
+    bucket = TokenBucket(rate=2, burst=2)
+    t0 = bucket.updated
+    bucket.hold_until(t0 + 5)
+    assert bucket.reserve(t0 + 1) == pytest.approx(4.5)
+
+
+def test_limiter_applies_the_stricter_endpoint_bucket():
+    limiter = RateLimiter(rate=1000, burst=1000, endpoint_limits={"/v2/stats": (1, 1)})
+    assert limiter.reserve("/v2/stats/br/v2") <= 0
+    assert limiter.reserve("/v2/stats/br/v2") == pytest.approx(1.0, abs=0.05)
+    assert limiter.reserve("/v2/shop/br") <= 0
+    assert limiter.stats()["waits"] == 1
+
+
+def test_limiter_serves_concurrent_callers_one_slot_each():
+    limiter = RateLimiter(rate=10, burst=1, endpoint_limits={})
+    delays = []
+    lock = threading.Lock()
+
+    def reserve():
+        delay = limiter.reserve()
+        with lock:
+            delays.append(delay)
+
+    threads = [threading.Thread(target=reserve) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    delays.sort()
+    assert delays[0] <= 0
+    gaps = [b - a for a, b in zip(delays, delays[1:])]
+    assert all(gap == pytest.approx(0.1, abs=0.02) for gap in gaps)
+
+
+def test_limiter_pause_holds_every_bucket():
+    limiter = RateLimiter(rate=1000, burst=1000, endpoint_limits={"/v2/stats": (1, 3)})
+    limiter.reserve("/v2/stats/br/v2")
+    limiter.pause(5)
+    assert limiter.stats()["paused_for"] == pytest.approx(5, abs=0.1)
+    assert limiter.reserve() == pytest.approx(5, abs=0.1)
+    assert limiter.reserve("/v2/stats/br/v2") >= 5
+
+
+def test_acquire_waits_out_a_pause_that_arrives_while_queued():
+    limiter = RateLimiter(rate=20, burst=1, endpoint_limits={})
+    limiter.acquire()
+    timer = threading.Timer(0.01, limiter.pause, (0.3,))
+    start = time.monotonic()
+    timer.start()
+    limiter.acquire()
+    timer.join()
+    assert time.monotonic() - start >= 0.3
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+    assert parse_retry_after(date) == pytest.approx(60, abs=2)
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_429_pauses_the_limiter_for_retry_after():
+    class Limiter:
+        paused = None
+
+        def pause(self, seconds):
+            self.paused = seconds
+
+    api = object.__new__(FortniteAPI)
+    api.limiter = Limiter()
+    assert api.retry_delay(429, {"Retry-After": "7"}, 0) == 0.0
+    assert api.limiter.paused == 7.0
+    # Out of retries the 429 is returned to the caller and the limiter is left alone
+    api.limiter.paused = None
+    assert api.retry_delay(429, {"Retry-After": "7"}, MAX_RETRIES) is None
+    assert api.limiter.paused is None
+
+
+def run_collapsed(flight, key, func, callers):
+    # Starts `callers` threads on flight.do(key, func) while func is held, and releases it
+    # once all but the leader are waiting on it; returns each caller's result or exception
+    release = threading.Event()
+    outcomes = []
+    lock = threading.Lock()
+
+    def held():
+        release.wait(5)
+        return func()
+
+    def call():
+        try:
+            outcome = flight.do(key, held)
+        except Exception as e:
+            outcome = e
+        with lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats()["collapsed"] < callers - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_single_flight_collapses_concurrent_calls():
+    flight = SingleFlight()
+    runs = []
+    outcomes = run_collapsed(flight, "shop", lambda: runs.append(1) or {"status": 200}, 8)
+    assert runs == [1]
+    assert outcomes == [{"status": 200}] * 8
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert flight.stats() == {"in_flight": 0, "started": 1, "collapsed": 7}
+
+
+def test_single_flight_shares_the_leaders_exception():
+    flight = SingleFlight()
+
+    def fail():
+        raise ConnectionError("boom")
+
+    outcomes = run_collapsed(flight, "shop", fail, 5)
+    assert len(outcomes) == 5
+    assert all(isinstance(outcome, ConnectionError) and str(outcome) == "boom" for outcome in outcomes)
+    # The failed call is forgotten, so the next one runs afresh
+    assert flight.do("shop", lambda: "ok") == "ok"
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_single_flight_keys_and_later_calls_run_separately():
+    flight = SingleFlight()
+    runs = []
+    assert flight.do("a", lambda: runs.append("a") or 1) == 1
+    assert flight.do("a", lambda: runs.append("a") or 2) == 2
+    assert flight.do("b", lambda: runs.append("b") or 3) == 3
+    assert runs == ["a", "a", "b"]
+    assert flight.stats() == {"in_flight": 0, "started": 3, "collapsed": 0}
+
+
+def chunked(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+STREAM_BODY = {
+    "status": 200,
+    "data": [
+        {"name": 'say "hi" \\ bye', "n": 12.5e3, "tags": ["a", "b"]},
+        "café ☃ \U0001f600",
+        12345,
+        -0.25,
+        True,
+        None,
+        [],
+        {},
+    ],
+    "extra": {"text": "]},\"["},
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_array_stream_any_chunk_boundary(indent):
+    body = json.dumps(STREAM_BODY, indent=indent, ensure_ascii=False).encode("utf-8")
+    # Size 1 cuts every token, escape, number and multi-byte character somewhere
+    for size in (1, 2, 3, 7, 64, len(body)):
+        stream = JsonArrayStream(chunked(body, size))
+        assert list(stream) == STREAM_BODY["data"]
+        assert stream.extra == {"status": 200, "extra": STREAM_BODY["extra"]}
+        assert stream.bytes == len(body)
+
+
+def test_json_array_stream_numbers_are_not_cut_short():
+    stream = JsonArrayStream([b'{"data": [1', b"2", b"3.", b"5e", b"2, 7", b"]}"])
+    assert list(stream) == [123.5e2, 7]
+
+
+@pytest.mark.parametrize("body, items, extra", [
+    (b'{"status": 200, "data": []}', [], {"status": 200}),
+    (b'{"data":[]}', [], {}),
+    (b"{}", [], {}),
+    (b'{"status": 404, "error": "not found"}', [], {"status": 404, "error": "not found"}),
+    (b'{"data": {"id": 1}}', [], {"data": {"id": 1}}),
+])
+def test_json_array_stream_without_items(body, items, extra):
+    stream = JsonArrayStream(chunked(body, 1))
+    assert list(stream) == items
+    assert stream.extra == extra
+
+
+def test_json_array_stream_other_field():
+    stream = JsonArrayStream([b'{"data": [1], "items": [2, 3]}'], field="items")
+    assert list(stream) == [2, 3]
+    assert stream.extra == {"data": [1]}
+
+
+def test_json_array_stream_compacts_its_buffer(monkeypatch):
+    monkeypatch.setattr(fortnite_api, "STREAM_COMPACT_CHARS", 64)
+    items = [{"id": i, "name": f"item {i}"} for i in range(500)]
+    stream = JsonArrayStream(chunked(json.dumps({"data": items}).encode("utf-8"), 50))
+    assert list(stream) == items
+    assert len(stream.buf) < 200
+
+
+@pytest.mark.parametrize("body", [
+    b"",
+    b"[1, 2]",
+    b'{"data": [1, 2',
+    b'{"data": [{"name": "cut',
+    b'{"data": [1 2]}',
+    b'{"data": [1], "status" 200}',
+])
+def test_json_array_stream_malformed(body):
+    with pytest.raises(ValueError):
+        list(JsonArrayStream(chunked(body, 3)))
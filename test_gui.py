@@ -0,0 +1,79 @@
+import gui
+from fortnite_api import PlayerStats, StatsHistory, STAT_FIELDS
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ""
+
+    def config(self, text):
+        self.text = text
+
+
+class FakeText:
+    def __init__(self):
+        self.text = ""
+
+    def delete(self, start, end):
+        self.text = ""
+
+    def insert(self, index, text):
+        self.text += text
+
+
+class InlineTasks:
+    # Runs the work and its callback straight away, as TaskRunner would once the pool is done
+    def submit(self, tab, work, done, error=None, on_batch=None):
+        done(work())
+
+
+class FakeAPI:
+    def __init__(self):
+        self.wins = 0
+
+    def get_stats(self, username):
+        self.wins += 1
+        values = tuple(self.wins if key == "wins" else 10 for key, label in STAT_FIELDS[:-1]) + (None,)
+        return {"status": 200, "data": PlayerStats(username, {"overall": values})}
+
+
+def make_app(tmp_path):
+    # A FortniteApp with its stats-tab widgets swapped for fakes, so no display is needed
+    app = object.__new__(gui.FortniteApp)
+    app.api = FakeAPI()
+    app.tasks = InlineTasks()
+    app.completions = {}
+    app.status_label = FakeLabel()
+    app.stats_results = FakeText()
+    app.stats_user_var = FakeVar("ninja")
+    app.stats_history = StatsHistory(str(tmp_path / "stats.bin"))
+    app.history = gui.HistoryJournal(str(tmp_path / "history.ndjson"), legacy_path=None)
+    return app
+
+
+def test_stats_lookup_shows_stats_and_progress(tmp_path):
+    app = make_app(tmp_path)
+    app.do_stats_lookup()
+    assert "=== Overall Stats ===" in app.stats_results.text
+    assert app.status_label.text == "Stats fetched."
+    assert app.history.suggest("stats") == ["ninja"]
+
+    app.do_stats_lookup()
+    assert "=== Overall Progress ===" in app.stats_results.text
+    assert "+1 wins" in app.stats_results.text
+
+
+def test_typed_stats_lookup_is_not_recorded(tmp_path):
+    app = make_app(tmp_path)
+    app.do_stats_lookup(typed=True)
+    assert "=== Overall Stats ===" in app.stats_results.text
+    assert app.history.suggest("stats") == []
+    assert app.stats_history.players() == []